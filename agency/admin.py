@@ -2,12 +2,15 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.contenttypes.models import ContentType
 
-from agency.models import Newspaper, Topic, Redactor
+from agency.models import DeletionJob, Newspaper, Topic, Redactor
+from agency.pagination import EstimatedCountPaginator
 
 
 @admin.register(Redactor)
 class RedactorAdmin(UserAdmin):
     list_display = UserAdmin.list_display + ("years_of_experience",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     fieldsets = UserAdmin.fieldsets + (
         (("Additional info", {"fields": ("years_of_experience",)}),)
     )
@@ -29,10 +32,49 @@ class RedactorAdmin(UserAdmin):
 
 @admin.register(Newspaper)
 class NewspaperAdmin(admin.ModelAdmin):
-    list_display = ("title", "topic")
-    search_fields = ("title", "topic")
-    list_filter = ("topic", "publishers")
+    list_display = ("title", "topic", "published_date")
+    list_select_related = ("topic",)
+    # A publishers filter would list every redactor on each page.
+    list_filter = ("topic",)
+    search_fields = ("title", "topic__name")
+    autocomplete_fields = ("topic", "publishers")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # The change form loads the content when it needs it.
+        return super().get_queryset(request).defer("content")
+
+
+@admin.register(DeletionJob)
+class DeletionJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "object_repr",
+        "target",
+        "status",
+        "deleted",
+        "total",
+        "progress",
+        "updated_at",
+    )
+    list_filter = ("status", "target")
+    readonly_fields = [field.name for field in DeletionJob._meta.fields]
+
+    def has_add_permission(self, request) -> bool:
+        return False
+
+    @admin.display(description="Progress")
+    def progress(self, job: DeletionJob) -> str:
+        return f"{job.progress}%"
+
+
+@admin.register(Topic)
+class TopicAdmin(admin.ModelAdmin):
+    list_display = ("name", "newspaper_count")
+    ordering = ("name",)
+    search_fields = ("name",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
-admin.site.register(Topic)
 admin.site.register(ContentType)
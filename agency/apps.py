@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class AgencyConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "agency"
+
+    def ready(self) -> None:
+        from agency import signals  # noqa: F401
+        from agency.search import reset_search_backends
+
+        post_migrate.connect(reset_search_backends, sender=self)
@@ -0,0 +1,121 @@
+import random
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from agency.counters import reconcile_counters
+from agency.models import Newspaper, Redactor, Topic
+from agency.search import get_search_backend, reset_search_backends
+
+Publication = Newspaper.publishers.through
+
+WORDS = (
+    "agency election market council weather report interview budget "
+    "science health culture transport energy housing school court police "
+    "festival museum river harbour stadium league season record climate "
+    "minister parliament strike contract startup research hospital"
+).split()
+
+
+@contextmanager
+def temporary_database(using: str = DEFAULT_DB_ALIAS):
+    """
+    Run the block against a freshly migrated throwaway copy of ``using``
+    (named like the test database), so benchmarks never touch real data.
+    """
+    connection = connections[using]
+    old_name = connection.creation.create_test_db(
+        verbosity=0, autoclobber=True, serialize=False
+    )
+    reset_search_backends()
+
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        reset_search_backends()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def seed_dataset(
+    newspapers: int = 1000,
+    topics: int = 20,
+    redactors: int = 100,
+    content_words: int = 300,
+    batch_size: int = 1000,
+    seed: int = 0,
+) -> dict:
+    """
+    Bulk-insert a reproducible dataset: the same arguments always produce
+    the same rows, so runs are comparable across commits.
+    """
+    rng = random.Random(seed)
+    password = make_password(None)
+    today = date.today()
+
+    with transaction.atomic():
+        new_topics = [
+            Topic(name=f"{rng.choice(WORDS).title()} {number}")
+            for number in range(topics)
+        ]
+        Topic.assign_slugs(new_topics)
+        topic_ids = [
+            topic.id for topic in Topic.objects.bulk_create(new_topics)
+        ]
+        redactor_ids = [
+            redactor.id
+            for redactor in Redactor.objects.bulk_create(
+                Redactor(
+                    username=f"redactor{number}",
+                    first_name=rng.choice(WORDS).title(),
+                    last_name=rng.choice(WORDS).title(),
+                    years_of_experience=rng.randint(0, 40),
+                    password=password,
+                )
+                for number in range(redactors)
+            )
+        ]
+
+        for start in range(0, newspapers, batch_size):
+            batch = [
+                Newspaper(
+                    title=_text(rng, 6).capitalize(),
+                    content=_text(rng, content_words),
+                    topic_id=rng.choice(topic_ids),
+                )
+                for _ in range(min(batch_size, newspapers - start))
+            ]
+            Newspaper.assign_excerpts(batch)
+            batch = Newspaper.objects.bulk_create(batch)
+
+            # published_date is auto_now_add, so spread it out afterwards.
+            for newspaper in batch:
+                newspaper.published_date = today - timedelta(
+                    days=rng.randint(0, 3650)
+                )
+
+            Newspaper.objects.bulk_update(batch, ["published_date"])
+            Publication.objects.bulk_create(
+                (
+                    Publication(newspaper_id=newspaper.id, redactor_id=pk)
+                    for newspaper in batch
+                    for pk in rng.sample(redactor_ids, rng.randint(1, 3))
+                ),
+                ignore_conflicts=True,
+            )
+
+        get_search_backend().rebuild(batch_size=batch_size)
+        reconcile_counters(batch_size=batch_size)
+
+    return {
+        "topics": topics,
+        "redactors": redactors,
+        "newspapers": newspapers,
+        "content_words": content_words,
+        "seed": seed,
+    }
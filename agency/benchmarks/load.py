@@ -0,0 +1,111 @@
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections
+from django.test import Client
+
+from agency.benchmarks.stats import summarize
+
+
+class ClientFetcher:
+    """
+    Fetches through Django's test client in-process. Every worker thread
+    gets its own client and database connection; ``cookies`` (such as a
+    session) are copied into each.
+    """
+
+    def __init__(self, cookies=None) -> None:
+        self.cookies = cookies
+        self._local = threading.local()
+
+    def __call__(self, url: str) -> int:
+        if not hasattr(self._local, "client"):
+            self._local.client = Client(HTTP_HOST="127.0.0.1")
+
+            if self.cookies is not None:
+                self._local.client.cookies.update(self.cookies)
+
+        response = self._local.client.get(url)
+
+        # Streamed bodies are only produced while being read.
+        if response.streaming:
+            for _ in response.streaming_content:
+                pass
+
+        return response.status_code
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class UrlFetcher:
+    """Fetches from a running server, such as a local gunicorn."""
+
+    def __init__(self, base_url: str, timeout: float = 30) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.opener = urllib.request.build_opener(_NoRedirect)
+
+    def __call__(self, url: str) -> int:
+        try:
+            with self.opener.open(
+                self.base_url + url, timeout=self.timeout
+            ) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as error:
+            return error.code
+
+
+def drive(fetch, url: str, requests: int, concurrency: int) -> dict:
+    """
+    Issue ``requests`` GETs of ``url`` from ``concurrency`` threads and
+    report throughput, status codes and latency percentiles.
+    """
+    latencies = []
+    statuses = Counter()
+    lock = threading.Lock()
+
+    def worker(count: int) -> None:
+        local_latencies = []
+        local_statuses = Counter()
+
+        try:
+            for _ in range(count):
+                started = time.perf_counter()
+                local_statuses[fetch(url)] += 1
+                local_latencies.append(
+                    (time.perf_counter() - started) * 1000
+                )
+        finally:
+            connections.close_all()
+
+        with lock:
+            latencies.extend(local_latencies)
+            statuses.update(local_statuses)
+
+    shares = [
+        requests // concurrency + (index < requests % concurrency)
+        for index in range(concurrency)
+    ]
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, shares))
+
+    elapsed = time.perf_counter() - started
+
+    return {
+        "url": url,
+        "requests": requests,
+        "concurrency": concurrency,
+        "status": {str(code): count for code, count in statuses.items()},
+        "throughput_rps": requests / elapsed if elapsed else 0.0,
+        "latency_ms": summarize(latencies),
+    }
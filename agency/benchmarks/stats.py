@@ -0,0 +1,25 @@
+import math
+from typing import Sequence
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``values``, which must be sorted."""
+    if not values:
+        return 0.0
+
+    rank = max(math.ceil(fraction * len(values)), 1)
+
+    return values[rank - 1]
+
+
+def summarize(samples: Sequence[float]) -> dict:
+    values = sorted(samples)
+
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values) if values else 0.0,
+        "p50": percentile(values, 0.50),
+        "p95": percentile(values, 0.95),
+        "p99": percentile(values, 0.99),
+        "max": values[-1] if values else 0.0,
+    }
@@ -0,0 +1,19 @@
+from django.utils.functional import SimpleLazyObject
+
+from agency.membership import get_membership
+
+
+def membership(request) -> dict:
+    user_membership = SimpleLazyObject(
+        lambda: get_membership(request.user)
+    )
+
+    return {
+        "membership": user_membership,
+        "user_in_mod_group": SimpleLazyObject(
+            lambda: user_membership.is_mod
+        ),
+        "user_in_admin_group": SimpleLazyObject(
+            lambda: user_membership.is_admin
+        ),
+    }
@@ -0,0 +1,81 @@
+from django.db.models import (
+    Count,
+    F,
+    OuterRef,
+    PositiveIntegerField,
+    Q,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from agency import page_cache
+from agency.models import Newspaper, Redactor, Topic
+
+Publication = Newspaper.publishers.through
+
+
+def _count_of(queryset, column: str) -> Coalesce:
+    counts = (
+        queryset.filter(**{column: OuterRef("pk")})
+        .order_by()
+        .values(column)
+        .annotate(total=Count("*"))
+        .values("total")
+    )
+
+    return Coalesce(
+        Subquery(counts), 0, output_field=PositiveIntegerField()
+    )
+
+
+def _reconcile(
+    model, field: str, actual: Coalesce, batch_size: int
+) -> list:
+    # Only drifted rows are rewritten, so their versions move and every
+    # other cached page stays valid.
+    ids = list(
+        model.objects.annotate(actual=actual)
+        .filter(~Q(**{field: F("actual")}))
+        .values_list("pk", flat=True)
+    )
+
+    now = timezone.now()
+
+    for start in range(0, len(ids), batch_size):
+        model.objects.filter(pk__in=ids[start:start + batch_size]).update(
+            **{field: actual}, version=F("version") + 1, updated_at=now
+        )
+
+    return ids
+
+
+def reconcile_counters(batch_size: int = 1000) -> dict:
+    """
+    Recompute ``Topic.newspaper_count`` and ``Redactor.publication_count``
+    with one grouped subquery each and fix the rows that drifted, such as
+    after bulk writes that skip signals. Returns fixed rows per model.
+    """
+    topic_ids = _reconcile(
+        Topic,
+        "newspaper_count",
+        _count_of(Newspaper.objects.all(), "topic_id"),
+        batch_size,
+    )
+    redactor_ids = _reconcile(
+        Redactor,
+        "publication_count",
+        _count_of(Publication.objects.all(), "redactor_id"),
+        batch_size,
+    )
+
+    if topic_ids:
+        page_cache.bump(page_cache.TOPIC_COUNTS)
+
+    if redactor_ids:
+        page_cache.bump(
+            page_cache.REDACTOR_LIST,
+            *map(page_cache.redactor_key, redactor_ids),
+        )
+
+    return {"topic": len(topic_ids), "redactor": len(redactor_ids)}
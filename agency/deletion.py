@@ -0,0 +1,125 @@
+import time
+
+from django.db import transaction
+
+from agency.models import DeletionJob, Newspaper, Redactor, Topic
+
+Publication = Newspaper.publishers.through
+
+TARGETS = {DeletionJob.TOPIC: Topic, DeletionJob.REDACTOR: Redactor}
+
+
+def _dependents(target: str, object_id: int):
+    if target == DeletionJob.TOPIC:
+        return Newspaper.objects.filter(topic_id=object_id)
+
+    return Publication.objects.filter(redactor_id=object_id)
+
+
+def schedule_deletion(obj) -> DeletionJob:
+    """
+    Hide the topic or redactor ``obj`` from every page right away and
+    queue a job that removes it and its dependents. A hidden redactor is
+    deactivated too, so they can no longer sign in.
+    """
+    target = (
+        DeletionJob.TOPIC if isinstance(obj, Topic) else DeletionJob.REDACTOR
+    )
+    fields = ["pending_deletion"]
+    obj.pending_deletion = True
+
+    if target == DeletionJob.REDACTOR:
+        obj.is_active = False
+        fields.append("is_active")
+
+    with transaction.atomic():
+        obj.save(update_fields=fields)
+        job, created = DeletionJob.objects.get_or_create(
+            target=target,
+            object_id=obj.pk,
+            defaults={
+                "object_repr": str(obj)[:255],
+                "total": _dependents(target, obj.pk).count(),
+            },
+        )
+
+    return job
+
+
+def run_batch(job: DeletionJob, batch_size: int) -> bool:
+    """
+    Remove up to ``batch_size`` dependents of the job's object in one short
+    transaction, or the object itself once none are left. Deletions go
+    through the ORM, so signals keep counters, page caches and the search
+    index right. Returns whether the job is done.
+    """
+    with transaction.atomic():
+        # Serializes runners working on the same job.
+        job = DeletionJob.objects.select_for_update().get(pk=job.pk)
+
+        if job.status == DeletionJob.DONE:
+            return True
+
+        dependents = _dependents(job.target, job.object_id)
+
+        if job.target == DeletionJob.TOPIC:
+            ids = list(
+                dependents.order_by("id").values_list("id", flat=True)[
+                    :batch_size
+                ]
+            )
+
+            if ids:
+                Newspaper.objects.filter(id__in=ids).delete()
+        else:
+            ids = list(
+                dependents.order_by("newspaper_id").values_list(
+                    "newspaper_id", flat=True
+                )[:batch_size]
+            )
+
+            if ids:
+                Redactor.objects.get(pk=job.object_id).newspapers.remove(
+                    *ids
+                )
+
+        if ids:
+            job.deleted += len(ids)
+            job.status = DeletionJob.RUNNING
+        else:
+            TARGETS[job.target].objects.filter(pk=job.object_id).delete()
+            job.status = DeletionJob.DONE
+
+        job.error = ""
+        job.save()
+
+    return job.status == DeletionJob.DONE
+
+
+def run_job(
+    job: DeletionJob, batch_size: int, pause: float = 0, progress=None
+) -> None:
+    """
+    Run ``job`` to completion, calling ``progress(job)`` after every batch.
+    Any error marks the job failed and is raised; since every batch is
+    committed on its own, running the job again resumes where it stopped.
+    """
+    try:
+        while not run_batch(job, batch_size):
+            job.refresh_from_db()
+
+            if progress is not None:
+                progress(job)
+
+            if pause:
+                time.sleep(pause)
+    except Exception as error:
+        DeletionJob.objects.filter(pk=job.pk).update(
+            status=DeletionJob.FAILED, error=repr(error)
+        )
+        raise
+
+    job.refresh_from_db()
+
+    if progress is not None:
+        progress(job)
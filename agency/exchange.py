@@ -0,0 +1,413 @@
+import csv
+import json
+from collections import defaultdict
+from itertools import islice
+from typing import IO, AsyncIterator, Iterable, Iterator
+
+from asgiref.sync import sync_to_async
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import F, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from agency import page_cache
+from agency.counters import reconcile_counters
+from agency.models import Newspaper, Redactor, Topic
+from agency.search import get_search_backend
+
+Publication = Newspaper.publishers.through
+
+MODELS = ("topic", "redactor", "newspaper")
+FORMATS = ("jsonl", "csv")
+PUBLISHERS_SEPARATOR = "|"
+
+REDACTOR_FIELDS = (
+    "username",
+    "first_name",
+    "last_name",
+    "email",
+    "years_of_experience",
+)
+NEWSPAPER_FIELDS = (
+    "id",
+    "title",
+    "content",
+    "published_date",
+    "topic",
+    "publishers",
+)
+CSV_FIELDS = {
+    "topic": ("name",),
+    "redactor": REDACTOR_FIELDS,
+    "newspaper": NEWSPAPER_FIELDS,
+}
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    chunk = []
+
+    for item in iterable:
+        chunk.append(item)
+
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def topic_records(queryset: QuerySet, chunk_size: int = 2000) -> Iterator:
+    for name in queryset.values_list("name", flat=True).iterator(
+        chunk_size=chunk_size
+    ):
+        yield {"model": "topic", "name": name}
+
+
+def redactor_records(queryset: QuerySet, chunk_size: int = 2000) -> Iterator:
+    for row in queryset.values(*REDACTOR_FIELDS).iterator(
+        chunk_size=chunk_size
+    ):
+        yield {"model": "redactor", **row}
+
+
+def newspaper_records(
+    queryset: QuerySet, chunk_size: int = 2000
+) -> Iterator[dict]:
+    """
+    Newspapers with their topic name joined in and publisher usernames
+    fetched with one query per chunk, so memory is bounded by
+    ``chunk_size`` whatever the size of the queryset.
+    """
+    rows = queryset.values(
+        "id", "title", "content", "published_date", "topic__name"
+    ).iterator(chunk_size=chunk_size)
+    # values() leaves the content compressed.
+    content = Newspaper._meta.get_field("content")
+
+    for chunk in _chunks(rows, chunk_size):
+        publishers = defaultdict(list)
+        publications = Publication.objects.filter(
+            newspaper_id__in=[row["id"] for row in chunk]
+        ).values_list("newspaper_id", "redactor__username")
+
+        for newspaper_id, username in publications:
+            publishers[newspaper_id].append(username)
+
+        for row in chunk:
+            yield {
+                "model": "newspaper",
+                "id": row["id"],
+                "title": row["title"],
+                "content": content.to_python(row["content"]),
+                "published_date": row["published_date"].isoformat(),
+                "topic": row["topic__name"],
+                "publishers": publishers[row["id"]],
+            }
+
+
+class _Echo:
+    def write(self, value: str) -> str:
+        return value
+
+
+def jsonl_lines(records: Iterable[dict]) -> Iterator[str]:
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+async def async_lines(
+    lines: Iterable[str], batch_size: int = 500
+) -> AsyncIterator[str]:
+    """
+    ``lines`` as an async iterator for streaming under ASGI, which reads a
+    synchronous streaming body into memory whole. Batches of lines are
+    produced in the request's thread, where their queries run.
+    """
+    iterator = iter(lines)
+    next_batch = sync_to_async(lambda: list(islice(iterator, batch_size)))
+
+    while batch := await next_batch():
+        yield "".join(batch)
+
+
+def csv_lines(records: Iterable[dict], model: str) -> Iterator[str]:
+    # csv writers return the formatted row when the stream echoes it back.
+    writer = csv.DictWriter(
+        _Echo(), fieldnames=CSV_FIELDS[model], extrasaction="ignore"
+    )
+    yield writer.writeheader()
+
+    for record in records:
+        if "publishers" in record:
+            record = {
+                **record,
+                "publishers": PUBLISHERS_SEPARATOR.join(record["publishers"]),
+            }
+
+        yield writer.writerow(record)
+
+
+def write_jsonl(records: Iterable[dict], stream: IO) -> int:
+    written = 0
+
+    for line in jsonl_lines(records):
+        stream.write(line)
+        written += 1
+
+    return written
+
+
+def write_csv(records: Iterable[dict], stream: IO, model: str) -> int:
+    lines = csv_lines(records, model)
+    stream.write(next(lines))
+    written = 0
+
+    for line in lines:
+        stream.write(line)
+        written += 1
+
+    return written
+
+
+def read_jsonl(stream: IO) -> Iterator[dict]:
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def read_csv(stream: IO, model: str) -> Iterator[dict]:
+    for row in csv.DictReader(stream):
+        record = {key: value for key, value in row.items() if value != ""}
+
+        if "publishers" in record:
+            record["publishers"] = record["publishers"].split(
+                PUBLISHERS_SEPARATOR
+            )
+
+        yield {"model": model, **record}
+
+
+class DataImportError(Exception):
+    pass
+
+
+class Importer:
+    """
+    Upserts streamed records in batches. Topics are matched by name,
+    redactors by username and newspapers by ``id`` when one is given;
+    every other reference is resolved through in-memory maps, so a batch
+    costs a fixed number of queries however many rows it holds.
+
+    Bulk writes skip model signals, so the search index, page cache and
+    article counters are updated here explicitly.
+    """
+
+    def __init__(self, batch_size: int = 1000) -> None:
+        self.batch_size = batch_size
+        self.topic_ids = dict(
+            Topic.objects.order_by("-id").values_list("name", "id")
+        )
+        self.redactor_ids = dict(
+            Redactor.objects.values_list("username", "id")
+        )
+        self.pending = {model: [] for model in MODELS}
+        self.counts = {model: 0 for model in MODELS}
+
+    def feed(self, records: Iterable[dict]) -> dict:
+        for record in records:
+            model = record.get("model")
+
+            if model not in self.pending:
+                raise DataImportError(
+                    f"Unknown model in record: {record!r}"
+                )
+
+            self.pending[model].append(record)
+
+            if len(self.pending[model]) >= self.batch_size:
+                self.flush(model)
+
+        for model in MODELS:
+            self.flush(model)
+
+        self._reset_sequences()
+
+        # Bulk writes skip the signals that keep article counters current.
+        if self.counts["newspaper"]:
+            reconcile_counters()
+
+        return self.counts
+
+    def _reset_sequences(self) -> None:
+        # Newspapers imported with explicit ids leave sequences behind.
+        statements = connection.ops.sequence_reset_sql(
+            no_style(), [Newspaper]
+        )
+
+        if statements:
+            with connection.cursor() as cursor:
+                for statement in statements:
+                    cursor.execute(statement)
+
+    def flush(self, model: str) -> None:
+        records, self.pending[model] = self.pending[model], []
+
+        if not records:
+            return
+
+        # Newspapers reference topics and redactors that may still be
+        # buffered from the same stream.
+        if model == "newspaper":
+            self.flush("topic")
+            self.flush("redactor")
+
+        with transaction.atomic():
+            getattr(self, f"_import_{model}s")(records)
+
+        self.counts[model] += len(records)
+
+    def _import_topics(self, records: list) -> None:
+        new_names = {
+            record["name"]
+            for record in records
+            if record["name"] not in self.topic_ids
+        }
+        topics = [Topic(name=name) for name in new_names]
+        Topic.assign_slugs(topics)
+        created = Topic.objects.bulk_create(topics)
+
+        for topic in created:
+            self.topic_ids[topic.name] = topic.id
+
+        page_cache.bump(page_cache.TOPICS)
+
+    def _import_redactors(self, records: list) -> None:
+        by_username = {record["username"]: record for record in records}
+        existing, new = [], []
+
+        for username, record in by_username.items():
+            redactor = Redactor(
+                username=username,
+                first_name=record.get("first_name", ""),
+                last_name=record.get("last_name", ""),
+                email=record.get("email", ""),
+                years_of_experience=record.get("years_of_experience"),
+            )
+
+            if redactor.username in self.redactor_ids:
+                redactor.id = self.redactor_ids[redactor.username]
+                redactor.version = F("version") + 1
+                redactor.updated_at = timezone.now()
+                existing.append(redactor)
+            else:
+                redactor.password = make_password(None)
+                new.append(redactor)
+
+        Redactor.objects.bulk_update(
+            existing,
+            [*REDACTOR_FIELDS[1:], "version", "updated_at"],
+        )
+
+        for redactor in Redactor.objects.bulk_create(new):
+            self.redactor_ids[redactor.username] = redactor.id
+
+        page_cache.bump(
+            page_cache.REDACTOR_LIST,
+            *(page_cache.redactor_key(redactor.id) for redactor in existing),
+        )
+
+    def _import_newspapers(self, records: list) -> None:
+        newspapers = []
+
+        for record in records:
+            try:
+                topic_id = self.topic_ids[record["topic"]]
+            except KeyError as error:
+                raise DataImportError(
+                    f"Unknown topic in record: {record!r}"
+                ) from error
+
+            newspapers.append(
+                Newspaper(
+                    id=int(record["id"]) if record.get("id") else None,
+                    title=record["title"],
+                    content=record.get("content", ""),
+                    topic_id=topic_id,
+                )
+            )
+
+        existing_ids = set(
+            Newspaper.objects.filter(
+                id__in=[n.id for n in newspapers if n.id]
+            ).values_list("id", flat=True)
+        )
+        existing = [n for n in newspapers if n.id in existing_ids]
+        Newspaper.assign_excerpts(newspapers)
+        Newspaper.objects.bulk_create(
+            n for n in newspapers if n.id not in existing_ids
+        )
+
+        now = timezone.now()
+        dated = []
+
+        for newspaper, record in zip(newspapers, records, strict=True):
+            published_date = parse_date(record.get("published_date") or "")
+
+            if published_date:
+                newspaper.published_date = published_date
+                dated.append(newspaper)
+
+            if newspaper.id in existing_ids:
+                newspaper.version = F("version") + 1
+                newspaper.updated_at = now
+
+        Newspaper.objects.bulk_update(
+            existing,
+            ["title", "content", "excerpt", "topic", "version", "updated_at"],
+        )
+        Newspaper.objects.bulk_update(dated, ["published_date"])
+
+        self._import_publications(newspapers, records, existing_ids)
+        get_search_backend().index(newspapers)
+        page_cache.bump(
+            page_cache.NEWSPAPER_LIST,
+            *(page_cache.newspaper_key(n.id) for n in existing),
+        )
+
+    def _import_publications(
+        self, newspapers: list, records: list, existing_ids: set
+    ) -> None:
+        replaced = Publication.objects.filter(newspaper_id__in=existing_ids)
+        # Publishers that lose a newspaper need fresh pages and ETags too.
+        redactor_ids = set(replaced.values_list("redactor_id", flat=True))
+        replaced.delete()
+        publications = []
+
+        for newspaper, record in zip(newspapers, records, strict=True):
+            for username in record.get("publishers", []):
+                try:
+                    redactor_id = self.redactor_ids[username]
+                except KeyError as error:
+                    raise DataImportError(
+                        f"Unknown publisher in record: {record!r}"
+                    ) from error
+
+                publications.append(
+                    Publication(
+                        newspaper_id=newspaper.id, redactor_id=redactor_id
+                    )
+                )
+
+        Publication.objects.bulk_create(
+            publications, ignore_conflicts=True
+        )
+        redactor_ids.update(p.redactor_id for p in publications)
+        Redactor.touch(redactor_ids)
+        page_cache.bump(
+            page_cache.REDACTOR_LIST,
+            *map(page_cache.redactor_key, redactor_ids),
+        )
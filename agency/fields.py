@@ -0,0 +1,101 @@
+import zlib
+
+from django import forms
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+
+
+class CompressedTextDescriptor(DeferredAttribute):
+    """
+    Keeps a value loaded from the database compressed until the attribute
+    is first read and decompresses it only then, once.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+
+        value = super().__get__(instance, cls)
+
+        if isinstance(value, (bytes, memoryview)):
+            value = self.field.decompress(value)
+            instance.__dict__[self.field.attname] = value
+
+        return value
+
+    def __set__(self, instance, value) -> None:
+        instance.__dict__[self.field.attname] = value
+
+
+class CompressedTextField(models.BinaryField):
+    """
+    Text stored zlib-compressed in a binary column. Instances hold the
+    compressed value until it is read, and save it back as it is if it
+    never was. Database lookups such as ``icontains`` only see the
+    compressed bytes; search through ``agency.search`` instead.
+    """
+
+    descriptor_class = CompressedTextDescriptor
+    empty_values = [None, "", b""]
+
+    def __init__(self, *args, level: int = 6, **kwargs) -> None:
+        self.level = level
+        kwargs.setdefault("editable", True)
+        super().__init__(*args, **kwargs)
+
+    def _check_str_default_value(self) -> list:
+        # Unlike for BinaryField, text is the right type of default.
+        return []
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+
+        if self.editable:
+            del kwargs["editable"]
+        else:
+            kwargs["editable"] = False
+
+        if self.level != 6:
+            kwargs["level"] = self.level
+
+        return name, path, args, kwargs
+
+    def compress(self, value: str) -> bytes:
+        return zlib.compress(value.encode(), self.level)
+
+    @staticmethod
+    def decompress(value) -> str:
+        return zlib.decompress(value).decode()
+
+    def get_default(self):
+        default = super().get_default()
+
+        return "" if default == b"" else default
+
+    def pre_save(self, model_instance, add):
+        # Read from __dict__, so content that was never read is not
+        # decompressed just to be compressed again.
+        if self.attname in model_instance.__dict__:
+            return model_instance.__dict__[self.attname]
+
+        return super().pre_save(model_instance, add)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if isinstance(value, str):
+            value = self.compress(value)
+
+        return super().get_db_prep_value(value, connection, prepared)
+
+    def to_python(self, value):
+        # Also for rows fetched with values(), which skip the descriptor.
+        if isinstance(value, (bytes, memoryview)):
+            return self.decompress(value)
+
+        return value
+
+    def formfield(self, **kwargs):
+        # Multi-line text like a TextField, not BinaryField's one-line input.
+        return super().formfield(**{"widget": forms.Textarea, **kwargs})
+
+    def value_to_string(self, obj) -> str:
+        return self.value_from_object(obj)
@@ -2,12 +2,91 @@ from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm, UserChangeForm
 
+from django.urls import reverse
+
 from agency.models import Newspaper, Topic
+from agency.topics import get_topic_table
+
+
+class TopicChoices:
+    """
+    Lazy topic choices read from the in-memory topic table, so rendering
+    a topic select costs no queries.
+    """
+
+    def __init__(self, empty_label: str = None) -> None:
+        self.empty_label = empty_label
+
+    def __iter__(self):
+        if self.empty_label is not None:
+            yield "", self.empty_label
+
+        yield from get_topic_table().choices()
+
+    def __len__(self) -> int:
+        return len(get_topic_table().entries) + (
+            self.empty_label is not None
+        )
+
+
+class TopicChoiceField(forms.ModelChoiceField):
+    # Only the submitted topic is fetched, when the form is validated.
+    def __init__(self, **kwargs) -> None:
+        super().__init__(
+            queryset=Topic.objects.filter(pending_deletion=False), **kwargs
+        )
+
+    def _get_choices(self) -> TopicChoices:
+        return TopicChoices(self.empty_label)
+
+    choices = property(_get_choices, forms.ChoiceField._set_choices)
+
+
+class PublisherAutocompleteWidget(forms.SelectMultiple):
+    """
+    Renders only the selected publishers; others are added in the browser
+    from the ``redactor-autocomplete`` endpoint.
+    """
+
+    class Media:
+        js = ("js/autocomplete.js",)
+
+    def __init__(self, attrs: dict = None) -> None:
+        super().__init__(attrs={"data-autocomplete": "", **(attrs or {})})
+
+    def get_context(self, name, value, attrs) -> dict:
+        context = super().get_context(name, value, attrs)
+        context["widget"]["attrs"]["data-autocomplete-url"] = reverse(
+            "agency:redactor-autocomplete"
+        )
+
+        return context
+
+    def optgroups(self, name, value, attrs=None) -> list:
+        ids = [pk for pk in value if str(pk).isdigit()]
+        selected = get_user_model().objects.filter(pk__in=ids).values_list(
+            "pk", "username"
+        )
+
+        return [
+            (
+                None,
+                [
+                    self.create_option(
+                        name, pk, username, True, index, attrs=attrs
+                    )
+                    for index, (pk, username) in enumerate(selected)
+                ],
+                0,
+            )
+        ]
 
 
 class NewspaperCreationForm(forms.ModelForm):
+    topic = TopicChoiceField()
     publishers = forms.ModelMultipleChoiceField(
-        queryset=get_user_model().objects.all(),
+        queryset=get_user_model().objects.filter(pending_deletion=False),
+        widget=PublisherAutocompleteWidget,
     )
 
     class Meta:
@@ -16,12 +95,20 @@ class NewspaperCreationForm(forms.ModelForm):
 
 
 class NewspaperFilterForm(forms.Form):
-    topic_name = forms.ModelChoiceField(
-        queryset=Topic.objects.all(),
-        empty_label="All topics",
+    # Cleans to a topic id; choices come from the in-memory topic table.
+    topic_name = forms.TypedChoiceField(
+        coerce=int,
+        empty_value=None,
         required=False,
     )
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.fields["topic_name"].choices = [
+            ("", "All topics"),
+            *get_topic_table().choices(),
+        ]
+
 
 class NewspaperSearchForm(forms.Form):
     query_search = forms.CharField(
@@ -32,6 +119,9 @@ class NewspaperSearchForm(forms.Form):
     )
 
 
+SORT_CHOICES = (("", "By name"), ("popular", "Most published"))
+
+
 class TopicSearchForm(forms.Form):
     topic_name = forms.CharField(
         max_length=255,
@@ -39,6 +129,13 @@ class TopicSearchForm(forms.Form):
         label="",
         widget=forms.TextInput(attrs={"placeholder": "Search by name..."})
     )
+    min_newspapers = forms.IntegerField(
+        min_value=0,
+        required=False,
+        label="",
+        widget=forms.NumberInput(attrs={"placeholder": "Min. newspapers"})
+    )
+    sort = forms.ChoiceField(choices=SORT_CHOICES, required=False, label="")
 
 
 class RedactorSearchForm(forms.Form):
@@ -48,6 +145,13 @@ class RedactorSearchForm(forms.Form):
         label="",
         widget=forms.TextInput(attrs={"placeholder": "Search..."})
     )
+    min_publications = forms.IntegerField(
+        min_value=0,
+        required=False,
+        label="",
+        widget=forms.NumberInput(attrs={"placeholder": "Min. publications"})
+    )
+    sort = forms.ChoiceField(choices=SORT_CHOICES, required=False, label="")
 
 
 class RedactorRegisterForm(UserCreationForm):
@@ -0,0 +1,163 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, DatabaseError
+from django.db.migrations.executor import MigrationExecutor
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from agency.benchmarks.dataset import seed_dataset, temporary_database
+from agency.benchmarks.stats import summarize
+from agency.models import Newspaper
+
+# Content is plain text up to the first and compressed from the last.
+TEXT_MIGRATION = ("agency", "0008_deletion_jobs")
+COMPRESSED_MIGRATION = ("agency", "0011_newspaper_content_swap")
+
+
+def migrate_to(connection, target: tuple) -> None:
+    MigrationExecutor(connection).migrate([target])
+
+
+def storage_report(connection) -> dict:
+    """
+    Bytes of newspaper content as stored, and of the whole newspaper table
+    where the database can tell.
+    """
+    table = Newspaper._meta.db_table
+
+    if connection.vendor == "postgresql":
+        content_sql = f"SELECT SUM(OCTET_LENGTH(content)) FROM {table}"
+        table_sql = "SELECT pg_total_relation_size(%s)"
+    else:
+        content_sql = f"SELECT SUM(LENGTH(CAST(content AS BLOB))) FROM {table}"
+        # Needs SQLite built with the dbstat table.
+        table_sql = "SELECT SUM(pgsize) FROM dbstat WHERE name = %s"
+
+    with connection.cursor() as cursor:
+        cursor.execute(content_sql)
+        content_bytes = cursor.fetchone()[0] or 0
+
+        try:
+            cursor.execute(table_sql, [table])
+            table_bytes = cursor.fetchone()[0]
+        except DatabaseError:
+            table_bytes = None
+
+    return {"content_bytes": content_bytes, "table_bytes": table_bytes}
+
+
+def page_cases(samples: int) -> dict:
+    newspaper_list = reverse("agency:newspaper-list")
+    ids = Newspaper.objects.order_by("?").values_list("id", flat=True)
+
+    return {
+        "newspaper-detail": [
+            reverse("agency:newspaper-detail", args=[pk])
+            for pk in ids[:samples]
+        ],
+        "newspaper-list": [newspaper_list],
+        "newspaper-search": [f"{newspaper_list}?query_search=election"],
+    }
+
+
+def measure(urls: list, repeat: int) -> dict:
+    client = Client(HTTP_HOST="127.0.0.1")
+
+    for url in urls:
+        client.get(url)
+
+    latencies = []
+
+    for index in range(repeat):
+        started = time.perf_counter()
+        client.get(urls[index % len(urls)])
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    return summarize(latencies)
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Seed a throwaway database and report the size of the newspaper "
+        "table and the latency of newspaper pages with plain text and with "
+        "compressed content."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--newspapers", type=int, default=5000)
+        parser.add_argument("--topics", type=int, default=50)
+        parser.add_argument("--redactors", type=int, default=200)
+        parser.add_argument("--content-words", type=int, default=2000)
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=50,
+            help="Newspapers whose detail pages are requested in turn.",
+        )
+        parser.add_argument("--repeat", type=int, default=200)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--output", help="Write the JSON report here instead of stdout."
+        )
+
+    def handle(self, *args, **options) -> None:
+        with temporary_database(DEFAULT_DB_ALIAS) as connection:
+            dataset = seed_dataset(
+                newspapers=options["newspapers"],
+                topics=options["topics"],
+                redactors=options["redactors"],
+                content_words=options["content_words"],
+                seed=options["seed"],
+            )
+            report = {
+                "vendor": connection.vendor,
+                "dataset": dataset,
+                "phases": {},
+            }
+
+            with override_settings(DEBUG=False, AGENCY_PAGE_CACHE_TIMEOUT=0):
+                cases = page_cases(options["samples"])
+
+                for phase, target in (
+                    ("text", TEXT_MIGRATION),
+                    ("compressed", COMPRESSED_MIGRATION),
+                ):
+                    migrate_to(connection, target)
+
+                    if connection.vendor == "sqlite":
+                        # Give back the pages freed by the conversion.
+                        with connection.cursor() as cursor:
+                            cursor.execute("VACUUM")
+
+                    report["phases"][phase] = {
+                        "storage": storage_report(connection),
+                        "latency_ms": {
+                            name: measure(urls, options["repeat"])
+                            for name, urls in cases.items()
+                        },
+                    }
+
+        output = json.dumps(report, indent=2)
+
+        if options["output"]:
+            with open(options["output"], "w") as stream:
+                stream.write(output)
+        else:
+            self.stdout.write(output)
+
+        text, compressed = (
+            report["phases"]["text"], report["phases"]["compressed"]
+        )
+        self.stderr.write(
+            f"content: {text['storage']['content_bytes']} -> "
+            f"{compressed['storage']['content_bytes']} bytes"
+        )
+
+        for name, latency in compressed["latency_ms"].items():
+            self.stderr.write(
+                f"{name}: p50 {text['latency_ms'][name]['p50']:.2f} ms -> "
+                f"{latency['p50']:.2f} ms"
+            )
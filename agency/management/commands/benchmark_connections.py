@@ -0,0 +1,171 @@
+import json
+import logging
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+from django.db.backends.signals import connection_created
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from agency.benchmarks.dataset import seed_dataset, temporary_database
+from agency.benchmarks.load import ClientFetcher, drive
+from agency.management.commands.benchmark_routes import (
+    BENCHMARK_CACHES,
+    git_revision,
+)
+from config.db import tune_database
+
+# Connection handling compared, as tune_database arguments.
+MODES = {
+    "per-request": {"conn_max_age": 0},
+    "persistent": {"conn_max_age": 600},
+    "pooled": {"pool": True},
+}
+
+
+class RequestCycleFetcher(ClientFetcher):
+    """
+    The test client skips the end-of-request connection handling that a
+    server does; repeat it, so connections churn as they would in a
+    deployment.
+    """
+
+    def __call__(self, url: str) -> int:
+        try:
+            return super().__call__(url)
+        finally:
+            close_old_connections()
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Seed a throwaway database and load a page from concurrent workers "
+        "once per connection mode (a connection per request, persistent "
+        "connections, pooled connections), reporting the connections "
+        "opened and the latency of each as JSON."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--newspapers", type=int, default=500)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument(
+            "--pool-size",
+            type=int,
+            help="Pool size of the pooled mode; defaults to --concurrency.",
+        )
+        parser.add_argument(
+            "--url",
+            help="Page to load; defaults to the newspaper list.",
+        )
+        parser.add_argument(
+            "--mode",
+            action="append",
+            dest="modes",
+            choices=list(MODES),
+            help="Only run this mode; repeatable.",
+        )
+        parser.add_argument(
+            "--output", help="Write the JSON report here instead of stdout."
+        )
+
+    def handle(self, *args, **options) -> None:
+        url = options["url"] or reverse("agency:newspaper-list")
+        modes = options["modes"] or list(MODES)
+        opened = []
+
+        def count_connection(sender, connection, **kwargs) -> None:
+            opened.append(connection.alias)
+
+        with ExitStack() as stack:
+            stack.enter_context(temporary_database(DEFAULT_DB_ALIAS))
+            dataset = seed_dataset(
+                newspapers=options["newspapers"],
+                topics=20,
+                redactors=50,
+                content_words=200,
+                seed=options["seed"],
+            )
+            stack.enter_context(
+                override_settings(
+                    DEBUG=False,
+                    CACHES=BENCHMARK_CACHES,
+                    AGENCY_PAGE_CACHE_TIMEOUT=0,
+                )
+            )
+            request_logger = logging.getLogger("django.request")
+            stack.callback(request_logger.setLevel, request_logger.level)
+            request_logger.setLevel(logging.ERROR)
+
+            # Worker threads build their connections from these settings,
+            # so swapping them switches the mode of the next run.
+            database = connections.settings[DEFAULT_DB_ALIAS]
+            stack.callback(
+                connections.settings.__setitem__, DEFAULT_DB_ALIAS, database
+            )
+            connection_created.connect(count_connection)
+            stack.callback(connection_created.disconnect, count_connection)
+
+            vendor = connections[DEFAULT_DB_ALIAS].vendor
+            report = {
+                "git_revision": git_revision(),
+                "vendor": vendor,
+                "url": url,
+                "dataset": dataset,
+                "modes": {},
+            }
+
+            for mode in modes:
+                if mode == "pooled" and vendor != "postgresql":
+                    self.stderr.write("pooled: skipped, PostgreSQL only")
+                    continue
+
+                tuning = {
+                    **settings.AGENCY_DATABASE_CONNECTIONS,
+                    "pool_size": (
+                        options["pool_size"] or options["concurrency"]
+                    ),
+                    "pool": False,
+                    **MODES[mode],
+                }
+                connections.settings[DEFAULT_DB_ALIAS] = tune_database(
+                    database, **tuning
+                )
+                opened.clear()
+
+                result = drive(
+                    RequestCycleFetcher(),
+                    url,
+                    options["requests"],
+                    options["concurrency"],
+                )
+                result["connections_opened"] = len(opened)
+
+                if mode == "pooled":
+                    from config.db.pooled_postgresql.base import (
+                        close_pools,
+                        pool_stats,
+                    )
+
+                    # Checkouts also fire connection_created.
+                    result["connections_opened"] = pool_stats()["opened"]
+                    close_pools()
+
+                report["modes"][mode] = result
+                self.stderr.write(
+                    f"{mode}: {result['connections_opened']} connections, "
+                    f"{result['throughput_rps']:.1f} req/s, "
+                    f"p50 {result['latency_ms']['p50']:.2f} ms, "
+                    f"p99 {result['latency_ms']['p99']:.2f} ms"
+                )
+
+        output = json.dumps(report, indent=2)
+
+        if options["output"]:
+            with open(options["output"], "w") as stream:
+                stream.write(output)
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,174 @@
+import json
+import time
+from importlib import import_module
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from agency.benchmarks.dataset import seed_dataset, temporary_database
+from agency.benchmarks.stats import summarize
+from agency.models import Newspaper, Redactor, Topic
+
+# The indexes added by the list index migration, by model.
+LIST_INDEXES = {
+    Newspaper: (
+        "newspaper_published_idx",
+        "newspaper_topic_published_idx",
+        "newspaper_title_idx",
+    ),
+    Redactor: ("redactor_first_name_idx", "redactor_last_name_idx"),
+}
+
+index_migration = import_module("agency.migrations.0004_list_indexes")
+
+
+def list_view_cases(newspapers: int) -> dict:
+    newspaper_list = reverse("agency:newspaper-list")
+    middle_page = max(newspapers // 5 // 2, 1)
+
+    return {
+        "newspaper-list": newspaper_list,
+        "newspaper-list-deep-page": f"{newspaper_list}?page={middle_page}",
+        "newspaper-list-by-topic": (
+            f"{newspaper_list}?topic_name={Topic.objects.first().id}"
+        ),
+        "newspaper-search": f"{newspaper_list}?query_search=election",
+        "topic-search": f"{reverse('agency:topic-list')}?topic_name=ma",
+        "redactor-search": (
+            f"{reverse('agency:redactor-list')}?search_query=ri"
+        ),
+    }
+
+
+def set_list_indexes(connection, present: bool) -> None:
+    """
+    Create or drop the indexes of the list index migration on the current
+    schema. Unapplying the migration instead would rebuild SQLite tables
+    from the schema of that time, losing every later column.
+    """
+    indexed = Topic._meta.get_field("name")
+    unindexed = indexed.clone()
+    unindexed.db_index = False
+    unindexed.set_attributes_from_name(indexed.name)
+    unindexed.model = Topic
+
+    with connection.schema_editor() as editor:
+        for model, names in LIST_INDEXES.items():
+            for index in model._meta.indexes:
+                if index.name not in names:
+                    continue
+
+                if present:
+                    editor.add_index(model, index)
+                else:
+                    editor.remove_index(model, index)
+
+        if present:
+            editor.alter_field(Topic, unindexed, indexed)
+            index_migration.create_trigram_indexes(None, editor)
+        else:
+            index_migration.drop_trigram_indexes(None, editor)
+            editor.alter_field(Topic, indexed, unindexed)
+
+
+def explain(connection, sql: str) -> list:
+    prefix = connection.ops.explain_query_prefix()
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"{prefix} {sql}")
+        return [" ".join(map(str, row)) for row in cursor.fetchall()]
+
+
+def measure(connection, url: str, repeat: int) -> dict:
+    client = Client(HTTP_HOST="127.0.0.1")
+    client.get(url)
+
+    with CaptureQueriesContext(connection) as captured:
+        client.get(url)
+
+    # Every request resets the connection's query log, so copy it now.
+    queries = [
+        query
+        for query in captured.captured_queries
+        if query["sql"].lstrip().upper().startswith("SELECT")
+    ]
+    latencies = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        client.get(url)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "url": url,
+        "latency_ms": summarize(latencies),
+        "queries": [
+            {
+                "sql": query["sql"],
+                "time_ms": float(query["time"]) * 1000,
+                "plan": explain(connection, query["sql"]),
+            }
+            for query in queries
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Seed a throwaway database and report query plans and latencies of "
+        "the list views without and with the list index migration."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--newspapers", type=int, default=10000)
+        parser.add_argument("--topics", type=int, default=50)
+        parser.add_argument("--redactors", type=int, default=500)
+        parser.add_argument("--content-words", type=int, default=300)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--output", help="Write the JSON report here instead of stdout."
+        )
+
+    def handle(self, *args, **options) -> None:
+        with temporary_database(DEFAULT_DB_ALIAS) as connection:
+            dataset = seed_dataset(
+                newspapers=options["newspapers"],
+                topics=options["topics"],
+                redactors=options["redactors"],
+                content_words=options["content_words"],
+                seed=options["seed"],
+            )
+            report = {
+                "vendor": connection.vendor,
+                "dataset": dataset,
+                "phases": {},
+            }
+
+            with override_settings(DEBUG=False, AGENCY_PAGE_CACHE_TIMEOUT=0):
+                cases = list_view_cases(options["newspapers"])
+
+                for phase, present in (("before", False), ("after", True)):
+                    set_list_indexes(connection, present)
+                    report["phases"][phase] = {
+                        name: measure(connection, url, options["repeat"])
+                        for name, url in cases.items()
+                    }
+
+        output = json.dumps(report, indent=2)
+
+        if options["output"]:
+            with open(options["output"], "w") as stream:
+                stream.write(output)
+        else:
+            self.stdout.write(output)
+
+        for name in report["phases"]["after"]:
+            before = report["phases"]["before"][name]["latency_ms"]["p50"]
+            after = report["phases"]["after"][name]["latency_ms"]["p50"]
+            self.stderr.write(
+                f"{name}: p50 {before:.2f} ms -> {after:.2f} ms"
+            )
@@ -0,0 +1,214 @@
+import json
+import logging
+import platform
+import subprocess
+from contextlib import ExitStack
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connection
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from agency import urls
+from agency.benchmarks.dataset import seed_dataset, temporary_database
+from agency.benchmarks.load import ClientFetcher, UrlFetcher, drive
+from agency.models import Newspaper
+
+# A private cache, so runs neither read nor clear the configured one.
+BENCHMARK_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "agency-benchmark",
+    }
+}
+
+# Extra query strings for routes whose cost depends on them.
+VARIANTS = {
+    "newspaper-list": {
+        "search": "query_search=election",
+        "middle-page": "page={middle_page}",
+    },
+    "topic-list": {"search": "topic_name=ma", "popular": "sort=popular"},
+    "redactor-list": {
+        "search": "search_query=ri",
+        "popular": "sort=popular",
+    },
+    "newspaper-export": {"csv": "format=csv"},
+    "redactor-autocomplete": {"prefix": "q=redactor1"},
+}
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def route_urls(newspaper: Newspaper, redactor) -> dict:
+    """
+    A URL for every route of ``agency.urls``, with path parameters taken
+    from ``newspaper``, its topic and ``redactor``.
+    """
+    objects = {
+        "newspaper": newspaper.id,
+        "redactor": redactor.id,
+        "topic": newspaper.topic_id,
+    }
+    middle_page = max(Newspaper.objects.count() // 5 // 2, 1)
+    found = {}
+
+    for pattern in urls.urlpatterns:
+        kwargs = {}
+
+        for name in pattern.pattern.converters:
+            if name == "topic_slug":
+                kwargs[name] = newspaper.topic.slug
+            else:
+                kwargs[name] = objects[pattern.name.split("-")[0]]
+
+        url = reverse(f"{urls.app_name}:{pattern.name}", kwargs=kwargs)
+        found[pattern.name] = url
+
+        for variant, query in VARIANTS.get(pattern.name, {}).items():
+            query = query.format(middle_page=middle_page)
+            found[f"{pattern.name}[{variant}]"] = f"{url}?{query}"
+
+    return found
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Seed a throwaway database and load-test every route of the "
+        "agency URLconf with concurrent workers, reporting throughput and "
+        "latency percentiles as JSON."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--newspapers", type=int, default=2000)
+        parser.add_argument("--topics", type=int, default=50)
+        parser.add_argument("--redactors", type=int, default=200)
+        parser.add_argument(
+            "--content-words",
+            type=int,
+            default=2000,
+            help="Words of content per newspaper.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--requests", type=int, default=200, help="Requests per route."
+        )
+        parser.add_argument("--concurrency", type=int, default=4)
+        parser.add_argument(
+            "--route",
+            action="append",
+            dest="routes",
+            help="Only run routes whose name starts with this; repeatable.",
+        )
+        parser.add_argument(
+            "--page-cache",
+            action="store_true",
+            help="Keep the page cache on instead of measuring cold renders.",
+        )
+        parser.add_argument(
+            "--base-url",
+            help=(
+                "Drive a running server (e.g. a local gunicorn) at this URL "
+                "anonymously, against its own data, instead of seeding a "
+                "throwaway database and using the test client."
+            ),
+        )
+        parser.add_argument(
+            "--output", help="Write the JSON report here instead of stdout."
+        )
+
+    def handle(self, *args, **options) -> None:
+        with ExitStack() as stack:
+            if options["base_url"]:
+                fetch = UrlFetcher(options["base_url"])
+                dataset = None
+            else:
+                stack.enter_context(temporary_database(DEFAULT_DB_ALIAS))
+                dataset = seed_dataset(
+                    newspapers=options["newspapers"],
+                    topics=options["topics"],
+                    redactors=options["redactors"],
+                    content_words=options["content_words"],
+                    seed=options["seed"],
+                )
+                stack.enter_context(
+                    override_settings(
+                        DEBUG=False,
+                        CACHES=BENCHMARK_CACHES,
+                        AGENCY_PAGE_CACHE_TIMEOUT=(
+                            settings.AGENCY_PAGE_CACHE_TIMEOUT
+                            if options["page_cache"]
+                            else 0
+                        ),
+                    )
+                )
+                fetch = None
+
+            newspaper = (
+                Newspaper.objects.filter(publishers__isnull=False)
+                .order_by("id")
+                .first()
+            )
+            # A publisher of the sampled newspaper sees its edit pages too.
+            redactor = newspaper.publishers.order_by("id").first()
+
+            if fetch is None:
+                login = Client()
+                login.force_login(redactor)
+                fetch = ClientFetcher(cookies=login.cookies)
+
+            # Denied and missing pages are expected; keep their tracebacks
+            # out of the output.
+            request_logger = logging.getLogger("django.request")
+            stack.callback(request_logger.setLevel, request_logger.level)
+            request_logger.setLevel(logging.ERROR)
+
+            report = {
+                "git_revision": git_revision(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "vendor": connection.vendor,
+                "target": options["base_url"] or "test-client",
+                "dataset": dataset,
+                "page_cache": options["page_cache"],
+                "routes": {},
+            }
+
+            for name, url in route_urls(newspaper, redactor).items():
+                if options["routes"] and not name.startswith(
+                    tuple(options["routes"])
+                ):
+                    continue
+
+                result = drive(
+                    fetch, url, options["requests"], options["concurrency"]
+                )
+                report["routes"][name] = result
+                self.stderr.write(
+                    f"{name}: {result['throughput_rps']:.1f} req/s, "
+                    f"p50 {result['latency_ms']['p50']:.2f} ms, "
+                    f"p99 {result['latency_ms']['p99']:.2f} ms, "
+                    f"status {result['status']}"
+                )
+
+        output = json.dumps(report, indent=2)
+
+        if options["output"]:
+            with open(options["output"], "w") as stream:
+                stream.write(output)
+        else:
+            self.stdout.write(output)
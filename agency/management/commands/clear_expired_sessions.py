@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from agency.sessions import clear_expired_sessions
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Delete expired sessions in small batches. Meant to run regularly, "
+        "e.g. from cron, in place of clearsessions."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of sessions deleted per DELETE.",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between batches.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        deleted = clear_expired_sessions(
+            batch_size=options["batch_size"], pause=options["pause"]
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Deleted {deleted} expired sessions.")
+        )
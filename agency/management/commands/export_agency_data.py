@@ -0,0 +1,78 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from agency.exchange import (
+    FORMATS,
+    MODELS,
+    newspaper_records,
+    redactor_records,
+    topic_records,
+    write_csv,
+    write_jsonl,
+)
+from agency.models import Newspaper, Redactor, Topic
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Stream topics, redactors and newspapers to JSON Lines or CSV "
+        "in a format import_agency_data reads back."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "path",
+            nargs="?",
+            default="-",
+            help="File to write, or - for standard output.",
+        )
+        parser.add_argument("--format", choices=FORMATS, default="jsonl")
+        parser.add_argument(
+            "--model",
+            choices=MODELS,
+            help="Export only this model (required for CSV).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Number of rows fetched from the database at a time.",
+        )
+
+    def records(self, model: str, chunk_size: int):
+        if model == "topic":
+            return topic_records(Topic.objects.order_by("id"), chunk_size)
+
+        if model == "redactor":
+            return redactor_records(
+                Redactor.objects.order_by("id"), chunk_size
+            )
+
+        return newspaper_records(Newspaper.objects.order_by("id"), chunk_size)
+
+    def handle(self, *args, **options) -> None:
+        if options["format"] == "csv" and not options["model"]:
+            raise CommandError("--model is required for CSV exports.")
+
+        models = [options["model"]] if options["model"] else MODELS
+        stream = (
+            sys.stdout
+            if options["path"] == "-"
+            else open(options["path"], "w", encoding="utf-8", newline="")
+        )
+        written = 0
+
+        try:
+            for model in models:
+                records = self.records(model, options["chunk_size"])
+
+                if options["format"] == "csv":
+                    written += write_csv(records, stream, model)
+                else:
+                    written += write_jsonl(records, stream)
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+
+        self.stderr.write(f"Exported {written} records.")
@@ -0,0 +1,68 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from agency.exchange import (
+    FORMATS,
+    MODELS,
+    DataImportError,
+    Importer,
+    read_csv,
+    read_jsonl,
+)
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Stream topics, redactors and newspapers from JSON Lines or CSV "
+        "and upsert them in batches."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "path",
+            help="File to import, or - for standard input.",
+        )
+        parser.add_argument("--format", choices=FORMATS, default="jsonl")
+        parser.add_argument(
+            "--model",
+            choices=MODELS,
+            help="Model of every CSV row (required for CSV).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of records written per transaction.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["format"] == "csv" and not options["model"]:
+            raise CommandError("--model is required for CSV imports.")
+
+        stream = (
+            sys.stdin
+            if options["path"] == "-"
+            else open(options["path"], encoding="utf-8", newline="")
+        )
+
+        with stream:
+            if options["format"] == "csv":
+                records = read_csv(stream, options["model"])
+            else:
+                records = read_jsonl(stream)
+
+            try:
+                counts = Importer(options["batch_size"]).feed(records)
+            except DataImportError as error:
+                raise CommandError(str(error)) from error
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Imported "
+                + ", ".join(
+                    f"{count} {model}s" for model, count in counts.items()
+                )
+                + "."
+            )
+        )
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from agency import page_cache
+from agency.search import get_search_backend, reset_search_backends
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for newspapers."  # noqa: VNE003
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of newspapers indexed per batch.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database to rebuild the index on.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        # The index table may have been created since the backend was
+        # chosen.
+        reset_search_backends()
+        backend = get_search_backend(options["database"])
+
+        with transaction.atomic(using=options["database"]):
+            indexed = backend.rebuild(batch_size=options["batch_size"])
+
+        page_cache.bump(page_cache.NEWSPAPER_LIST)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Indexed {indexed} newspapers "
+                f"with {type(backend).__name__}."
+            )
+        )
@@ -0,0 +1,85 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from agency.deletion import run_job
+from agency.models import DeletionJob
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Run the queued topic and redactor deletions batch by batch. "
+        "Interrupted jobs resume where they stopped."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Dependent rows removed per transaction.",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between batches.",
+        )
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help="Also run jobs that failed before.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new jobs instead of exiting when idle.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds between polls with --loop.",
+        )
+
+    def report(self, job: DeletionJob) -> None:
+        self.stdout.write(
+            f"{job}: {job.deleted}/{job.total} dependents removed, "
+            f"{job.progress}% ({job.get_status_display().lower()})"
+        )
+
+    def handle(self, *args, **options) -> None:
+        statuses = [DeletionJob.PENDING, DeletionJob.RUNNING]
+
+        if options["retry_failed"]:
+            statuses.append(DeletionJob.FAILED)
+
+        while True:
+            failed = 0
+
+            for job in DeletionJob.objects.filter(status__in=statuses):
+                try:
+                    run_job(
+                        job,
+                        batch_size=options["batch_size"],
+                        pause=options["pause"],
+                        progress=self.report,
+                    )
+                except Exception as error:
+                    failed += 1
+                    self.stderr.write(f"{job}: failed: {error!r}")
+
+            if not options["loop"]:
+                break
+
+            time.sleep(options["interval"])
+
+        if failed:
+            self.stderr.write(
+                self.style.ERROR(
+                    f"{failed} deletion jobs failed; rerun with "
+                    "--retry-failed to resume them."
+                )
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("Deletion jobs are done."))
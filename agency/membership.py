@@ -0,0 +1,145 @@
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+MOD_GROUP = "Mod"
+ADMIN_GROUP = "Admin"
+
+GENERATION_KEY = "agency:membership:generation"
+
+
+class Membership:
+    def __init__(
+        self, groups: frozenset, permissions: frozenset = None, user=None
+    ) -> None:
+        self.groups = groups
+        self._permissions = permissions
+        self._user = None if permissions is not None else user
+
+    @property
+    def permissions(self) -> frozenset:
+        # Most pages only check groups, so permissions load on first use.
+        if self._permissions is None:
+            self._permissions = frozenset(
+                ModelBackend().get_all_permissions(self._user)
+            )
+            self._user = None
+
+        return self._permissions
+
+    def in_group(self, name: str) -> bool:
+        return name in self.groups
+
+    def has_perm(self, perm: str) -> bool:
+        return perm in self.permissions
+
+    @property
+    def is_mod(self) -> bool:
+        return self.in_group(MOD_GROUP)
+
+    @property
+    def is_admin(self) -> bool:
+        return self.in_group(ADMIN_GROUP)
+
+
+EMPTY_MEMBERSHIP = Membership(frozenset(), frozenset())
+
+
+def _cache_key(user_id: int, generation: int) -> str:
+    return f"agency:membership:{generation}:{user_id}"
+
+
+def _load(user, with_permissions: bool = False) -> Membership:
+    permissions = None
+
+    if with_permissions:
+        permissions = frozenset(ModelBackend().get_all_permissions(user))
+
+    return Membership(
+        groups=frozenset(user.groups.values_list("name", flat=True)),
+        permissions=permissions,
+        user=user,
+    )
+
+
+def _load_cached(user) -> Membership:
+    timeout = settings.AGENCY_MEMBERSHIP_CACHE_TIMEOUT
+
+    if not timeout:
+        return _load(user)
+
+    generation = cache.get_or_set(GENERATION_KEY, 1, timeout=None)
+    key = _cache_key(user.pk, generation)
+    membership = cache.get(key)
+
+    if membership is None:
+        membership = _load(user, with_permissions=True)
+        cache.set(key, membership, timeout=timeout)
+
+    return membership
+
+
+def get_membership(user) -> Membership:
+    """
+    Group names and permissions of ``user``, loaded at most once per user
+    object (and so once per request for ``request.user``).
+    """
+    if not user.is_authenticated:
+        return EMPTY_MEMBERSHIP
+
+    if not hasattr(user, "_agency_membership"):
+        user._agency_membership = _load_cached(user)
+
+    return user._agency_membership
+
+
+def invalidate_membership(user_id: int) -> None:
+    generation = cache.get(GENERATION_KEY)
+
+    if generation is not None:
+        cache.delete(_cache_key(user_id, generation))
+
+
+def _user_key(user_id: int) -> str:
+    return f"agency:user:{user_id}"
+
+
+def invalidate_user(user_id: int) -> None:
+    cache.delete(_user_key(user_id))
+
+
+def invalidate_all_memberships() -> None:
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        pass
+
+
+class MembershipBackend(ModelBackend):
+    def get_user(self, user_id):
+        """
+        ``request.user`` of every authenticated request, read from the cache
+        for ``AGENCY_USER_CACHE_TIMEOUT`` seconds. Saving or deleting the
+        redactor drops the entry.
+        """
+        timeout = settings.AGENCY_USER_CACHE_TIMEOUT
+
+        if not timeout:
+            return super().get_user(user_id)
+
+        key = _user_key(user_id)
+        user = cache.get(key)
+
+        if user is None:
+            user = super().get_user(user_id)
+
+            if user is not None:
+                cache.set(key, user, timeout=timeout)
+
+        return user
+
+    def get_all_permissions(self, user_obj, obj=None) -> set:
+        if obj is not None or not user_obj.is_active:
+            return super().get_all_permissions(user_obj, obj)
+
+        return set(get_membership(user_obj).permissions)
@@ -0,0 +1,56 @@
+from django.db import migrations
+
+
+SQLITE_INDEX_TABLE = "agency_newspaper_fts"
+POSTGRES_INDEX_TABLE = "agency_newspaper_search"
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {SQLITE_INDEX_TABLE} "
+            f"USING fts5(title, content, tokenize = 'porter unicode61')"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {SQLITE_INDEX_TABLE} (rowid, title, content) "
+            f"SELECT id, title, content FROM agency_newspaper"
+        )
+    elif vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE TABLE {POSTGRES_INDEX_TABLE} ("
+            f"newspaper_id bigint PRIMARY KEY "
+            f"REFERENCES agency_newspaper (id) ON DELETE CASCADE, "
+            f"document tsvector NOT NULL)"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX {POSTGRES_INDEX_TABLE}_document_gin "
+            f"ON {POSTGRES_INDEX_TABLE} USING GIN (document)"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {POSTGRES_INDEX_TABLE} (newspaper_id, document) "
+            f"SELECT id, "
+            f"setweight(to_tsvector('english', title), 'A') || "
+            f"setweight(to_tsvector('english', content), 'B') "
+            f"FROM agency_newspaper"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SQLITE_INDEX_TABLE}")
+    elif vendor == "postgresql":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {POSTGRES_INDEX_TABLE}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("agency", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
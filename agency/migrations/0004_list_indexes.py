@@ -0,0 +1,74 @@
+# Generated by Django 4.2.7 on 2026-10-18 19:16
+
+from django.db import migrations, models
+
+# icontains compiles to UPPER(column::text) LIKE UPPER(...) on PostgreSQL,
+# which a trigram index on the same expression can serve.
+TRIGRAM_INDEXES = (
+    ("agency_topic_name_trgm", "agency_topic", "name"),
+    ("agency_newspaper_title_trgm", "agency_newspaper", "title"),
+    ("agency_redactor_username_trgm", "agency_redactor", "username"),
+    ("agency_redactor_first_name_trgm", "agency_redactor", "first_name"),
+    ("agency_redactor_last_name_trgm", "agency_redactor", "last_name"),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            f"USING GIN ((UPPER({column}::text)) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("agency", "0003_versioning"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="topic",
+            name="name",
+            field=models.CharField(db_index=True, max_length=55),
+        ),
+        migrations.AddIndex(
+            model_name="newspaper",
+            index=models.Index(
+                fields=["-published_date", "-id"], name="newspaper_published_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="newspaper",
+            index=models.Index(
+                fields=["topic", "-published_date", "-id"],
+                name="newspaper_topic_published_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="newspaper",
+            index=models.Index(fields=["title"], name="newspaper_title_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="redactor",
+            index=models.Index(fields=["first_name"], name="redactor_first_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="redactor",
+            index=models.Index(fields=["last_name"], name="redactor_last_name_idx"),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def populate_slugs(apps, schema_editor):
+    Topic = apps.get_model("agency", "Topic")
+    taken = set()
+    topics = list(Topic.objects.order_by("id"))
+
+    for topic in topics:
+        base = slug = slugify(topic.name)[:55] or "topic"
+        suffix = 1
+
+        while slug in taken:
+            suffix += 1
+            slug = f"{base}-{suffix}"
+
+        topic.slug = slug
+        taken.add(slug)
+
+    Topic.objects.bulk_update(topics, ["slug"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("agency", "0004_list_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="topic",
+            name="slug",
+            field=models.SlugField(
+                default="", editable=False, max_length=64, db_index=False
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_slugs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="topic",
+            name="slug",
+            field=models.SlugField(editable=False, max_length=64, unique=True),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.7 on 2026-10-18 19:22
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count_of(queryset, column):
+    counts = (
+        queryset.filter(**{column: OuterRef("pk")})
+        .order_by()
+        .values(column)
+        .annotate(total=Count("*"))
+        .values("total")
+    )
+
+    return Coalesce(Subquery(counts), 0)
+
+
+def populate_counters(apps, schema_editor):
+    Topic = apps.get_model("agency", "Topic")
+    Redactor = apps.get_model("agency", "Redactor")
+    Newspaper = apps.get_model("agency", "Newspaper")
+    Publication = Newspaper.publishers.through
+
+    Topic.objects.update(
+        newspaper_count=_count_of(Newspaper.objects.all(), "topic_id")
+    )
+    Redactor.objects.update(
+        publication_count=_count_of(Publication.objects.all(), "redactor_id")
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("agency", "0005_topic_slug"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="redactor",
+            name="publication_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="topic",
+            name="newspaper_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="redactor",
+            index=models.Index(
+                fields=["-publication_count", "id"], name="redactor_popularity_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="topic",
+            index=models.Index(
+                fields=["-newspaper_count", "id"], name="topic_popularity_idx"
+            ),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+EXCERPT_LENGTH = 500
+
+
+def populate_excerpts(apps, schema_editor):
+    Newspaper = apps.get_model("agency", "Newspaper")
+    batch = []
+
+    for newspaper in Newspaper.objects.only("id", "content").iterator(
+        chunk_size=1000
+    ):
+        newspaper.excerpt = Truncator(newspaper.content).chars(
+            EXCERPT_LENGTH
+        )
+        batch.append(newspaper)
+
+        if len(batch) == 1000:
+            Newspaper.objects.bulk_update(batch, ["excerpt"])
+            batch = []
+
+    Newspaper.objects.bulk_update(batch, ["excerpt"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("agency", "0006_article_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newspaper",
+            name="excerpt",
+            field=models.CharField(
+                blank=True, editable=False, max_length=500
+            ),
+        ),
+        migrations.RunPython(populate_excerpts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations
+
+import agency.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("agency", "0008_deletion_jobs"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newspaper",
+            name="compressed_content",
+            field=agency.fields.CompressedTextField(null=True),
+        ),
+    ]
@@ -0,0 +1,66 @@
+from django.db import migrations, transaction
+
+BATCH_SIZE = 500
+
+
+def _batches(queryset, field: str):
+    last_id = 0
+
+    while True:
+        batch = list(
+            queryset.filter(id__gt=last_id)
+            .order_by("id")
+            .only("id", field)[:BATCH_SIZE]
+        )
+
+        if not batch:
+            return
+
+        yield batch
+        last_id = batch[-1].id
+
+
+def compress_content(apps, schema_editor):
+    Newspaper = apps.get_model("agency", "Newspaper")
+    using = schema_editor.connection.alias
+    # Rows converted by an interrupted run are skipped.
+    pending = Newspaper.objects.using(using).filter(
+        compressed_content__isnull=True
+    )
+
+    for batch in _batches(pending, "content"):
+        for newspaper in batch:
+            newspaper.compressed_content = newspaper.content
+
+        with transaction.atomic(using=using):
+            Newspaper.objects.using(using).bulk_update(
+                batch, ["compressed_content"]
+            )
+
+
+def decompress_content(apps, schema_editor):
+    Newspaper = apps.get_model("agency", "Newspaper")
+    using = schema_editor.connection.alias
+
+    for batch in _batches(
+        Newspaper.objects.using(using), "compressed_content"
+    ):
+        for newspaper in batch:
+            newspaper.content = newspaper.compressed_content
+
+        with transaction.atomic(using=using):
+            Newspaper.objects.using(using).bulk_update(batch, ["content"])
+
+
+class Migration(migrations.Migration):
+    # Every batch commits on its own, so a large table is not locked for
+    # the whole conversion and an interrupted run resumes where it stopped.
+    atomic = False
+
+    dependencies = [
+        ("agency", "0009_newspaper_compressed_content"),
+    ]
+
+    operations = [
+        migrations.RunPython(compress_content, decompress_content),
+    ]
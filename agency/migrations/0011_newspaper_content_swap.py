@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+import agency.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("agency", "0010_compress_newspaper_content"),
+    ]
+
+    operations = [
+        # Lets a reverse migration add the text column back to a table
+        # with rows; the compressed content is then copied into it.
+        migrations.AlterField(
+            model_name="newspaper",
+            name="content",
+            field=models.TextField(default=""),
+        ),
+        migrations.RemoveField(model_name="newspaper", name="content"),
+        migrations.RenameField(
+            model_name="newspaper",
+            old_name="compressed_content",
+            new_name="content",
+        ),
+        migrations.AlterField(
+            model_name="newspaper",
+            name="content",
+            field=agency.fields.CompressedTextField(),
+        ),
+    ]
@@ -1,31 +1,149 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import F
+from django.utils import timezone
+from django.utils.text import Truncator, slugify
 
 from config import settings
 from django.urls import reverse
 
+from agency.fields import CompressedTextField
+
+
+class Versioned(models.Model):
+    # Not auto_now, which raw saves such as loaddata skip; save() sets it.
+    updated_at = models.DateTimeField(
+        default=timezone.now, editable=False, db_index=True
+    )
+    version = models.PositiveIntegerField(default=1, editable=False)
+    # Fields that no page shows, so saving only them is no new version.
+    unversioned_fields = frozenset()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs) -> None:
+        update_fields = kwargs.get("update_fields")
+
+        if not self._state.adding and not (
+            update_fields is not None
+            and set(update_fields) <= self.unversioned_fields
+        ):
+            self.updated_at = timezone.now()
+            self.version += 1
+
+            if update_fields is not None:
+                kwargs["update_fields"] = {
+                    *update_fields, "version", "updated_at"
+                }
+
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def touch(cls, ids, **changes) -> None:
+        cls.objects.filter(pk__in=ids).update(
+            version=F("version") + 1, updated_at=timezone.now(), **changes
+        )
+
+
+class Redactor(AbstractUser, Versioned):
+    unversioned_fields = frozenset({"last_login"})
 
-class Redactor(AbstractUser):
     years_of_experience = models.IntegerField(null=True)
+    # Kept up to date by agency.signals, see reconcile_counters.
+    publication_count = models.PositiveIntegerField(
+        default=0, editable=False
+    )
+    # Hidden while a DeletionJob removes its publications.
+    pending_deletion = models.BooleanField(default=False, editable=False)
 
     class Meta:
         verbose_name = "redactor"
         ordering = ("username",)
+        indexes = [
+            models.Index(
+                fields=["-publication_count", "id"],
+                name="redactor_popularity_idx",
+            ),
+            models.Index(
+                fields=["first_name"], name="redactor_first_name_idx"
+            ),
+            models.Index(
+                fields=["last_name"], name="redactor_last_name_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.username}"
 
 
-class Topic(models.Model):
-    name = models.CharField(max_length=55)
+class Topic(Versioned):
+    name = models.CharField(max_length=55, db_index=True)
+    slug = models.SlugField(max_length=64, unique=True, editable=False)
+    # Kept up to date by agency.signals, see reconcile_counters.
+    newspaper_count = models.PositiveIntegerField(default=0, editable=False)
+    # Hidden while a DeletionJob removes its newspapers.
+    pending_deletion = models.BooleanField(default=False, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["-newspaper_count", "id"],
+                name="topic_popularity_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
 
+    def save(self, *args, **kwargs) -> None:
+        # Slugs are kept on rename so by-topic links stay valid.
+        if not self.slug:
+            Topic.assign_slugs([self])
+
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def assign_slugs(cls, topics) -> None:
+        """
+        Give every topic without a slug one derived from its name, made
+        unique with a numeric suffix. For ``bulk_create``, which skips
+        ``save()``.
+        """
+        pending = [topic for topic in topics if not topic.slug]
+        bases = {slugify(topic.name)[:55] or "topic" for topic in pending}
+
+        if not bases:
+            return
+
+        taken = cls.objects.all()
+
+        if len(bases) == 1:
+            taken = taken.filter(slug__startswith=next(iter(bases)))
+
+        taken = set(taken.values_list("slug", flat=True))
+
+        for topic in pending:
+            base = slug = slugify(topic.name)[:55] or "topic"
+            suffix = 1
+
+            while slug in taken:
+                suffix += 1
+                slug = f"{base}-{suffix}"
+
+            topic.slug = slug
+            taken.add(slug)
+
+
+class Newspaper(Versioned):
+    EXCERPT_LENGTH = 500
 
-class Newspaper(models.Model):
     title = models.CharField(max_length=255)
-    content = models.TextField()
+    content = CompressedTextField()
+    # List pages show this instead of loading the full content.
+    excerpt = models.CharField(
+        max_length=EXCERPT_LENGTH, blank=True, editable=False
+    )
     published_date = models.DateField(auto_now_add=True)
     topic = models.ForeignKey(
         to=Topic, on_delete=models.CASCADE, related_name="newspapers"
@@ -34,5 +152,114 @@ class Newspaper(models.Model):
         to=settings.AUTH_USER_MODEL, related_name="newspapers"
     )
 
+    class Meta:
+        indexes = [
+            # Default list ordering, also the keyset of cursor pagination.
+            models.Index(
+                fields=["-published_date", "-id"],
+                name="newspaper_published_idx",
+            ),
+            # Topic-filtered list pages in the same order.
+            models.Index(
+                fields=["topic", "-published_date", "-id"],
+                name="newspaper_topic_published_idx",
+            ),
+            models.Index(fields=["title"], name="newspaper_title_idx"),
+        ]
+
     def __str__(self) -> str:
         return self.title
+
+    def save(self, *args, **kwargs) -> None:
+        # Content that is deferred or still compressed was not changed.
+        if isinstance(self.__dict__.get("content"), str):
+            Newspaper.assign_excerpts([self])
+
+        update_fields = kwargs.get("update_fields")
+
+        if update_fields is not None and "content" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "excerpt"}
+
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def make_excerpt(cls, content: str) -> str:
+        return Truncator(content).chars(cls.EXCERPT_LENGTH)
+
+    @classmethod
+    def assign_excerpts(cls, newspapers) -> None:
+        """
+        Derive ``excerpt`` from ``content``. For ``bulk_create`` and
+        ``bulk_update``, which skip ``save()``.
+        """
+        for newspaper in newspapers:
+            newspaper.excerpt = cls.make_excerpt(newspaper.content)
+
+    def has_publisher(self, user) -> bool:
+        if not user.is_authenticated:
+            return False
+
+        return Newspaper.publishers.through.objects.filter(
+            newspaper_id=self.pk, redactor_id=user.pk
+        ).exists()
+
+
+class DeletionJob(models.Model):
+    """
+    Removal of a topic or redactor and its dependents in small batches by
+    ``run_deletion_jobs``, so no request or transaction holds locks on
+    every dependent row at once.
+    """
+
+    TOPIC = "topic"
+    REDACTOR = "redactor"
+    TARGET_CHOICES = ((TOPIC, "Topic"), (REDACTOR, "Redactor"))
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = (
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+    )
+
+    target = models.CharField(max_length=10, choices=TARGET_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    object_repr = models.CharField(max_length=255)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=PENDING
+    )
+    # Dependents when scheduled and removed so far.
+    total = models.PositiveIntegerField(default=0)
+    deleted = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("created_at", "id")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["target", "object_id"],
+                name="deletion_job_target_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["status", "id"], name="deletion_job_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_target_display()} {self.object_repr}"
+
+    @property
+    def progress(self) -> int:
+        if self.status == self.DONE:
+            return 100
+
+        if not self.total:
+            return 0
+
+        return min(self.deleted * 100 // self.total, 99)
@@ -0,0 +1,158 @@
+import hashlib
+import time
+from typing import Iterable
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+GENERATION_PREFIX = "agency:generation:"
+
+NEWSPAPER_LIST = "newspaper-list"
+REDACTOR_LIST = "redactor-list"
+TOPICS = "topics"
+TOPIC_COUNTS = "topic-counts"
+
+
+def newspaper_key(pk: int) -> str:
+    return f"newspaper:{pk}"
+
+
+def redactor_key(pk: int) -> str:
+    return f"redactor:{pk}"
+
+
+def get_generations(names: Iterable[str]) -> list:
+    """
+    Current generation of every name. A page cached under one generation
+    is never read again once a signal bumps any name it depends on.
+    """
+    names = list(names)
+    keys = [GENERATION_PREFIX + name for name in names]
+    found = cache.get_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in found}
+
+    if missing:
+        cache.set_many(missing, timeout=None)
+        found.update(missing)
+
+    return [found[key] for key in keys]
+
+
+def bump(*names: str) -> None:
+    if names:
+        now = time.time_ns()
+        cache.set_many(
+            {GENERATION_PREFIX + name: now for name in names}, timeout=None
+        )
+
+
+def page_version(request, dependencies: Iterable[str]) -> str:
+    query = sorted(
+        (key, value)
+        for key, values in request.GET.lists()
+        for value in values
+    )
+    raw = repr((request.path, query, get_generations(dependencies)))
+
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+class CachedPageMixin:
+    """
+    Serves anonymous GET requests from the cache and exposes
+    ``page_cache_version`` to templates so that user-independent fragments
+    can be cached for logged-in users too.
+    """
+
+    page_cache_timeout = None
+
+    def get_cache_dependencies(self) -> list:
+        raise NotImplementedError
+
+    def get_page_cache_timeout(self) -> int:
+        if self.page_cache_timeout is not None:
+            return self.page_cache_timeout
+
+        return settings.AGENCY_PAGE_CACHE_TIMEOUT
+
+    def get_page_cache_version(self) -> str:
+        if not hasattr(self, "_page_cache_version"):
+            self._page_cache_version = page_version(
+                self.request, self.get_cache_dependencies()
+            )
+
+        return self._page_cache_version
+
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        context["page_cache_timeout"] = self.get_page_cache_timeout()
+        context["page_cache_version"] = self.get_page_cache_version()
+
+        return context
+
+    def _serves_from_cache(self, request) -> bool:
+        return bool(
+            self.get_page_cache_timeout()
+            and request.method == "GET"
+            and not request.user.is_authenticated
+        )
+
+    def _page_cache_key(self) -> str:
+        return f"agency:page:{self.get_page_cache_version()}"
+
+    @staticmethod
+    def _from_cache(response):
+        # Validators are recomputed for every request by the view's
+        # condition decorator.
+        del response["ETag"]
+        del response["Last-Modified"]
+        return response
+
+    def _store(self, key: str, response) -> None:
+        timeout = self.get_page_cache_timeout()
+
+        if response.status_code != 200 or response.cookies:
+            return
+
+        if hasattr(response, "render") and not response.is_rendered:
+            response.add_post_render_callback(
+                lambda rendered: cache.set(key, rendered, timeout)
+            )
+        else:
+            cache.set(key, response, timeout)
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.view_is_async:
+            return self._adispatch(request, *args, **kwargs)
+
+        if not self._serves_from_cache(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        key = self._page_cache_key()
+        response = cache.get(key)
+
+        if response is not None:
+            return self._from_cache(response)
+
+        response = super().dispatch(request, *args, **kwargs)
+        self._store(key, response)
+
+        return response
+
+    async def _adispatch(self, request, *args, **kwargs):
+        # Resolving request.user and the generations may query, so both
+        # run in a thread; the page itself is read from the async API.
+        if not await sync_to_async(self._serves_from_cache)(request):
+            return await super().dispatch(request, *args, **kwargs)
+
+        key = await sync_to_async(self._page_cache_key)()
+        response = await cache.aget(key)
+
+        if response is not None:
+            return self._from_cache(response)
+
+        response = await super().dispatch(request, *args, **kwargs)
+        self._store(key, response)
+
+        return response
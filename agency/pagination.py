@@ -0,0 +1,311 @@
+import base64
+import binascii
+import json
+from typing import Optional, Sequence
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage, Paginator
+from django.db import connections
+from django.db.models import Model, Q, QuerySet
+from django.http import Http404
+from django.utils.functional import cached_property
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorPage:
+    def __init__(
+        self,
+        object_list: list,
+        next_cursor: Optional[str],
+        previous_cursor: Optional[str],
+    ) -> None:
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Keyset paginator: every page is a single ``LIMIT per_page + 1`` query
+    seeking past the last row of the previous page, so there is no COUNT
+    and no OFFSET however deep the page is. ``ordering`` must end with a
+    unique field so that the key is a total order.
+    """
+
+    cursor_based = True
+
+    def __init__(
+        self, queryset: QuerySet, per_page: int, ordering: Sequence[str]
+    ) -> None:
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        self.fields = [
+            queryset.model._meta.get_field(key.lstrip("-"))
+            for key in self.ordering
+        ]
+
+    def encode_cursor(self, obj: Model, backwards: bool) -> str:
+        payload = {
+            "k": [field.value_to_string(obj) for field in self.fields],
+            "b": backwards,
+        }
+        return base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(",", ":")).encode()
+        ).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> tuple:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            keys = payload["k"]
+            backwards = bool(payload["b"])
+
+            if len(keys) != len(self.fields):
+                raise InvalidCursor("Cursor does not match the ordering.")
+
+            values = [
+                field.to_python(key)
+                for field, key in zip(self.fields, keys, strict=True)
+            ]
+        except (
+            ValueError,
+            KeyError,
+            TypeError,
+            ValidationError,
+        ) as error:
+            raise InvalidCursor("Invalid cursor.") from error
+
+        return values, backwards
+
+    def _ordering(self, backwards: bool) -> list:
+        if not backwards:
+            return list(self.ordering)
+
+        return [
+            key[1:] if key.startswith("-") else f"-{key}"
+            for key in self.ordering
+        ]
+
+    def _seek(self, values: list, backwards: bool) -> Q:
+        condition = Q()
+
+        for position, key in enumerate(self.ordering):
+            descending = key.startswith("-") != backwards
+            lookup = "lt" if descending else "gt"
+            clause = Q(**{f"{key.lstrip('-')}__{lookup}": values[position]})
+
+            for previous_key, value in zip(
+                self.ordering[:position], values[:position], strict=True
+            ):
+                clause &= Q(**{previous_key.lstrip("-"): value})
+
+            condition |= clause
+
+        return condition
+
+    def _window(self, cursor: Optional[str]) -> tuple:
+        backwards = False
+        queryset = self.queryset
+
+        if cursor:
+            values, backwards = self.decode_cursor(cursor)
+            queryset = queryset.filter(self._seek(values, backwards))
+
+        queryset = queryset.order_by(*self._ordering(backwards))
+
+        return queryset[: self.per_page + 1], backwards
+
+    def _make_page(
+        self, rows: list, cursor: Optional[str], backwards: bool
+    ) -> CursorPage:
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if backwards:
+            rows.reverse()
+            has_next, has_previous = bool(rows), has_more
+        else:
+            has_next, has_previous = has_more, bool(cursor) and bool(rows)
+
+        return CursorPage(
+            object_list=rows,
+            next_cursor=(
+                self.encode_cursor(rows[-1], False) if has_next else None
+            ),
+            previous_cursor=(
+                self.encode_cursor(rows[0], True) if has_previous else None
+            ),
+        )
+
+    def page(self, cursor: Optional[str] = None) -> CursorPage:
+        queryset, backwards = self._window(cursor)
+
+        return self._make_page(list(queryset), cursor, backwards)
+
+    async def apage(self, cursor: Optional[str] = None) -> CursorPage:
+        queryset, backwards = self._window(cursor)
+
+        return self._make_page(
+            [row async for row in queryset], cursor, backwards
+        )
+
+
+class CursorPaginationMixin:
+    cursor_ordering = None
+    cursor_query_param = "cursor"
+
+    def get_cursor_ordering(self) -> Optional[Sequence[str]]:
+        return self.cursor_ordering
+
+    def uses_cursor_pagination(self) -> bool:
+        return bool(
+            settings.AGENCY_CURSOR_PAGINATION and self.get_cursor_ordering()
+        )
+
+    def paginate_queryset(self, queryset: QuerySet, page_size: int) -> tuple:
+        if not self.uses_cursor_pagination():
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = CursorPaginator(
+            queryset, page_size, self.get_cursor_ordering()
+        )
+
+        try:
+            page = paginator.page(
+                self.request.GET.get(self.cursor_query_param)
+            )
+        except InvalidCursor as error:
+            raise Http404("Invalid cursor.") from error
+
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    async def apaginate_queryset(
+        self, queryset: QuerySet, page_size: int
+    ) -> tuple:
+        """
+        ``paginate_queryset`` for async views: the count and the rows of
+        the page are loaded through the async ORM.
+        """
+        if self.uses_cursor_pagination():
+            paginator = CursorPaginator(
+                queryset, page_size, self.get_cursor_ordering()
+            )
+
+            try:
+                page = await paginator.apage(
+                    self.request.GET.get(self.cursor_query_param)
+                )
+            except InvalidCursor as error:
+                raise Http404("Invalid cursor.") from error
+
+            return paginator, page, page.object_list, page.has_other_pages()
+
+        paginator = self.get_paginator(
+            queryset,
+            page_size,
+            orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+        )
+        # Paginator.count is a cached property; filling it in up front
+        # keeps the paginator from running a synchronous COUNT.
+        paginator.count = await queryset.acount()
+        page_number = (
+            self.kwargs.get(self.page_kwarg)
+            or self.request.GET.get(self.page_kwarg)
+            or 1
+        )
+
+        try:
+            page = paginator.page(
+                paginator.num_pages
+                if page_number == "last"
+                else int(page_number)
+            )
+        except (ValueError, InvalidPage) as error:
+            raise Http404(
+                f"Invalid page ({page_number}): {error}"
+            ) from error
+
+        page.object_list = [row async for row in page.object_list]
+
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+def estimated_count(queryset: QuerySet) -> Optional[int]:
+    """
+    The planner's row estimate for the whole table of ``queryset``, kept
+    up to date by autovacuum on PostgreSQL. ``None`` elsewhere or when the
+    table was never analyzed.
+    """
+    connection = connections[queryset.db]
+
+    if connection.vendor != "postgresql":
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+
+    return row[0] if row and row[0] >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for admin changelists of large tables. Unfiltered lists are
+    counted from the planner's estimate once it exceeds
+    ``estimate_threshold``; filtered ones count at most ``count_limit``
+    rows. A page first reads just the primary keys at its offset, which an
+    index can serve, and then loads only those rows.
+    """
+
+    estimate_threshold = 10000
+    count_limit = 100000
+
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+
+        if not queryset.query.where:
+            estimate = estimated_count(queryset)
+
+            if estimate is not None and estimate > self.estimate_threshold:
+                return estimate
+
+        return queryset.order_by()[: self.count_limit].count()
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        ids = list(self.object_list.values_list("pk", flat=True)[bottom:top])
+
+        return self._get_page(
+            self.object_list.filter(pk__in=ids), number, self
+        )
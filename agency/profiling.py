@@ -0,0 +1,243 @@
+import threading
+import time
+from collections import Counter, deque
+from contextlib import ExitStack
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from agency.benchmarks.stats import percentile
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Sample(NamedTuple):
+    wall: float
+    sql: float
+    render: float
+    python: float
+    queries: int
+    duplicates: int
+    similar: int
+
+
+class ViewProfile:
+    """
+    Rolling window of the last ``window`` samples of one view, plus
+    lifetime totals for Prometheus counters.
+    """
+
+    def __init__(self, window: int) -> None:
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.totals = dict.fromkeys(Sample._fields, 0)
+
+    def add(self, sample: Sample) -> None:
+        self.samples.append(sample)
+        self.count += 1
+
+        for field, value in sample._asdict().items():
+            self.totals[field] += value
+
+    def quantiles(self, field: str) -> dict:
+        values = sorted(getattr(sample, field) for sample in self.samples)
+
+        return {q: percentile(values, q) for q in QUANTILES}
+
+
+class ProfileStore:
+    """Per-process store of view profiles, safe for threaded servers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def record(self, view: str, sample: Sample) -> None:
+        with self._lock:
+            if view not in self._views:
+                self._views[view] = ViewProfile(
+                    settings.AGENCY_PROFILING_WINDOW
+                )
+
+            self._views[view].add(sample)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            views = {}
+
+            for view, profile in self._views.items():
+                copy = ViewProfile(profile.samples.maxlen)
+                copy.samples.extend(profile.samples)
+                copy.count = profile.count
+                copy.totals = dict(profile.totals)
+                views[view] = copy
+
+        return dict(sorted(views.items()))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._views.clear()
+
+
+store = ProfileStore()
+
+
+class _RequestProfile:
+    def __init__(self) -> None:
+        self.queries = []
+        self.sql = 0.0
+        self.render = 0.0
+        self.render_sql = 0.0
+        self.rendering = False
+        self._render_started = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.sql += elapsed
+
+            if self.rendering:
+                self.render_sql += elapsed
+
+            self.queries.append((sql, repr(params)))
+
+    def start_render(self) -> None:
+        self.rendering = True
+        self._render_started = time.perf_counter()
+
+    def finish_render(self, response) -> None:
+        self.render += time.perf_counter() - self._render_started
+        self.rendering = False
+
+    def sample(self, wall: float) -> Sample:
+        # Lazy querysets run while rendering; count them as SQL only.
+        render = max(self.render - self.render_sql, 0.0)
+        exact = Counter(self.queries)
+        similar = Counter(sql for sql, params in self.queries)
+
+        return Sample(
+            wall=wall,
+            sql=self.sql,
+            render=render,
+            python=max(wall - self.sql - render, 0.0),
+            queries=len(self.queries),
+            duplicates=len(self.queries) - len(exact),
+            similar=len(self.queries) - len(similar),
+        )
+
+
+class ProfilingMiddleware:
+    """
+    Records wall, SQL, template and Python time, query counts and
+    repeated queries per URL name into ``store``. Unless
+    ``AGENCY_PROFILING`` is set, Django drops the middleware at startup,
+    so it costs nothing when disabled.
+    """
+
+    def __init__(self, get_response) -> None:
+        if not settings.AGENCY_PROFILING:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile = _RequestProfile()
+        request._agency_profile = profile
+        started = time.perf_counter()
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(profile))
+
+            response = self.get_response(request)
+
+        match = request.resolver_match
+        store.record(
+            match.view_name if match else "<unresolved>",
+            profile.sample(time.perf_counter() - started),
+        )
+
+        return response
+
+    def process_template_response(self, request, response):
+        # Template response hooks run in reverse MIDDLEWARE order, so this
+        # one, being last, runs first. None of the middleware above has such
+        # a hook, so the render starts right after; any added later would
+        # count as render time.
+        profile = request._agency_profile
+        profile.start_render()
+        response.add_post_render_callback(profile.finish_render)
+
+        return response
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _label(name: str, value) -> str:
+    return name + '="' + _escape(str(value)) + '"'
+
+
+def prometheus_metrics(views: dict) -> str:
+    """Views of ``store.snapshot()`` in the Prometheus text format."""
+    lines = []
+    summaries = (
+        ("request_duration_seconds", "wall", "Wall time of requests."),
+        ("request_sql_seconds", "sql", "Time spent in SQL per request."),
+        (
+            "request_render_seconds",
+            "render",
+            "Template rendering time per request, excluding SQL.",
+        ),
+        ("request_queries", "queries", "SQL queries per request."),
+    )
+
+    for name, field, description in summaries:
+        lines.append(f"# HELP agency_{name} {description}")
+        lines.append(f"# TYPE agency_{name} summary")
+
+        for view, profile in views.items():
+            label = _label("view", view)
+
+            for quantile, value in profile.quantiles(field).items():
+                lines.append(
+                    f"agency_{name}{{{label},{_label('quantile', quantile)}}} "
+                    f"{value}"
+                )
+
+            lines.append(
+                f"agency_{name}_sum{{{label}}} {profile.totals[field]}"
+            )
+            lines.append(f"agency_{name}_count{{{label}}} {profile.count}")
+
+    counters = (
+        (
+            "duplicate_queries_total",
+            "duplicates",
+            "Queries repeated with the same SQL and parameters.",
+        ),
+        (
+            "similar_queries_total",
+            "similar",
+            "Queries repeated with the same SQL, any parameters.",
+        ),
+    )
+
+    for name, field, description in counters:
+        lines.append(f"# HELP agency_{name} {description}")
+        lines.append(f"# TYPE agency_{name} counter")
+
+        for view, profile in views.items():
+            lines.append(
+                f"agency_{name}{{{_label('view', view)}}} "
+                f"{profile.totals[field]}"
+            )
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,209 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections, router
+from django.db.models import QuerySet
+
+from agency.models import Newspaper
+
+
+SQLITE_INDEX_TABLE = "agency_newspaper_fts"
+POSTGRES_INDEX_TABLE = "agency_newspaper_search"
+POSTGRES_SEARCH_CONFIG = "english"
+
+
+class BaseSearchBackend(ABC):
+    def __init__(self, using: str) -> None:
+        self.using = using
+
+    @abstractmethod
+    def index(self, newspapers: Iterable[Newspaper]) -> None:
+        """Add or refresh ``newspapers`` in the index."""
+
+    @abstractmethod
+    def remove(self, ids: Iterable[int]) -> None:
+        """Drop the newspapers with ``ids`` from the index."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Empty the index."""
+
+    @abstractmethod
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        """``queryset`` narrowed to newspapers matching ``query``."""
+
+    def rebuild(self, batch_size: int = 500) -> int:
+        self.clear()
+        indexed = 0
+        batch = []
+        newspapers = Newspaper.objects.using(self.using).only(
+            "id", "title", "content"
+        )
+
+        for newspaper in newspapers.iterator(chunk_size=batch_size):
+            batch.append(newspaper)
+
+            if len(batch) >= batch_size:
+                self.index(batch)
+                indexed += len(batch)
+                batch = []
+
+        if batch:
+            self.index(batch)
+            indexed += len(batch)
+
+        return indexed
+
+
+class SqliteSearchBackend(BaseSearchBackend):
+    def index(self, newspapers: Iterable[Newspaper]) -> None:
+        rows = [
+            (newspaper.id, newspaper.title, newspaper.content)
+            for newspaper in newspapers
+        ]
+
+        if not rows:
+            return
+
+        self.remove(row[0] for row in rows)
+        with connections[self.using].cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {SQLITE_INDEX_TABLE} (rowid, title, content) "
+                f"VALUES (%s, %s, %s)",
+                rows,
+            )
+
+    def remove(self, ids: Iterable[int]) -> None:
+        with connections[self.using].cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {SQLITE_INDEX_TABLE} WHERE rowid = %s",
+                [(pk,) for pk in ids],
+            )
+
+    def clear(self) -> None:
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SQLITE_INDEX_TABLE}")
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        # Every term is quoted so user input never reaches the FTS5 query
+        # syntax; the terms are ANDed together.
+        terms = " ".join(
+            '"{}"'.format(term.replace('"', '""')) for term in query.split()
+        )
+
+        return queryset.extra(
+            tables=[SQLITE_INDEX_TABLE],
+            where=[
+                f"{SQLITE_INDEX_TABLE}.rowid = {Newspaper._meta.db_table}.id",
+                f"{SQLITE_INDEX_TABLE} MATCH %s",
+            ],
+            params=[terms],
+            select={"search_rank": f"bm25({SQLITE_INDEX_TABLE}, 10.0, 1.0)"},
+            order_by=["search_rank", "-id"],
+        )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    document_sql = (
+        f"setweight(to_tsvector({POSTGRES_SEARCH_CONFIG!r}, %s), 'A') || "
+        f"setweight(to_tsvector({POSTGRES_SEARCH_CONFIG!r}, %s), 'B')"
+    )
+    query_sql = f"websearch_to_tsquery({POSTGRES_SEARCH_CONFIG!r}, %s)"
+
+    def index(self, newspapers: Iterable[Newspaper]) -> None:
+        rows = [
+            (newspaper.id, newspaper.title, newspaper.content)
+            for newspaper in newspapers
+        ]
+
+        if not rows:
+            return
+
+        with connections[self.using].cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {POSTGRES_INDEX_TABLE} (newspaper_id, document) "
+                f"VALUES (%s, {self.document_sql}) "
+                f"ON CONFLICT (newspaper_id) "
+                f"DO UPDATE SET document = EXCLUDED.document",
+                rows,
+            )
+
+    def remove(self, ids: Iterable[int]) -> None:
+        ids = list(ids)
+
+        if not ids:
+            return
+
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {POSTGRES_INDEX_TABLE} "
+                f"WHERE newspaper_id = ANY(%s)",
+                [ids],
+            )
+
+    def clear(self) -> None:
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"TRUNCATE {POSTGRES_INDEX_TABLE}")
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        return queryset.extra(
+            tables=[POSTGRES_INDEX_TABLE],
+            where=[
+                f"{POSTGRES_INDEX_TABLE}.newspaper_id = "
+                f"{Newspaper._meta.db_table}.id",
+                f"{POSTGRES_INDEX_TABLE}.document @@ {self.query_sql}",
+            ],
+            params=[query],
+            select={
+                "search_rank": f"ts_rank({POSTGRES_INDEX_TABLE}.document, "
+                               f"{self.query_sql})"
+            },
+            select_params=[query],
+            order_by=["-search_rank", "-id"],
+        )
+
+
+_backends = {}
+
+
+def get_search_backend(using: str = None) -> BaseSearchBackend:
+    """
+    The search backend of the database ``using``. Raises
+    ImproperlyConfigured where there is no index to search: content is
+    stored compressed, so the table itself cannot be searched instead.
+    """
+    using = using or router.db_for_write(Newspaper)
+
+    if using not in _backends:
+        connection = connections[using]
+
+        if connection.vendor == "postgresql":
+            backend_class = PostgresSearchBackend
+        elif (
+            connection.vendor == "sqlite"
+            and SQLITE_INDEX_TABLE in connection.introspection.table_names()
+        ):
+            backend_class = SqliteSearchBackend
+        else:
+            raise ImproperlyConfigured(
+                f"Newspaper search needs PostgreSQL or SQLite with FTS5, and "
+                f"the search index of database {using!r} is missing. Run "
+                f"migrate and then rebuild_search_index."
+            )
+
+        _backends[using] = backend_class(using)
+
+    return _backends[using]
+
+
+def reset_search_backends(**kwargs) -> None:
+    """
+    Forget the backend chosen for every database, e.g. once migrations
+    created or dropped an index table. Also a ``post_migrate`` receiver.
+    """
+    _backends.clear()
+
+
+def search_newspapers(queryset: QuerySet, query: str) -> QuerySet:
+    return get_search_backend(queryset.db).search(queryset, query)
@@ -0,0 +1,38 @@
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def clear_expired_sessions(batch_size: int = 1000, pause: float = 0) -> int:
+    """
+    Delete expired sessions from the database ``batch_size`` rows at a
+    time, sleeping ``pause`` seconds between batches, so the cleanup never
+    holds long locks on a busy table. Cache-only session stores expire
+    their entries themselves. Returns the number of deleted sessions.
+    """
+    store = import_module(settings.SESSION_ENGINE).SessionStore
+
+    if not hasattr(store, "get_model_class"):
+        return 0
+
+    model = store.get_model_class()
+    expired = model.objects.filter(expire_date__lt=timezone.now())
+    deleted = 0
+
+    while True:
+        keys = list(
+            expired.order_by("expire_date").values_list(
+                "session_key", flat=True
+            )[:batch_size]
+        )
+
+        if keys:
+            deleted += model.objects.filter(session_key__in=keys).delete()[0]
+
+        if len(keys) < batch_size:
+            return deleted
+
+        if pause:
+            time.sleep(pause)
@@ -0,0 +1,274 @@
+from django.contrib.auth.models import Group
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import (
+    post_save,
+    post_delete,
+    pre_delete,
+    pre_save,
+    m2m_changed,
+)
+from django.dispatch import receiver
+
+from agency.membership import (
+    invalidate_membership,
+    invalidate_all_memberships,
+    invalidate_user,
+)
+from agency import page_cache
+from agency.models import Newspaper, Redactor, Topic
+from agency.search import get_search_backend
+from agency.topics import clear_topic_table
+
+Publication = Newspaper.publishers.through
+
+
+@receiver(post_save, sender=Newspaper)
+def index_newspaper(sender, instance, using=None, **kwargs):
+    get_search_backend(using).index([instance])
+
+
+@receiver(post_delete, sender=Newspaper)
+def unindex_newspaper(sender, instance, using=None, **kwargs):
+    get_search_backend(using).remove([instance.pk])
+
+
+@receiver(m2m_changed, sender=Redactor.groups.through)
+@receiver(m2m_changed, sender=Redactor.user_permissions.through)
+def invalidate_redactor_membership(
+    sender, instance, action, reverse, **kwargs
+):
+    if not action.startswith("post_"):
+        return
+
+    if reverse:
+        invalidate_all_memberships()
+    else:
+        invalidate_membership(instance.pk)
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def invalidate_group_permissions(sender, action, **kwargs):
+    if action.startswith("post_"):
+        invalidate_all_memberships()
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def invalidate_group(sender, **kwargs):
+    invalidate_all_memberships()
+
+
+@receiver(post_save, sender=Redactor)
+@receiver(post_delete, sender=Redactor)
+def invalidate_redactor(sender, instance, **kwargs):
+    invalidate_membership(instance.pk)
+    invalidate_user(instance.pk)
+
+
+def _publisher_ids(newspaper_id: int) -> list:
+    return list(
+        Publication.objects.filter(newspaper_id=newspaper_id).values_list(
+            "redactor_id", flat=True
+        )
+    )
+
+
+def _publication_ids(redactor_id: int) -> list:
+    return list(
+        Publication.objects.filter(redactor_id=redactor_id).values_list(
+            "newspaper_id", flat=True
+        )
+    )
+
+
+@receiver(post_save, sender=Newspaper)
+def expire_newspaper_pages(sender, instance, created=False, **kwargs):
+    redactor_ids = [] if created else _publisher_ids(instance.pk)
+
+    page_cache.bump(
+        page_cache.NEWSPAPER_LIST,
+        page_cache.newspaper_key(instance.pk),
+        *map(page_cache.redactor_key, redactor_ids),
+    )
+
+
+@receiver(pre_delete, sender=Newspaper)
+def remember_newspaper_publishers(sender, instance, **kwargs):
+    instance._deleted_publisher_ids = _publisher_ids(instance.pk)
+
+
+@receiver(post_delete, sender=Newspaper)
+def expire_deleted_newspaper_pages(sender, instance, **kwargs):
+    page_cache.bump(
+        page_cache.NEWSPAPER_LIST,
+        page_cache.newspaper_key(instance.pk),
+        *map(
+            page_cache.redactor_key,
+            getattr(instance, "_deleted_publisher_ids", []),
+        ),
+    )
+
+
+def _linked_ids(instance_pk: int, reverse: bool, among=None) -> list:
+    # Newspapers of a redactor when reverse, else publishers of a newspaper.
+    if reverse:
+        links = Publication.objects.filter(redactor_id=instance_pk)
+        column = "newspaper_id"
+    else:
+        links = Publication.objects.filter(newspaper_id=instance_pk)
+        column = "redactor_id"
+
+    if among is not None:
+        links = links.filter(**{f"{column}__in": among})
+
+    return list(links.values_list(column, flat=True))
+
+
+def _counter(field: str, delta: int):
+    if delta < 0:
+        return Greatest(F(field) + delta, 0)
+
+    return F(field) + delta
+
+
+@receiver(m2m_changed, sender=Publication)
+def publications_changed(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    # remove() reports every given id, linked or not; only the linked
+    # ones may move the counters.
+    if action in ("pre_remove", "pre_clear"):
+        instance._removed_publication_ids = _linked_ids(
+            instance.pk, reverse, pk_set if action == "pre_remove" else None
+        )
+        return
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if action != "post_add":
+        pk_set = instance.__dict__.pop("_removed_publication_ids", [])
+
+    if not pk_set:
+        return
+
+    if reverse:
+        redactor_ids, newspaper_ids = [instance.pk], pk_set
+    else:
+        redactor_ids, newspaper_ids = pk_set, [instance.pk]
+
+    delta = len(pk_set) if reverse else 1
+
+    Redactor.touch(
+        redactor_ids,
+        publication_count=_counter(
+            "publication_count", delta if action == "post_add" else -delta
+        ),
+    )
+    Newspaper.touch(newspaper_ids)
+    page_cache.bump(
+        page_cache.REDACTOR_LIST,
+        *map(page_cache.redactor_key, redactor_ids),
+        *map(page_cache.newspaper_key, newspaper_ids),
+    )
+
+
+@receiver(pre_save, sender=Topic)
+def slug_raw_topic(sender, instance, raw=False, **kwargs):
+    # Raw saves, such as loaddata's, skip Topic.save().
+    if raw:
+        Topic.assign_slugs([instance])
+
+
+@receiver(pre_save, sender=Newspaper)
+def excerpt_raw_newspaper(sender, instance, raw=False, **kwargs):
+    # Raw saves, such as loaddata's, skip Newspaper.save().
+    if raw:
+        Newspaper.assign_excerpts([instance])
+
+
+@receiver(pre_save, sender=Newspaper)
+def remember_newspaper_topic(sender, instance, **kwargs):
+    if not instance._state.adding:
+        instance._previous_topic_id = (
+            Newspaper.objects.filter(pk=instance.pk)
+            .values_list("topic_id", flat=True)
+            .first()
+        )
+
+
+def _adjust_newspaper_counts(topic_deltas: dict) -> None:
+    for topic_id, delta in topic_deltas.items():
+        if topic_id is not None and delta:
+            Topic.touch(
+                [topic_id],
+                newspaper_count=_counter("newspaper_count", delta),
+            )
+
+    page_cache.bump(page_cache.TOPIC_COUNTS)
+
+
+@receiver(post_save, sender=Newspaper)
+def count_saved_newspaper(sender, instance, created=False, **kwargs):
+    previous = instance.__dict__.pop("_previous_topic_id", None)
+
+    if created:
+        _adjust_newspaper_counts({instance.topic_id: 1})
+    elif previous != instance.topic_id:
+        _adjust_newspaper_counts({previous: -1, instance.topic_id: 1})
+
+
+@receiver(post_delete, sender=Newspaper)
+def count_deleted_newspaper(sender, instance, **kwargs):
+    _adjust_newspaper_counts({instance.topic_id: -1})
+
+    publisher_ids = getattr(instance, "_deleted_publisher_ids", [])
+
+    if publisher_ids:
+        Redactor.touch(
+            publisher_ids,
+            publication_count=_counter("publication_count", -1),
+        )
+        page_cache.bump(page_cache.REDACTOR_LIST)
+
+
+@receiver(post_save, sender=Topic)
+@receiver(post_delete, sender=Topic)
+def expire_topic_pages(sender, **kwargs):
+    page_cache.bump(page_cache.TOPICS)
+    clear_topic_table()
+
+
+@receiver(post_save, sender=Redactor)
+def expire_redactor_pages(
+    sender, instance, created=False, update_fields=None, **kwargs
+):
+    # Logging in only touches last_login, which no page shows.
+    if update_fields and set(update_fields) == {"last_login"}:
+        return
+
+    newspaper_ids = [] if created else _publication_ids(instance.pk)
+
+    page_cache.bump(
+        page_cache.REDACTOR_LIST,
+        page_cache.redactor_key(instance.pk),
+        *map(page_cache.newspaper_key, newspaper_ids),
+    )
+
+
+@receiver(pre_delete, sender=Redactor)
+def remember_redactor_publications(sender, instance, **kwargs):
+    instance._deleted_publication_ids = _publication_ids(instance.pk)
+
+
+@receiver(post_delete, sender=Redactor)
+def expire_deleted_redactor_pages(sender, instance, **kwargs):
+    page_cache.bump(
+        page_cache.REDACTOR_LIST,
+        page_cache.redactor_key(instance.pk),
+        *map(
+            page_cache.newspaper_key,
+            getattr(instance, "_deleted_publication_ids", []),
+        ),
+    )
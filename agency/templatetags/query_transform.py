@@ -2,14 +2,20 @@ from django import template
 
 register = template.Library()
 
+PAGINATION_PARAMS = ("page", "cursor")
+
 
 @register.simple_tag
 def query_transform(request, **kwargs):
     updated = request.GET.copy()
     for key, value in kwargs.items():
+        if key in PAGINATION_PARAMS:
+            for param in PAGINATION_PARAMS:
+                updated.pop(param, 0)
+
         if value is not None:
             updated[key] = value
         else:
             updated.pop(key, 0)
 
-    return updated. urlencode()
+    return updated.urlencode()
@@ -0,0 +1,26 @@
+"""The project's URLs with the read views in async mode, as under ASGI."""
+from django.urls import include, path
+
+from agency import urls
+from agency.views import AsyncViewMixin
+from config.urls import urlpatterns as project_urlpatterns
+
+agency_urlpatterns = [
+    path(
+        pattern.pattern,
+        pattern.callback.view_class.as_view(
+            **{**pattern.callback.view_initkwargs, "view_is_async": True}
+        ),
+        name=pattern.name,
+    )
+    if issubclass(
+        getattr(pattern.callback, "view_class", object), AsyncViewMixin
+    )
+    else pattern
+    for pattern in urls.urlpatterns
+]
+
+urlpatterns = [
+    *project_urlpatterns[:-1],
+    path("", include((agency_urlpatterns, "agency"), namespace="agency")),
+]
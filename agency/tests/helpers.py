@@ -0,0 +1,55 @@
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetMixin:
+    """
+    Unlike ``assertNumQueries`` the budget is an upper bound, so a view
+    may get cheaper without the test breaking, but never more expensive.
+    """
+
+    @contextmanager
+    def assert_query_budget(self, budget: int, using: str = DEFAULT_DB_ALIAS):
+        with CaptureQueriesContext(connections[using]) as context:
+            yield context
+
+        executed = len(context.captured_queries)
+
+        if executed > budget:
+            queries = "\n".join(
+                f"{number}. {query['sql']}"
+                for number, query in enumerate(
+                    context.captured_queries, start=1
+                )
+            )
+            self.fail(
+                f"{executed} queries executed, budget is {budget}.\n"
+                f"Captured queries were:\n{queries}"
+            )
+
+
+@contextmanager
+def sqlite_database(alias: str, name: str, models=()):
+    """
+    Register the SQLite file ``name`` as the connection ``alias`` for the
+    duration, with tables for ``models``, such as a stand-in read replica.
+    """
+    connections.settings[alias] = {
+        **connections.settings[DEFAULT_DB_ALIAS],
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": name,
+    }
+
+    try:
+        if models:
+            with connections[alias].schema_editor() as editor:
+                for model in models:
+                    editor.create_model(model)
+
+        yield connections[alias]
+    finally:
+        connections[alias].close()
+        del connections[alias]
+        del connections.settings[alias]
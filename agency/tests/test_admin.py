@@ -3,6 +3,7 @@ from django.contrib.auth import get_user_model
 from django.urls import reverse
 
 from agency.models import Newspaper, Topic
+from agency.pagination import EstimatedCountPaginator
 
 
 class AdminSiteTestCase(TestCase):
@@ -54,3 +55,77 @@ class AdminSiteTestCase(TestCase):
         response = self.client.get(url)
 
         self.assertContains(response, self.topic.name)
+
+    def test_newspaper_list_query_count_is_flat(self):
+        for index in range(5):
+            newspaper = Newspaper.objects.create(
+                title=f"extra {index}", content="text", topic=self.topic
+            )
+            newspaper.publishers.add(self.redactor)
+
+        url = reverse("admin:agency_newspaper_changelist")
+
+        # Session, user, topic filter, count and rows with their topics.
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+
+        self.assertContains(response, "extra 4")
+        self.assertNotContains(response, "testNewspaper content")
+
+    def test_newspaper_search_by_topic_name(self):
+        url = reverse("admin:agency_newspaper_changelist")
+        response = self.client.get(url, {"q": "testTopic"})
+
+        self.assertContains(response, self.newspaper.title)
+
+    def test_topic_autocomplete(self):
+        url = reverse("admin:autocomplete")
+        response = self.client.get(
+            url,
+            {
+                "term": "test",
+                "app_label": "agency",
+                "model_name": "newspaper",
+                "field_name": "topic",
+            },
+        )
+
+        self.assertEqual(
+            response.json()["results"],
+            [{"id": str(self.topic.id), "text": str(self.topic)}],
+        )
+
+
+class EstimatedCountPaginatorTest(TestCase):
+    def setUp(self):
+        topic = Topic.objects.create(name="topic")
+        Newspaper.objects.bulk_create(
+            Newspaper(title=f"newspaper {index}", topic=topic)
+            for index in range(5)
+        )
+
+    def test_count_is_exact_without_estimate(self):
+        paginator = EstimatedCountPaginator(
+            Newspaper.objects.order_by("id"), 2
+        )
+
+        self.assertEqual(paginator.count, 5)
+        self.assertEqual(paginator.num_pages, 3)
+
+    def test_count_stops_at_limit(self):
+        paginator = EstimatedCountPaginator(
+            Newspaper.objects.filter(title__startswith="news").order_by("id"),
+            2,
+        )
+        paginator.count_limit = 3
+
+        self.assertEqual(paginator.count, 3)
+
+    def test_page_loads_its_rows_by_id(self):
+        paginator = EstimatedCountPaginator(
+            Newspaper.objects.order_by("id"), 2
+        )
+
+        titles = [newspaper.title for newspaper in paginator.page(3)]
+
+        self.assertEqual(titles, ["newspaper 4"])
@@ -0,0 +1,312 @@
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from agency import page_cache, urls
+from agency.benchmarks.load import drive
+from agency.deletion import run_batch, schedule_deletion
+from agency.management.commands.benchmark_compression import (
+    storage_report,
+)
+from agency.management.commands.benchmark_list_views import (
+    set_list_indexes,
+)
+from agency.management.commands.benchmark_routes import route_urls
+from agency.models import DeletionJob, Newspaper, Redactor, Topic
+from agency.search import get_search_backend
+
+
+class AgencyDataExchangeTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.topic = Topic.objects.create(name="testTopic")
+        self.redactor = Redactor.objects.create(
+            username="testUsername", years_of_experience=5
+        )
+        self.newspaper = Newspaper.objects.create(
+            title="testNewspaper",
+            content="testNewspaper content",
+            topic=self.topic,
+        )
+        self.newspaper.publishers.add(self.redactor)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def run_command(self, *args) -> None:
+        call_command(*args, stdout=StringIO(), stderr=StringIO())
+
+    def test_jsonl_round_trip(self):
+        self.run_command("export_agency_data", self.path("data.jsonl"))
+        Newspaper.objects.all().delete()
+        Topic.objects.all().delete()
+        Redactor.objects.all().delete()
+
+        self.run_command(
+            "import_agency_data", self.path("data.jsonl"), "--batch-size=1"
+        )
+
+        newspaper = Newspaper.objects.get()
+        self.assertEqual(newspaper.title, "testNewspaper")
+        self.assertEqual(newspaper.topic.name, "testTopic")
+        self.assertEqual(
+            list(newspaper.publishers.values_list("username", flat=True)),
+            ["testUsername"],
+        )
+        self.assertEqual(Redactor.objects.get().years_of_experience, 5)
+
+    def test_import_upserts_existing_newspapers(self):
+        self.newspaper.refresh_from_db()
+        version = self.newspaper.version
+        self.redactor.refresh_from_db()
+        redactor_version = self.redactor.version
+        (redactor_generation,) = page_cache.get_generations(
+            [page_cache.redactor_key(self.redactor.id)]
+        )
+
+        with open(self.path("update.jsonl"), "w") as stream:
+            record = {
+                "model": "newspaper",
+                "id": self.newspaper.id,
+                "title": "updatedNewspaper",
+                "content": "rewritten content",
+                "topic": "testTopic",
+                "publishers": [],
+            }
+            stream.write(json.dumps(record) + "\n")
+
+        self.run_command("import_agency_data", self.path("update.jsonl"))
+        self.newspaper.refresh_from_db()
+
+        self.assertEqual(self.newspaper.title, "updatedNewspaper")
+        self.assertEqual(self.newspaper.version, version + 1)
+        self.assertFalse(self.newspaper.publishers.exists())
+        # The former publisher's pages no longer list the newspaper.
+        self.redactor.refresh_from_db()
+        self.assertGreater(self.redactor.version, redactor_version)
+        self.assertNotEqual(
+            page_cache.get_generations(
+                [page_cache.redactor_key(self.redactor.id)]
+            ),
+            [redactor_generation],
+        )
+        self.assertEqual(
+            list(
+                get_search_backend().search(
+                    Newspaper.objects.all(), "rewritten"
+                )
+            ),
+            [self.newspaper],
+        )
+
+    def test_import_expires_publisher_pages(self):
+        self.redactor.refresh_from_db()
+        version = self.redactor.version
+
+        with open(self.path("update.jsonl"), "w") as stream:
+            record = {
+                "model": "newspaper",
+                "id": self.newspaper.id,
+                "title": "renamedNewspaper",
+                "topic": "testTopic",
+                "publishers": ["testUsername"],
+            }
+            stream.write(json.dumps(record) + "\n")
+
+        self.run_command("import_agency_data", self.path("update.jsonl"))
+        self.redactor.refresh_from_db()
+
+        # Its detail page lists the renamed newspaper.
+        self.assertEqual(self.redactor.version, version + 1)
+
+    def test_csv_round_trip_of_newspapers(self):
+        self.run_command(
+            "export_agency_data",
+            self.path("newspapers.csv"),
+            "--format=csv",
+            "--model=newspaper",
+        )
+        Newspaper.objects.all().delete()
+
+        self.run_command(
+            "import_agency_data",
+            self.path("newspapers.csv"),
+            "--format=csv",
+            "--model=newspaper",
+        )
+
+        self.assertEqual(
+            list(Newspaper.objects.values_list("id", "title")),
+            [(self.newspaper.id, "testNewspaper")],
+        )
+        self.assertTrue(Newspaper.objects.get().has_publisher(self.redactor))
+
+    def test_import_reconciles_article_counters(self):
+        self.run_command("export_agency_data", self.path("data.jsonl"))
+        Newspaper.objects.all().delete()
+
+        self.run_command("import_agency_data", self.path("data.jsonl"))
+
+        self.assertEqual(Topic.objects.get().newspaper_count, 1)
+        self.assertEqual(Redactor.objects.get().publication_count, 1)
+
+
+class LoadDataTest(TestCase):
+    def test_sample_data_loads(self):
+        call_command(
+            "loaddata", "newspaper_agency_db_data.json", verbosity=0
+        )
+
+        self.assertEqual(Redactor.objects.count(), 7)
+        self.assertEqual(Newspaper.objects.count(), 15)
+        self.assertFalse(Redactor.objects.filter(updated_at=None).exists())
+
+        self.assertFalse(Topic.objects.filter(slug="").exists())
+        self.assertFalse(Newspaper.objects.filter(excerpt="").exists())
+
+        newspaper = Newspaper.objects.select_related("topic").first()
+        response = self.client.get(
+            reverse(
+                "agency:newspaper-list-by-topic", args=[newspaper.topic.slug]
+            )
+        )
+        self.assertContains(response, newspaper.title)
+
+
+class BenchmarkRoutesTest(TestCase):
+    def test_every_route_gets_a_url(self):
+        topic = Topic.objects.create(name="testTopic")
+        redactor = Redactor.objects.create(username="testUsername")
+        newspaper = Newspaper.objects.create(title="n", topic=topic)
+
+        found = route_urls(newspaper, redactor)
+
+        self.assertTrue(
+            {pattern.name for pattern in urls.urlpatterns} <= set(found)
+        )
+        self.assertEqual(
+            found["newspaper-list-by-topic"],
+            "/newspapers/by-topic/testtopic/",
+        )
+
+    def test_storage_report_counts_compressed_bytes(self):
+        Newspaper.objects.create(
+            title="n",
+            content="word " * 1000,
+            topic=Topic.objects.create(name="testTopic"),
+        )
+
+        report = storage_report(connection)
+
+        self.assertLess(report["content_bytes"], 100)
+
+    def test_drive_splits_requests_across_workers(self):
+        report = drive(lambda url: 200, "/", requests=10, concurrency=3)
+
+        self.assertEqual(report["status"], {"200": 10})
+        self.assertEqual(report["latency_ms"]["count"], 10)
+
+
+class SetListIndexesTest(TransactionTestCase):
+    def newspaper_indexes(self) -> set:
+        with connection.cursor() as cursor:
+            return set(
+                connection.introspection.get_constraints(
+                    cursor, Newspaper._meta.db_table
+                )
+            )
+
+    def test_indexes_toggle_on_the_current_schema(self):
+        set_list_indexes(connection, False)
+
+        try:
+            self.assertNotIn(
+                "newspaper_published_idx", self.newspaper_indexes()
+            )
+            # Columns added by later migrations survive.
+            self.assertFalse(Topic.objects.filter(slug="x").exists())
+        finally:
+            set_list_indexes(connection, True)
+
+        self.assertIn("newspaper_published_idx", self.newspaper_indexes())
+
+
+class ClearExpiredSessionsTest(TestCase):
+    def test_deletes_only_expired_sessions_in_batches(self):
+        now = timezone.now()
+        Session.objects.bulk_create(
+            Session(
+                session_key=f"session{number}",
+                session_data="",
+                expire_date=now + timedelta(days=-1 if number < 5 else 1),
+            )
+            for number in range(7)
+        )
+        stdout = StringIO()
+
+        with self.assertNumQueries(6):
+            call_command(
+                "clear_expired_sessions", "--batch-size", "2", stdout=stdout
+            )
+
+        self.assertIn("Deleted 5 expired sessions.", stdout.getvalue())
+        self.assertEqual(Session.objects.count(), 2)
+
+
+class RunDeletionJobsTest(TestCase):
+    def setUp(self):
+        self.topic = Topic.objects.create(name="doomedTopic")
+        self.redactor = Redactor.objects.create(username="testUsername")
+
+        for number in range(5):
+            Newspaper.objects.create(
+                title=f"doomedNewspaper{number}", topic=self.topic
+            ).publishers.add(self.redactor)
+
+    def run_jobs(self, *args) -> str:
+        stdout = StringIO()
+        call_command(
+            "run_deletion_jobs", "--batch-size", "2", *args, stdout=stdout
+        )
+
+        return stdout.getvalue()
+
+    def test_topic_is_removed_in_batches(self):
+        job = schedule_deletion(self.topic)
+
+        output = self.run_jobs()
+
+        self.assertIn("2/5 dependents removed, 40% (running)", output)
+        self.assertIn("5/5 dependents removed, 100% (done)", output)
+        self.assertFalse(Topic.objects.exists())
+        self.assertFalse(Newspaper.objects.exists())
+        self.redactor.refresh_from_db()
+        self.assertEqual(self.redactor.publication_count, 0)
+        job.refresh_from_db()
+        self.assertEqual(job.status, DeletionJob.DONE)
+
+    def test_interrupted_redactor_deletion_resumes(self):
+        job = schedule_deletion(self.redactor)
+        run_batch(job, batch_size=2)
+        job.refresh_from_db()
+
+        self.assertEqual((job.status, job.deleted), (DeletionJob.RUNNING, 2))
+
+        self.run_jobs()
+
+        self.assertFalse(Redactor.objects.exists())
+        self.assertEqual(Newspaper.objects.count(), 5)
+        self.assertEqual(Newspaper.publishers.through.objects.count(), 0)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.deleted), (DeletionJob.DONE, 5))
@@ -0,0 +1,116 @@
+from unittest import mock
+
+from django.db.backends.postgresql.creation import (
+    DatabaseCreation as PostgresqlCreation,
+)
+from django.test import SimpleTestCase
+
+from config.db import POOLED_POSTGRESQL_ENGINE, tune_database
+from config.db.pool import ConnectionPool, PoolTimeout
+from config.db.pooled_postgresql.base import DatabaseWrapper, close_pools
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPoolTest(SimpleTestCase):
+    def setUp(self):
+        self.pool = ConnectionPool(max_size=2, timeout=0.01)
+
+    def test_released_connections_are_reused(self):
+        first = self.pool.acquire(FakeConnection)
+        self.pool.release(first)
+
+        self.assertIs(self.pool.acquire(FakeConnection), first)
+        self.assertEqual(
+            self.pool.stats, {"opened": 1, "reused": 1, "discarded": 0}
+        )
+
+    def test_unhealthy_connections_are_replaced(self):
+        first = self.pool.acquire(FakeConnection)
+        self.pool.release(first)
+
+        second = self.pool.acquire(FakeConnection, check=lambda c: False)
+
+        self.assertIsNot(second, first)
+        self.assertTrue(first.closed)
+
+    def test_acquire_times_out_when_the_pool_is_exhausted(self):
+        self.pool.acquire(FakeConnection)
+        held = self.pool.acquire(FakeConnection)
+
+        with self.assertRaises(PoolTimeout):
+            self.pool.acquire(FakeConnection)
+
+        self.pool.release(held, reusable=False)
+        self.assertIsInstance(
+            self.pool.acquire(FakeConnection), FakeConnection
+        )
+
+    def test_failed_connects_free_their_slot(self):
+        def refuse():
+            raise OSError("refused")
+
+        for _ in range(3):
+            with self.assertRaises(OSError):
+                self.pool.acquire(refuse)
+
+        self.pool.acquire(FakeConnection)
+
+
+class TuneDatabaseTest(SimpleTestCase):
+    postgresql = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": "agency",
+        "OPTIONS": {"sslmode": "require"},
+    }
+
+    def test_pooled_postgresql(self):
+        database = tune_database(
+            self.postgresql, statement_timeout=5000, pool=True, pool_size=4
+        )
+
+        self.assertEqual(database["ENGINE"], POOLED_POSTGRESQL_ENGINE)
+        self.assertEqual(database["CONN_MAX_AGE"], 0)
+        self.assertTrue(database["CONN_HEALTH_CHECKS"])
+        self.assertEqual(database["POOL"], {"MAX_SIZE": 4, "TIMEOUT": 10.0})
+        self.assertEqual(
+            database["OPTIONS"],
+            {"sslmode": "require", "options": "-c statement_timeout=5000"},
+        )
+        self.assertNotIn("options", self.postgresql["OPTIONS"])
+
+    def test_sqlite_only_gets_connection_lifetime(self):
+        database = tune_database(
+            {"ENGINE": "django.db.backends.sqlite3", "NAME": "db.sqlite3"},
+            conn_max_age=0,
+            statement_timeout=5000,
+            pool=True,
+        )
+
+        self.assertEqual(database["ENGINE"], "django.db.backends.sqlite3")
+        self.assertEqual(database["CONN_MAX_AGE"], 0)
+        self.assertNotIn("OPTIONS", database)
+
+
+class PooledPostgresqlCreationTest(SimpleTestCase):
+    def test_idle_connections_are_closed_before_dropping_test_database(self):
+        self.addCleanup(close_pools)
+        wrapper = DatabaseWrapper({"NAME": "test_agency", "POOL": {}})
+        pool = wrapper.get_pool({"dbname": "test_agency"})
+        idle = pool.acquire(FakeConnection)
+        pool.release(idle)
+
+        with mock.patch.object(
+            PostgresqlCreation,
+            "_destroy_test_db",
+            side_effect=lambda *args: self.assertTrue(idle.closed),
+        ) as destroy:
+            wrapper.creation._destroy_test_db("test_agency", 0)
+
+        destroy.assert_called_once()
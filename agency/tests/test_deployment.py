@@ -0,0 +1,100 @@
+import gc
+import importlib
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from config.health import HEALTH_PATH
+
+
+class HealthCheckTest(TestCase):
+    def test_health_check_skips_host_check_and_database(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(HEALTH_PATH, HTTP_HOST="10.0.0.7")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"ok")
+        self.assertEqual(response["Cache-Control"], "no-store")
+        self.assertNotIn("sessionid", response.cookies)
+
+
+class SettingsTest(SimpleTestCase):
+    def load(self, **environ):
+        module = importlib.import_module("config.settings")
+        self.addCleanup(importlib.reload, module)
+
+        with mock.patch.dict("os.environ", environ):
+            return importlib.reload(module)
+
+    def test_invalidated_caches_need_a_shared_cache(self):
+        for env_name in (
+            "DJANGO_MEMBERSHIP_CACHE_TIMEOUT",
+            "DJANGO_PAGE_CACHE_TIMEOUT",
+            "DJANGO_USER_CACHE_TIMEOUT",
+        ):
+            with self.subTest(env_name=env_name):
+                with self.assertRaises(ImproperlyConfigured):
+                    self.load(**{env_name: "60"})
+
+                config = self.load(
+                    DJANGO_CACHE_BACKEND="file", **{env_name: "60"}
+                )
+                setting = env_name.replace("DJANGO_", "AGENCY_", 1)
+                self.assertEqual(getattr(config, setting), 60)
+
+
+class GunicornConfigTest(SimpleTestCase):
+    def load(self, **environ):
+        with mock.patch.dict("os.environ", environ):
+            return importlib.reload(importlib.import_module("config.gunicorn"))
+
+    def test_defaults(self):
+        with mock.patch("os.sched_getaffinity", return_value={0, 1, 2}):
+            config = self.load(PORT="9000")
+
+        self.assertTrue(config.preload_app)
+        self.assertEqual(config.worker_class, "gthread")
+        self.assertEqual(config.workers, 3)
+        self.assertEqual(config.bind, "0.0.0.0:9000")
+        self.assertEqual(config.max_requests, 1000)
+        self.assertEqual(config.max_requests_jitter, 100)
+
+    def test_environment_overrides(self):
+        config = self.load(
+            GUNICORN_WORKERS="5",
+            GUNICORN_THREADS="8",
+            GUNICORN_MAX_REQUESTS="200",
+            GUNICORN_PRELOAD_APP="False",
+            GUNICORN_WORKER_CLASS="uvicorn.workers.UvicornWorker",
+            GUNICORN_WORKER_TMP_DIR="/tmp",
+        )
+
+        self.assertFalse(config.preload_app)
+        self.assertEqual(config.worker_class, "uvicorn.workers.UvicornWorker")
+        self.assertEqual(config.worker_tmp_dir, "/tmp")
+        self.assertEqual(config.workers, 5)
+        self.assertEqual(config.threads, 8)
+        self.assertEqual(config.max_requests_jitter, 20)
+
+    def test_pre_fork_closes_connections(self):
+        config = self.load()
+        self.addCleanup(gc.unfreeze)
+        server = mock.Mock(cfg=mock.Mock(preload_app=True))
+
+        with mock.patch.object(connection, "close") as close:
+            config.pre_fork(server=server, worker=None)
+
+        close.assert_called()
+        self.assertGreater(gc.get_freeze_count(), 0)
+
+    def test_pre_fork_does_nothing_without_preload(self):
+        config = self.load(GUNICORN_PRELOAD_APP="False")
+        server = mock.Mock(cfg=mock.Mock(preload_app=config.preload_app))
+
+        with mock.patch.object(connection, "close") as close:
+            config.pre_fork(server=server, worker=None)
+
+        close.assert_not_called()
+        self.assertEqual(gc.get_freeze_count(), 0)
@@ -0,0 +1,40 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from agency.forms import NewspaperCreationForm
+from agency.models import Topic
+
+
+class NewspaperCreationFormTest(TestCase):
+    def setUp(self):
+        self.topic = Topic.objects.create(name="testTopic")
+        self.redactor = get_user_model().objects.create_user(
+            username="testUsername", password="testUserPassword"
+        )
+
+    def test_content_keeps_its_lines(self):
+        content = "First paragraph.\n\nSecond paragraph,\nstill going."
+        form = NewspaperCreationForm(
+            data={
+                "title": "testNewspaper",
+                "content": content,
+                "topic": self.topic.id,
+                "publishers": [self.redactor.id],
+            }
+        )
+
+        self.assertInHTML(
+            f'<textarea name="content" cols="40" rows="10" required '
+            f'id="id_content">\n{content}</textarea>',
+            str(form["content"]),
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+
+        newspaper = form.save()
+        newspaper.refresh_from_db()
+
+        self.assertEqual(newspaper.content, content)
+        self.assertEqual(
+            NewspaperCreationForm(instance=newspaper)["content"].value(),
+            content,
+        )
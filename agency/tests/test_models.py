@@ -0,0 +1,227 @@
+import importlib
+import zlib
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+
+from agency.counters import reconcile_counters
+from agency.exchange import newspaper_records
+from agency.models import Newspaper, Redactor, Topic
+from agency.search import search_newspapers
+
+
+class VersionedTest(TestCase):
+    def setUp(self):
+        self.redactor = get_user_model().objects.create_user(
+            username="testUsername", password="testUserPassword"
+        )
+
+    def test_saving_bumps_version_and_updated_at(self):
+        updated_at = self.redactor.updated_at
+        self.redactor.first_name = "Alice"
+        self.redactor.save(update_fields=["first_name"])
+        self.redactor.refresh_from_db()
+
+        self.assertEqual(self.redactor.version, 2)
+        self.assertGreater(self.redactor.updated_at, updated_at)
+
+    def test_logging_in_keeps_the_version(self):
+        updated_at = self.redactor.updated_at
+        self.client.login(
+            username="testUsername", password="testUserPassword"
+        )
+        self.redactor.refresh_from_db()
+
+        self.assertIsNotNone(self.redactor.last_login)
+        self.assertEqual(self.redactor.version, 1)
+        self.assertEqual(self.redactor.updated_at, updated_at)
+
+
+class ArticleCounterTest(TestCase):
+    def setUp(self):
+        self.topic = Topic.objects.create(name="testTopic")
+        self.other_topic = Topic.objects.create(name="otherTopic")
+        self.alice = get_user_model().objects.create(username="alice")
+        self.bob = get_user_model().objects.create(username="bob")
+        self.newspaper = Newspaper.objects.create(
+            title="testNewspaper", topic=self.topic
+        )
+
+    def assert_counts(self, topic, other_topic, alice, bob):
+        self.assertEqual(
+            [
+                Topic.objects.get(pk=self.topic.pk).newspaper_count,
+                Topic.objects.get(pk=self.other_topic.pk).newspaper_count,
+                Redactor.objects.get(pk=self.alice.pk).publication_count,
+                Redactor.objects.get(pk=self.bob.pk).publication_count,
+            ],
+            [topic, other_topic, alice, bob],
+        )
+
+    def test_counters_follow_publishers(self):
+        self.newspaper.publishers.add(self.alice, self.bob)
+        self.newspaper.publishers.add(self.alice)
+        self.assert_counts(1, 0, 1, 1)
+
+        self.bob.newspapers.remove(self.newspaper)
+        self.newspaper.publishers.remove(self.bob)
+        self.assert_counts(1, 0, 1, 0)
+
+        self.newspaper.publishers.clear()
+        self.assert_counts(1, 0, 0, 0)
+
+    def test_counters_follow_topic_changes_and_deletes(self):
+        self.newspaper.publishers.add(self.alice)
+        self.newspaper.topic = self.other_topic
+        self.newspaper.save()
+        self.assert_counts(0, 1, 1, 0)
+
+        self.newspaper.delete()
+        self.assert_counts(0, 0, 0, 0)
+
+    def test_reconcile_fixes_drift(self):
+        self.newspaper.publishers.add(self.alice)
+        Topic.objects.update(newspaper_count=7)
+        Redactor.objects.update(publication_count=0)
+
+        self.assertEqual(reconcile_counters(), {"topic": 2, "redactor": 1})
+        self.assert_counts(1, 0, 1, 0)
+        self.assertEqual(reconcile_counters(), {"topic": 0, "redactor": 0})
+
+
+class NewspaperExcerptTest(TestCase):
+    def setUp(self):
+        self.newspaper = Newspaper.objects.create(
+            title="testNewspaper",
+            content="word " * 1000,
+            topic=Topic.objects.create(name="testTopic"),
+        )
+
+    def test_excerpt_is_bounded(self):
+        self.assertEqual(
+            len(self.newspaper.excerpt), Newspaper.EXCERPT_LENGTH
+        )
+        self.assertTrue(self.newspaper.excerpt.endswith("…"))
+
+    def test_excerpt_follows_content_updates(self):
+        self.newspaper.content = "Short piece."
+        self.newspaper.save(update_fields=["content"])
+
+        self.assertEqual(
+            Newspaper.objects.get(pk=self.newspaper.pk).excerpt,
+            "Short piece.",
+        )
+
+
+class CompressedContentTest(TestCase):
+    def setUp(self):
+        self.content = "Harbour council votes on the budget. " * 200
+        self.newspaper = Newspaper.objects.create(
+            title="testNewspaper",
+            content=self.content,
+            topic=Topic.objects.create(name="testTopic"),
+        )
+
+    def test_content_is_stored_compressed(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT content FROM agency_newspaper WHERE id = %s",
+                [self.newspaper.id],
+            )
+            stored = bytes(cursor.fetchone()[0])
+
+        self.assertLess(len(stored), len(self.content) // 10)
+        self.assertEqual(zlib.decompress(stored).decode(), self.content)
+
+    def test_content_is_decompressed_on_first_read(self):
+        newspaper = Newspaper.objects.get(pk=self.newspaper.pk)
+
+        self.assertIsInstance(
+            newspaper.__dict__["content"], (bytes, memoryview)
+        )
+        self.assertEqual(newspaper.content, self.content)
+        self.assertIsInstance(newspaper.__dict__["content"], str)
+
+    def test_saving_unread_content_writes_it_back_unchanged(self):
+        newspaper = Newspaper.objects.get(pk=self.newspaper.pk)
+        newspaper.title = "Renamed"
+        field = Newspaper._meta.get_field("content")
+
+        with mock.patch.object(field, "compress") as compress:
+            newspaper.save()
+
+        compress.assert_not_called()
+        self.assertEqual(
+            Newspaper.objects.get(pk=self.newspaper.pk).content, self.content
+        )
+
+    def test_search_still_matches_content(self):
+        found = search_newspapers(Newspaper.objects.all(), "votes")
+
+        self.assertEqual(list(found), [self.newspaper])
+
+    def test_export_decompresses_content(self):
+        (record,) = newspaper_records(Newspaper.objects.all())
+
+        self.assertEqual(record["content"], self.content)
+
+
+class CompressContentMigrationTest(TransactionTestCase):
+    before = ("agency", "0009_newspaper_compressed_content")
+    latest = [("agency", "0011_newspaper_content_swap")]
+
+    def migrate(self, target):
+        executor = MigrationExecutor(connection)
+        executor.migrate(target)
+
+        return executor.loader.project_state(target).apps
+
+    def setUp(self):
+        self.addCleanup(self.migrate, self.latest)
+
+    def test_existing_rows_are_compressed(self):
+        old_apps = self.migrate([self.before])
+        topic = old_apps.get_model("agency", "Topic").objects.create(
+            name="Topic", slug="topic"
+        )
+        old_apps.get_model("agency", "Newspaper").objects.bulk_create(
+            old_apps.get_model("agency", "Newspaper")(
+                title=f"Newspaper {number}",
+                content=f"Content {number}",
+                topic_id=topic.id,
+            )
+            for number in range(3)
+        )
+
+        conversion = importlib.import_module(
+            "agency.migrations.0010_compress_newspaper_content"
+        )
+
+        with mock.patch.object(conversion, "BATCH_SIZE", 2):
+            self.migrate(self.latest)
+
+        self.assertEqual(
+            [n.content for n in Newspaper.objects.order_by("id")],
+            ["Content 0", "Content 1", "Content 2"],
+        )
+
+    def test_reverse_restores_text(self):
+        Newspaper.objects.create(
+            title="Newspaper",
+            content="Content",
+            topic=Topic.objects.create(name="Topic"),
+        )
+
+        old_apps = self.migrate([("agency", "0008_deletion_jobs")])
+
+        self.assertEqual(
+            list(
+                old_apps.get_model("agency", "Newspaper").objects.values_list(
+                    "content", flat=True
+                )
+            ),
+            ["Content"],
+        )
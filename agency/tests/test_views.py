@@ -0,0 +1,907 @@
+import json
+import os
+import tempfile
+import time
+from asyncio import iscoroutinefunction
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import resolve, reverse
+
+from agency.models import DeletionJob, Newspaper, Topic
+from agency.profiling import store
+from agency.search import (
+    SqliteSearchBackend,
+    _backends,
+    get_search_backend,
+)
+from agency.tests.helpers import QueryBudgetMixin, sqlite_database
+from agency.topics import get_topic_table
+from agency.warmup import warm_templates
+from config.routers import PIN_COOKIE, health
+
+NEWSPAPER_LIST_URL = reverse("agency:newspaper-list")
+TOPIC_LIST_URL = reverse("agency:topic-list")
+
+
+class NewspaperSearchTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.topic = Topic.objects.create(name="testTopic")
+        self.in_content = Newspaper.objects.create(
+            title="Local news",
+            content="The election results were announced today.",
+            topic=self.topic,
+        )
+        self.in_title = Newspaper.objects.create(
+            title="Election night",
+            content="Polling stations closed at ten.",
+            topic=self.topic,
+        )
+        self.unrelated = Newspaper.objects.create(
+            title="Weather",
+            content="Sunny with light clouds.",
+            topic=self.topic,
+        )
+
+    def search(self, query: str) -> list:
+        response = self.client.get(
+            NEWSPAPER_LIST_URL, {"query_search": query}
+        )
+        return list(response.context["newspaper_list"])
+
+    def test_search_ranks_title_matches_first(self):
+        self.assertEqual(
+            self.search("election"), [self.in_title, self.in_content]
+        )
+
+    def test_list_is_newest_first_without_a_search(self):
+        response = self.client.get(NEWSPAPER_LIST_URL)
+
+        self.assertEqual(
+            list(response.context["newspaper_list"]),
+            [self.unrelated, self.in_title, self.in_content],
+        )
+
+    def test_search_ignores_query_syntax(self):
+        self.assertEqual(self.search('"election" OR*'), [])
+
+    def test_index_follows_save_and_delete(self):
+        self.unrelated.content = "A late election recount."
+        self.unrelated.save()
+        self.assertIn(self.unrelated, self.search("recount"))
+
+        self.in_title.delete()
+        self.assertCountEqual(
+            self.search("election"), [self.unrelated, self.in_content]
+        )
+
+    def test_rebuild_search_index_chooses_backend_again(self):
+        stale = _backends["default"] = SqliteSearchBackend("default")
+        self.addCleanup(_backends.clear)
+
+        call_command("rebuild_search_index", stdout=StringIO())
+
+        self.assertIsNot(get_search_backend(), stale)
+
+    def test_missing_index_fails_loudly(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "unindexed.sqlite3")
+
+        with sqlite_database("unindexed", path):
+            with self.assertRaises(ImproperlyConfigured):
+                get_search_backend("unindexed")
+
+        self.assertNotIn("unindexed", _backends)
+
+    def test_rebuild_search_index(self):
+        get_search_backend().clear()
+        self.assertEqual(self.search("election"), [])
+
+        call_command("rebuild_search_index", stdout=StringIO())
+        self.assertEqual(
+            self.search("election"), [self.in_title, self.in_content]
+        )
+
+
+class NewspaperExportTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.redactor = get_user_model().objects.create(username="editor")
+        self.client.force_login(self.redactor)
+        self.async_client.force_login(self.redactor)
+        self.url = reverse("agency:newspaper-export")
+
+        politics = Topic.objects.create(name="Politics")
+        sport = Topic.objects.create(name="Sport")
+        self.election = Newspaper.objects.create(
+            title="Election night", content="Votes counted.", topic=politics
+        )
+        self.election.publishers.add(self.redactor)
+        Newspaper.objects.create(
+            title="Cup final", content="Votes for the MVP.", topic=sport
+        )
+
+    def export(self, **params) -> list:
+        response = self.client.get(self.url, params)
+        self.assertTrue(response.streaming)
+
+        return b"".join(response.streaming_content).decode().splitlines()
+
+    def test_csv_export_reuses_list_filters(self):
+        lines = self.export(topic_name=self.election.topic_id)
+
+        self.assertEqual(len(lines), 2)
+        self.assertIn("Election night", lines[1])
+        self.assertIn("Politics", lines[1])
+        self.assertTrue(lines[1].endswith(",editor"))
+
+    def test_jsonl_export_reuses_search(self):
+        lines = self.export(format="jsonl", query_search="votes")
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(
+            json.loads(lines[0])["publishers"]
+            + json.loads(lines[1])["publishers"],
+            ["editor"],
+        )
+
+    async def test_export_streams_asynchronously_under_asgi(self):
+        response = await self.async_client.get(self.url, {"format": "jsonl"})
+
+        self.assertTrue(response.is_async)
+        lines = b"".join(
+            [chunk async for chunk in response.streaming_content]
+        ).splitlines()
+        self.assertEqual(len(lines), 2)
+
+    def test_export_requires_login(self):
+        self.client.logout()
+
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+
+
+class QueryBudgetTest(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.redactor = get_user_model().objects.create_user(
+            username="testUsername",
+            password="testUserPassword",
+        )
+
+        for number in range(5):
+            newspaper = Newspaper.objects.create(
+                title=f"testNewspaper{number}",
+                topic=Topic.objects.create(name=f"testTopic{number}"),
+            )
+            newspaper.publishers.add(self.redactor)
+
+    def test_newspaper_list_query_budget(self):
+        with self.assert_query_budget(5):
+            response = self.client.get(NEWSPAPER_LIST_URL)
+
+        self.assertContains(response, "testTopic4")
+
+    def test_newspaper_list_leaves_content_behind(self):
+        with self.assert_query_budget(5) as context:
+            self.client.get(NEWSPAPER_LIST_URL)
+
+        rows = [
+            query["sql"]
+            for query in context.captured_queries
+            if '"agency_newspaper"."excerpt"' in query["sql"]
+        ]
+        self.assertEqual(len(rows), 1)
+        self.assertNotIn('"agency_newspaper"."content"', rows[0])
+
+    def test_redactor_detail_query_budget(self):
+        url = reverse("agency:redactor-detail", args=[self.redactor.id])
+
+        with self.assert_query_budget(3):
+            response = self.client.get(url)
+
+        self.assertContains(response, "testTopic4")
+
+    def test_budget_overrun_fails(self):
+        with self.assertRaises(AssertionError):
+            with self.assert_query_budget(0):
+                Topic.objects.count()
+
+
+class NewspaperAccessTest(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.publishers = get_user_model().objects.bulk_create(
+            get_user_model()(username=f"publisher{number:03}")
+            for number in range(100)
+        )
+        self.newspaper = Newspaper.objects.create(
+            title="testNewspaper",
+            topic=Topic.objects.create(name="testTopic"),
+        )
+        self.newspaper.publishers.set(self.publishers)
+        self.detail_url = reverse(
+            "agency:newspaper-detail", args=[self.newspaper.id]
+        )
+        self.delete_url = reverse(
+            "agency:newspaper-delete", args=[self.newspaper.id]
+        )
+
+    def test_detail_query_budget_with_many_publishers(self):
+        self.client.force_login(self.publishers[-1])
+
+        # Validators, session, user, groups, newspaper, publishers and
+        # ownership.
+        with self.assert_query_budget(7):
+            response = self.client.get(self.detail_url)
+
+        self.assertTrue(response.context["can_edit"])
+        self.assertTrue(response.context["can_delete"])
+
+    def test_outsider_cannot_edit_or_delete(self):
+        outsider = get_user_model().objects.create(username="outsider")
+        self.client.force_login(outsider)
+        response = self.client.get(self.detail_url)
+
+        self.assertFalse(response.context["can_edit"])
+        self.assertFalse(response.context["can_delete"])
+        self.assertEqual(self.client.get(self.delete_url).status_code, 403)
+
+    def test_any_publisher_can_delete(self):
+        self.client.force_login(self.publishers[-1])
+        self.client.post(self.delete_url)
+
+        self.assertFalse(Newspaper.objects.exists())
+
+
+@override_settings(AGENCY_PAGE_CACHE_TIMEOUT=300)
+class PageCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.topic = Topic.objects.create(name="testTopic")
+        self.newspaper = Newspaper.objects.create(
+            title="testNewspaper", topic=self.topic
+        )
+        self.other = Newspaper.objects.create(
+            title="otherNewspaper", topic=self.topic
+        )
+        self.detail_url = reverse(
+            "agency:newspaper-detail", args=[self.newspaper.id]
+        )
+
+    def test_anonymous_pages_served_from_cache(self):
+        self.client.get(NEWSPAPER_LIST_URL)
+        self.client.get(self.detail_url)
+
+        # Only the ETag/Last-Modified lookups reach the database: the last
+        # topic and newspaper changes for the list, one row for the detail.
+        with self.assertNumQueries(3):
+            self.assertContains(
+                self.client.get(NEWSPAPER_LIST_URL), "testNewspaper"
+            )
+            self.assertContains(
+                self.client.get(self.detail_url), "testNewspaper"
+            )
+
+    def test_query_string_is_part_of_the_key(self):
+        self.client.get(NEWSPAPER_LIST_URL)
+        response = self.client.get(NEWSPAPER_LIST_URL, {"query_search": "x"})
+
+        self.assertNotContains(response, "testNewspaper")
+
+    def test_edit_expires_only_dependent_pages(self):
+        self.client.get(self.detail_url)
+        self.client.get(TOPIC_LIST_URL)
+
+        self.other.title = "renamedNewspaper"
+        self.other.save()
+
+        with self.assertNumQueries(2):
+            self.client.get(self.detail_url)
+            self.client.get(TOPIC_LIST_URL)
+
+        self.assertContains(
+            self.client.get(NEWSPAPER_LIST_URL), "renamedNewspaper"
+        )
+
+    def test_publisher_change_expires_detail_page(self):
+        self.client.get(self.detail_url)
+        redactor = get_user_model().objects.create(username="newPublisher")
+        self.newspaper.publishers.add(redactor)
+
+        self.assertContains(self.client.get(self.detail_url), "newPublisher")
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.newspaper = Newspaper.objects.create(
+            title="testNewspaper",
+            topic=Topic.objects.create(name="testTopic"),
+        )
+        self.detail_url = reverse(
+            "agency:newspaper-detail", args=[self.newspaper.id]
+        )
+
+    def revalidate(self, url: str, response):
+        return self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=response["ETag"],
+            HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+        )
+
+    def test_unchanged_pages_are_not_modified(self):
+        # Only the validator queries, the page is never rendered.
+        for url, queries in (
+            (NEWSPAPER_LIST_URL, 2),
+            (self.detail_url, 1),
+            (TOPIC_LIST_URL, 1),
+        ):
+            response = self.client.get(url)
+
+            with self.assertNumQueries(queries):
+                revalidated = self.revalidate(url, response)
+
+            self.assertEqual(revalidated.status_code, 304)
+
+    def test_save_bumps_version_and_etag(self):
+        response = self.client.get(self.detail_url)
+
+        self.newspaper.title = "renamedNewspaper"
+        self.newspaper.save()
+        self.newspaper.refresh_from_db()
+
+        self.assertEqual(self.newspaper.version, 2)
+        self.assertEqual(
+            self.revalidate(self.detail_url, response).status_code, 200
+        )
+
+    def test_deleting_an_older_newspaper_changes_list_etag(self):
+        Newspaper.objects.create(
+            title="laterNewspaper", topic=self.newspaper.topic
+        )
+        response = self.client.get(NEWSPAPER_LIST_URL)
+
+        self.newspaper.delete()
+
+        self.assertEqual(
+            self.revalidate(NEWSPAPER_LIST_URL, response).status_code, 200
+        )
+
+    def test_publisher_change_bumps_etag(self):
+        response = self.client.get(self.detail_url)
+        redactor = get_user_model().objects.create(username="publisher")
+        self.newspaper.publishers.add(redactor)
+
+        self.assertEqual(
+            self.revalidate(self.detail_url, response).status_code, 200
+        )
+
+    def test_etag_differs_per_user(self):
+        response = self.client.get(self.detail_url)
+        self.client.force_login(
+            get_user_model().objects.create(username="reader")
+        )
+
+        self.assertEqual(
+            self.revalidate(self.detail_url, response).status_code, 200
+        )
+
+
+# The only process of the tests trivially shares its cache.
+@override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cached_db")
+class MembershipTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.mod_group = Group.objects.create(name="Mod")
+        self.redactor = get_user_model().objects.create_user(
+            username="testUsername",
+            password="testUserPassword",
+        )
+        self.client.force_login(self.redactor)
+
+    def test_mod_controls_follow_group_membership(self):
+        response = self.client.get(TOPIC_LIST_URL)
+        self.assertNotContains(response, reverse("agency:topic-create"))
+
+        self.redactor.groups.add(self.mod_group)
+        response = self.client.get(TOPIC_LIST_URL)
+        self.assertContains(response, reverse("agency:topic-create"))
+
+    @override_settings(AGENCY_MEMBERSHIP_CACHE_TIMEOUT=60)
+    def test_membership_cached_across_requests(self):
+        self.redactor.groups.add(self.mod_group)
+        self.client.get(TOPIC_LIST_URL)
+
+        # Validators, user lookup, then the topic list; the session is
+        # read from the cache.
+        with self.assertNumQueries(3):
+            response = self.client.get(TOPIC_LIST_URL)
+
+        self.assertContains(response, reverse("agency:topic-create"))
+
+        self.redactor.groups.remove(self.mod_group)
+        response = self.client.get(TOPIC_LIST_URL)
+        self.assertNotContains(response, reverse("agency:topic-create"))
+
+    @override_settings(
+        AGENCY_MEMBERSHIP_CACHE_TIMEOUT=60, AGENCY_USER_CACHE_TIMEOUT=60
+    )
+    def test_authentication_costs_no_queries_once_cached(self):
+        self.client.get(TOPIC_LIST_URL)
+
+        # Only the validators and the topic list.
+        with self.assertNumQueries(2):
+            self.client.get(TOPIC_LIST_URL)
+
+        self.redactor.is_active = False
+        self.redactor.save()
+
+        self.assertRedirects(
+            self.client.get(reverse("agency:newspaper-create")),
+            f"{reverse('login')}?next={reverse('agency:newspaper-create')}",
+        )
+
+
+@override_settings(AGENCY_CURSOR_PAGINATION=True)
+class CursorPaginationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.topics = [
+            Topic.objects.create(name=f"topic{number:02}")
+            for number in range(12)
+        ]
+
+    def get_page(self, **params) -> dict:
+        return self.client.get(TOPIC_LIST_URL, params).context
+
+    def test_pages_follow_cursors_without_count(self):
+        # Validators, then the page itself.
+        with self.assertNumQueries(2):
+            first = self.get_page()
+
+        self.assertEqual(list(first["topic_list"]), self.topics[:5])
+        self.assertFalse(first["page_obj"].has_previous())
+
+        second = self.get_page(cursor=first["page_obj"].next_cursor)
+        self.assertEqual(list(second["topic_list"]), self.topics[5:10])
+
+        last = self.get_page(cursor=second["page_obj"].next_cursor)
+        self.assertEqual(list(last["topic_list"]), self.topics[10:])
+        self.assertFalse(last["page_obj"].has_next())
+
+        back = self.get_page(cursor=last["page_obj"].previous_cursor)
+        self.assertEqual(list(back["topic_list"]), self.topics[5:10])
+
+    def test_next_link_replaces_page_param(self):
+        response = self.client.get(TOPIC_LIST_URL, {"page": 1})
+        next_cursor = response.context["page_obj"].next_cursor
+
+        self.assertContains(response, f"?cursor={next_cursor}")
+
+    def test_invalid_cursor_is_not_found(self):
+        response = self.client.get(TOPIC_LIST_URL, {"cursor": "garbage"})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_newspaper_pages_are_keyed_on_date_and_id(self):
+        topic = Topic.objects.create(name="paged")
+        newspapers = [
+            Newspaper.objects.create(title=f"n{number}", topic=topic)
+            for number in range(7)
+        ]
+        first = self.client.get(NEWSPAPER_LIST_URL).context
+        second = self.client.get(
+            NEWSPAPER_LIST_URL, {"cursor": first["page_obj"].next_cursor}
+        ).context
+
+        self.assertEqual(
+            list(first["newspaper_list"]) + list(second["newspaper_list"]),
+            newspapers[::-1],
+        )
+
+
+class TopicRoutingTest(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.sport = Topic.objects.create(name="Sport news")
+        self.other = Topic.objects.create(name="Sport  News!")
+        self.match = Newspaper.objects.create(title="Final", topic=self.sport)
+        Newspaper.objects.create(title="Budget", topic=self.other)
+
+    def test_slugs_are_unique(self):
+        self.assertEqual(self.sport.slug, "sport-news")
+        self.assertEqual(self.other.slug, "sport-news-2")
+
+    def test_by_topic_route_filters_newspapers(self):
+        url = reverse("agency:newspaper-list-by-topic", args=["sport-news"])
+        response = self.client.get(url)
+
+        self.assertEqual(
+            list(response.context["newspaper_list"]), [self.match]
+        )
+
+    def test_unknown_topic_slug_is_not_found(self):
+        url = reverse("agency:newspaper-list-by-topic", args=["missing"])
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_topic_lookups_are_served_from_memory(self):
+        url = reverse("agency:newspaper-list-by-topic", args=["sport-news"])
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            self.assertIsNotNone(get_topic_table().get_by_slug("sport-news"))
+
+        # Same queries as the unfiltered list: the topic resolves for free.
+        with self.assert_query_budget(4):
+            self.client.get(url, {"topic_name": self.sport.id})
+
+    def test_table_follows_topic_changes(self):
+        get_topic_table()
+        Topic.objects.create(name="Weather")
+
+        self.assertIsNotNone(get_topic_table().get_by_slug("weather"))
+
+    @override_settings(AGENCY_TOPIC_TABLE_TIMEOUT=30)
+    def test_table_expires_without_signals(self):
+        get_topic_table()
+        # Written by another process: no signal reaches this one.
+        Topic.objects.bulk_create([Topic(name="Weather", slug="weather")])
+
+        self.assertIsNone(get_topic_table().get_by_slug("weather"))
+
+        with mock.patch(
+            "agency.topics.time.monotonic",
+            return_value=time.monotonic() + 31,
+        ):
+            self.assertIsNotNone(get_topic_table().get_by_slug("weather"))
+
+
+class NewspaperFormTest(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.topic = Topic.objects.create(name="testTopic")
+        self.redactor = get_user_model().objects.create_user(
+            username="alice", password="testUserPassword"
+        )
+        get_user_model().objects.bulk_create(
+            get_user_model()(username=f"bob{number}") for number in range(30)
+        )
+        self.client.force_login(self.redactor)
+
+    def test_create_form_renders_only_selected_publishers(self):
+        url = reverse("agency:newspaper-create")
+        self.client.get(url)
+
+        # Session and user only: topics come from the in-memory table.
+        with self.assert_query_budget(2):
+            response = self.client.get(url)
+
+        self.assertContains(response, "testTopic")
+        self.assertContains(response, "data-autocomplete-url")
+        self.assertNotContains(response, "bob1")
+
+    def test_create_form_saves_publishers(self):
+        response = self.client.post(
+            reverse("agency:newspaper-create"),
+            {
+                "title": "testNewspaper",
+                "content": "content",
+                "topic": self.topic.id,
+                "publishers": [self.redactor.id],
+            },
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(
+            Newspaper.objects.get().has_publisher(self.redactor)
+        )
+
+    def test_autocomplete_matches_username_prefix(self):
+        response = self.client.get(
+            reverse("agency:redactor-autocomplete"), {"q": "bob2"}
+        )
+
+        self.assertEqual(
+            [result["text"] for result in response.json()["results"]],
+            ["bob2", *(f"bob2{number}" for number in range(10))],
+        )
+
+
+class PopularitySortTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.quiet = Topic.objects.create(name="aQuiet")
+        self.busy = Topic.objects.create(name="zBusy")
+
+        for number in range(3):
+            Newspaper.objects.create(title=f"n{number}", topic=self.busy)
+
+    def test_topics_sorted_and_filtered_by_newspaper_count(self):
+        response = self.client.get(TOPIC_LIST_URL, {"sort": "popular"})
+        self.assertEqual(
+            list(response.context["topic_list"]), [self.busy, self.quiet]
+        )
+
+        response = self.client.get(TOPIC_LIST_URL, {"min_newspapers": 2})
+        self.assertEqual(list(response.context["topic_list"]), [self.busy])
+        self.assertContains(response, "<td>3</td>", html=True)
+
+
+@override_settings(AGENCY_PROFILING=True)
+class ProfilingTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        store.clear()
+        self.staff = get_user_model().objects.create_user(
+            username="staff", password="testUserPassword", is_staff=True
+        )
+        topic = Topic.objects.create(name="testTopic")
+        Newspaper.objects.create(title="testNewspaper", topic=topic)
+
+    def test_records_requests_per_view(self):
+        self.client.get(NEWSPAPER_LIST_URL)
+        self.client.get(NEWSPAPER_LIST_URL)
+
+        profile = store.snapshot()["agency:newspaper-list"]
+        sample = profile.samples[-1]
+
+        self.assertEqual(profile.count, 2)
+        self.assertGreater(sample.queries, 0)
+        self.assertGreater(sample.render, 0)
+        self.assertLessEqual(sample.sql + sample.render, sample.wall)
+
+    def test_stats_page_is_staff_only(self):
+        url = reverse("agency:profiling-stats")
+        self.client.get(NEWSPAPER_LIST_URL)
+
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        self.client.force_login(self.staff)
+        self.assertContains(self.client.get(url), "agency:newspaper-list")
+
+    @override_settings(AGENCY_PROFILING_METRICS_TOKEN="secret")
+    def test_metrics_accept_a_bearer_token(self):
+        url = reverse("agency:profiling-metrics")
+        self.client.get(NEWSPAPER_LIST_URL)
+
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        response = self.client.get(url, HTTP_AUTHORIZATION="Bearer secret")
+        self.assertContains(
+            response,
+            'agency_request_queries_count{view="agency:newspaper-list"} 1',
+        )
+
+    @override_settings(AGENCY_PROFILING=False)
+    def test_disabled_profiling_records_nothing(self):
+        self.client.get(NEWSPAPER_LIST_URL)
+
+        self.assertEqual(store.snapshot(), {})
+        self.assertEqual(
+            self.client.get(reverse("agency:profiling-metrics")).status_code,
+            404,
+        )
+
+
+@override_settings(ROOT_URLCONF="agency.tests.async_urls")
+class AsyncViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.topic = Topic.objects.create(name="testTopic")
+        self.redactor = get_user_model().objects.create_user(
+            username="testUsername", password="testUserPassword"
+        )
+
+        for number in range(7):
+            newspaper = Newspaper.objects.create(
+                title=f"testNewspaper{number}", topic=self.topic
+            )
+            newspaper.publishers.add(self.redactor)
+
+        self.newspaper = newspaper
+
+    async def test_read_views_render_under_the_async_handler(self):
+        match = resolve(NEWSPAPER_LIST_URL)
+        self.assertTrue(iscoroutinefunction(match.func))
+
+        urls = [
+            NEWSPAPER_LIST_URL,
+            f"{NEWSPAPER_LIST_URL}?page=2",
+            TOPIC_LIST_URL,
+            reverse("agency:redactor-list"),
+            reverse("agency:newspaper-detail", args=[self.newspaper.id]),
+            reverse("agency:redactor-detail", args=[self.redactor.id]),
+        ]
+
+        for url in urls:
+            with self.subTest(url=url):
+                response = await self.async_client.get(url)
+                self.assertEqual(response.status_code, 200)
+
+        response = await self.async_client.get(NEWSPAPER_LIST_URL, {"page": 2})
+        self.assertContains(response, "testNewspaper0")
+        self.assertNotContains(response, "testNewspaper6")
+
+    @override_settings(AGENCY_CURSOR_PAGINATION=True)
+    async def test_missing_objects_and_pages_are_not_found(self):
+        urls = [
+            reverse("agency:newspaper-detail", args=[0]),
+            f"{TOPIC_LIST_URL}?cursor=garbage",
+        ]
+
+        for url in urls:
+            with self.subTest(url=url):
+                response = await self.async_client.get(url)
+                self.assertEqual(response.status_code, 404)
+
+    async def test_conditional_get_is_answered_without_rendering(self):
+        url = TOPIC_LIST_URL
+        response = await self.async_client.get(url)
+
+        response = await self.async_client.get(
+            url, headers={"If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+
+
+@override_settings(
+    AGENCY_DATABASE_REPLICAS=["replica"], AGENCY_PAGE_CACHE_TIMEOUT=0
+)
+class ReplicaRoutingTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        health.clear()
+        self.addCleanup(health.clear)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.replica_path = os.path.join(directory.name, "replica.sqlite3")
+
+        Topic.objects.create(name="primaryTopic")
+
+    def replica(self):
+        return sqlite_database("replica", self.replica_path, [Topic])
+
+    def test_list_reads_come_from_the_replica(self):
+        with self.replica() as replica:
+            Topic.objects.using(replica.alias).bulk_create(
+                [Topic(name="replicaTopic", slug="replicatopic")]
+            )
+            response = self.client.get(TOPIC_LIST_URL)
+
+        self.assertContains(response, "replicaTopic")
+        self.assertNotContains(response, "primaryTopic")
+
+    def test_writers_are_pinned_to_the_primary(self):
+        get_user_model().objects.create_user(
+            username="writer", password="testUserPassword"
+        )
+
+        with self.replica():
+            response = self.client.post(
+                reverse("login"),
+                {"username": "writer", "password": "testUserPassword"},
+            )
+            self.assertIn(PIN_COOKIE, response.cookies)
+
+            response = self.client.get(TOPIC_LIST_URL)
+
+        self.assertContains(response, "primaryTopic")
+
+    def test_unhealthy_replica_fails_over_to_the_primary(self):
+        missing = os.path.join(self.replica_path, "missing", "db.sqlite3")
+
+        with sqlite_database("replica", missing):
+            response = self.client.get(TOPIC_LIST_URL)
+
+        self.assertContains(response, "primaryTopic")
+
+    def test_failing_replica_read_is_retried_on_the_primary(self):
+        # The replica answers health checks but has no tables.
+        with sqlite_database("replica", self.replica_path):
+            response = self.client.get(TOPIC_LIST_URL)
+
+            self.assertFalse(health.is_healthy("replica"))
+
+        self.assertContains(response, "primaryTopic")
+
+
+class TemplateWarmupTest(TestCase):
+    def test_every_project_template_compiles(self):
+        names = warm_templates()
+
+        self.assertIn("base.html", names)
+        self.assertIn("agency/newspaper_list.html", names)
+        self.assertIn("registration/login.html", names)
+
+
+class ScheduledDeletionTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = get_user_model().objects.create_superuser(
+            username="admin", password="testUserPassword"
+        )
+        self.client.force_login(self.admin)
+        self.redactor = get_user_model().objects.create_user(
+            username="doomedRedactor", password="testUserPassword"
+        )
+        self.topic = Topic.objects.create(name="doomedTopic")
+        self.newspapers = [
+            Newspaper.objects.create(
+                title=f"doomedNewspaper{number}", topic=self.topic
+            )
+            for number in range(3)
+        ]
+        self.newspapers[0].publishers.add(self.redactor)
+
+    def test_deleting_a_topic_hides_it_and_its_newspapers(self):
+        response = self.client.post(
+            reverse("agency:topic-delete", args=[self.topic.id])
+        )
+
+        self.assertRedirects(response, TOPIC_LIST_URL)
+        self.assertEqual(Newspaper.objects.filter(topic=self.topic).count(), 3)
+        self.assertNotContains(self.client.get(TOPIC_LIST_URL), "doomedTopic")
+        self.assertNotContains(
+            self.client.get(NEWSPAPER_LIST_URL), "doomedNewspaper"
+        )
+        self.assertEqual(
+            self.client.get(
+                reverse(
+                    "agency:newspaper-detail", args=[self.newspapers[0].id]
+                )
+            ).status_code,
+            404,
+        )
+
+        job = DeletionJob.objects.get()
+        self.assertEqual(
+            (job.target, job.object_id, job.status, job.total),
+            (DeletionJob.TOPIC, self.topic.id, DeletionJob.PENDING, 3),
+        )
+
+    @override_settings(AGENCY_PAGE_CACHE_TIMEOUT=300)
+    def test_deleting_a_topic_expires_its_newspaper_pages(self):
+        url = reverse("agency:newspaper-detail", args=[self.newspapers[0].id])
+        # Served from the page cache, unlike the pages of signed-in users.
+        reader = self.client_class()
+        etags = {
+            client: client.get(url)["ETag"] for client in (self.client, reader)
+        }
+
+        self.client.post(reverse("agency:topic-delete", args=[self.topic.id]))
+
+        for client, etag in etags.items():
+            self.assertEqual(client.get(url).status_code, 404)
+            self.assertEqual(
+                client.get(url, headers={"If-None-Match": etag}).status_code,
+                404,
+            )
+
+    def test_deleting_a_redactor_deactivates_and_hides_them(self):
+        self.client.post(
+            reverse("agency:redactor-delete", args=[self.redactor.id])
+        )
+        self.redactor.refresh_from_db()
+
+        self.assertTrue(self.redactor.pending_deletion)
+        self.assertFalse(self.redactor.is_active)
+        self.assertNotContains(
+            self.client.get(reverse("agency:redactor-list")),
+            "doomedRedactor",
+        )
+        self.assertEqual(
+            self.client.get(
+                reverse("agency:redactor-detail", args=[self.redactor.id])
+            ).status_code,
+            404,
+        )
+        self.assertEqual(DeletionJob.objects.get().total, 1)
@@ -0,0 +1,80 @@
+import time
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+
+from agency import page_cache
+from agency.models import Topic
+
+
+class TopicEntry(NamedTuple):
+    pk: int
+    name: str
+    slug: str
+
+
+class TopicTable:
+    """
+    Every topic's id, name and slug, ordered by name. Small enough to keep
+    in memory and read on nearly every newspaper page. Topics pending
+    deletion are left out; their ids are in ``hidden_ids``.
+    """
+
+    def __init__(self, entries: list, hidden_ids: frozenset = frozenset()):
+        self.entries = entries
+        self.hidden_ids = hidden_ids
+        self.by_id = {entry.pk: entry for entry in entries}
+        self.by_slug = {entry.slug: entry for entry in entries}
+
+    def choices(self) -> list:
+        return [(entry.pk, entry.name) for entry in self.entries]
+
+    def get_by_slug(self, slug: str) -> Optional[TopicEntry]:
+        return self.by_slug.get(slug)
+
+
+_table = None
+_generation = None
+_loaded_at = 0.0
+
+
+def get_topic_table() -> TopicTable:
+    """
+    Process-local topic table, reloaded when the ``TOPICS`` page cache
+    generation moves or after ``AGENCY_TOPIC_TABLE_TIMEOUT`` seconds.
+    Topic signals bump that generation, which other processes see only
+    through a cache they share; with the per-process default cache their
+    tables catch up within the timeout.
+    """
+    global _table, _generation, _loaded_at
+
+    (generation,) = page_cache.get_generations([page_cache.TOPICS])
+    now = time.monotonic()
+
+    if (
+        _table is None
+        or generation != _generation
+        or now - _loaded_at >= settings.AGENCY_TOPIC_TABLE_TIMEOUT
+    ):
+        entries = []
+        hidden_ids = set()
+
+        for *row, pending_deletion in Topic.objects.order_by(
+            "name", "id"
+        ).values_list("id", "name", "slug", "pending_deletion"):
+            if pending_deletion:
+                hidden_ids.add(row[0])
+            else:
+                entries.append(TopicEntry(*row))
+
+        _table = TopicTable(entries, frozenset(hidden_ids))
+        _generation = generation
+        _loaded_at = now
+
+    return _table
+
+
+def clear_topic_table() -> None:
+    global _table
+
+    _table = None
@@ -6,6 +6,7 @@ from agency.views import (
     NewspaperListView,
     RedactorListView,
     NewspaperDetailView,
+    NewspaperExportView,
     RedactorDetailView,
     NewspaperCreateView,
     NewspaperUpdateView,
@@ -13,9 +14,12 @@ from agency.views import (
     TopicCreateView,
     TopicUpdateView,
     TopicDeleteView,
+    RedactorAutocompleteView,
     RedactorRegisterView,
     RedactorUpdateView,
     RedactorDeleteView,
+    profiling_metrics_view,
+    profiling_stats_view,
 )
 
 
@@ -42,6 +46,11 @@ urlpatterns = [
         NewspaperListView.as_view(),
         name="newspaper-list"
     ),
+    path(
+        "newspapers/export/",
+        NewspaperExportView.as_view(),
+        name="newspaper-export",
+    ),
     path(
         "newspapers/<int:pk>/",
         NewspaperDetailView.as_view(),
@@ -61,7 +70,7 @@ urlpatterns = [
         delete_newspaper_view,
         name="newspaper-delete"),
     path(
-        "newspapers/by-topic/<str:topic_name>/",
+        "newspapers/by-topic/<slug:topic_slug>/",
         NewspaperListView.as_view(),
         name="newspaper-list-by-topic",
     ),
@@ -70,6 +79,11 @@ urlpatterns = [
         RedactorListView.as_view(),
         name="redactor-list"
     ),
+    path(
+        "redactors/autocomplete/",
+        RedactorAutocompleteView.as_view(),
+        name="redactor-autocomplete",
+    ),
     path(
         "redactors/<int:pk>/",
         RedactorDetailView.as_view(),
@@ -90,6 +104,16 @@ urlpatterns = [
         RedactorRegisterView.as_view(),
         name="sign-up"
     ),
+    path(
+        "profiling/",
+        profiling_stats_view,
+        name="profiling-stats",
+    ),
+    path(
+        "profiling/metrics/",
+        profiling_metrics_view,
+        name="profiling-metrics",
+    ),
 ]
 
 app_name = "agency"
@@ -1,5 +1,17 @@
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth import get_user_model
-from django.http import HttpResponseForbidden
+from django.core.handlers.asgi import ASGIRequest
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseBadRequest,
+    HttpResponseForbidden,
+    HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 
 from django.contrib.auth.mixins import (
     LoginRequiredMixin,
@@ -14,10 +26,34 @@ from django.shortcuts import (
 )
 
 from django.urls import reverse_lazy
+from django.utils.crypto import constant_time_compare
+from django.utils.decorators import classonlymethod, method_decorator
 from django.views import generic
 from django.db.models import Q, QuerySet
 
+from agency.deletion import schedule_deletion
+from agency.exchange import (
+    FORMATS,
+    async_lines,
+    csv_lines,
+    jsonl_lines,
+    newspaper_records,
+)
+from agency.membership import get_membership
+from agency import page_cache
+from agency.conditional import (
+    conditional_page,
+    newspaper_list_state,
+    newspaper_detail_state,
+    redactor_list_state,
+    redactor_detail_state,
+    topic_list_state,
+)
 from agency.models import Redactor, Newspaper, Topic
+from agency.pagination import CursorPaginationMixin
+from agency.profiling import prometheus_metrics, store
+from agency.search import search_newspapers
+from agency.topics import get_topic_table
 from agency.forms import (
     NewspaperCreationForm,
     NewspaperFilterForm,
@@ -34,8 +70,8 @@ def delete_newspaper_view(request, pk):
     newspaper = get_object_or_404(Newspaper, pk=pk)
 
     if (
-        request.user.groups.filter(name="Mod").exists()
-        or request.user == newspaper.publishers.first()
+        get_membership(request.user).is_mod
+        or newspaper.has_publisher(request.user)
     ):
         if request.method == "POST":
             newspaper.delete()
@@ -56,34 +92,153 @@ class IndexView(generic.TemplateView):
     template_name = "agency/index.html"
 
 
-class NewspaperListView(generic.ListView):
-    model = Newspaper
-    queryset = Newspaper.objects.select_related("topic")
-    paginate_by = 5
+class AsyncViewMixin:
+    """
+    Makes the view async when ``AGENCY_ASYNC_VIEWS`` is set, as
+    ``config.asgi`` does. Under WSGI the view stays synchronous, since
+    running an async view there costs a new event loop per request.
+    """
 
-    def get_queryset(self) -> QuerySet:
+    @classonlymethod
+    def as_view(cls, **initkwargs):  # noqa: B902, N805
+        initkwargs = {
+            "view_is_async": settings.AGENCY_ASYNC_VIEWS, **initkwargs
+        }
+        view = super().as_view(**initkwargs)
+
+        if initkwargs["view_is_async"]:
+            markcoroutinefunction(view)
+
+        return view
+
+
+class AsyncListMixin(AsyncViewMixin):
+    """
+    Serves ``get`` asynchronously in async mode: the count and the rows of
+    the page come from the async ORM. Building the queryset and the
+    context, which read forms, the topic table and ``request.user``, stays
+    synchronous and runs in a thread.
+    """
+
+    _async_page = None
+
+    def get(self, request, *args, **kwargs):
+        if self.view_is_async:
+            return self.aget(request, *args, **kwargs)
+
+        return super().get(request, *args, **kwargs)
+
+    async def aget(self, request, *args, **kwargs):
+        self.object_list = await sync_to_async(self.get_queryset)()
+        self._async_page = await self.apaginate_queryset(
+            self.object_list, self.get_paginate_by(self.object_list)
+        )
+        context = await sync_to_async(self.get_context_data)()
+
+        return self.render_to_response(context)
+
+    def paginate_queryset(self, queryset: QuerySet, page_size: int) -> tuple:
+        if self._async_page is not None:
+            return self._async_page
+
+        return super().paginate_queryset(queryset, page_size)
+
+
+class AsyncDetailMixin(AsyncViewMixin):
+    """
+    Serves ``get`` asynchronously in async mode, loading the object with
+    ``aget``.
+    """
+
+    def get(self, request, *args, **kwargs):
+        if self.view_is_async:
+            return self.aget(request, *args, **kwargs)
+
+        return super().get(request, *args, **kwargs)
+
+    async def aget(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        context = await sync_to_async(self.get_context_data)(
+            object=self.object
+        )
+
+        return self.render_to_response(context)
+
+    async def aget_object(self):
+        queryset = self.get_queryset()
+
+        try:
+            return await queryset.aget(pk=self.kwargs[self.pk_url_kwarg])
+        except queryset.model.DoesNotExist as error:
+            raise Http404(
+                f"No {queryset.model._meta.verbose_name} found matching "
+                "the query"
+            ) from error
+
+
+class NewspaperFilterMixin:
+    search_query = None
+
+    def filter_newspapers(self, queryset: QuerySet) -> QuerySet:
         filter_form = NewspaperFilterForm(self.request.GET)
         search_form = NewspaperSearchForm(self.request.GET)
+        topic_slug = self.kwargs.get("topic_slug")
+        topic_table = get_topic_table()
+
+        # Newspapers of topics pending deletion are hidden with them.
+        if topic_table.hidden_ids:
+            queryset = queryset.exclude(topic_id__in=topic_table.hidden_ids)
 
-        queryset = Newspaper.objects.all()
+        if topic_slug:
+            topic = topic_table.get_by_slug(topic_slug)
+
+            if topic is None:
+                raise Http404("No topic found matching the query")
+
+            queryset = queryset.filter(topic_id=topic.pk)
 
         if filter_form.is_valid():
-            topic_name = filter_form.cleaned_data.get("topic_name")
+            topic_id = filter_form.cleaned_data.get("topic_name")
 
-            if topic_name:
-                queryset = queryset.filter(topic=topic_name)
+            if topic_id:
+                queryset = queryset.filter(topic_id=topic_id)
 
         if search_form.is_valid():
-            search_query = search_form.cleaned_data.get("search_query")
+            self.search_query = search_form.cleaned_data.get("query_search")
 
-            if search_query:
-                queryset = queryset.filter(
-                    Q(title__icontains=search_query)
-                    | Q(content__icontains=search_query)
-                )
+            if self.search_query:
+                queryset = search_newspapers(queryset, self.search_query)
 
         return queryset
 
+
+@method_decorator(conditional_page(newspaper_list_state), name="dispatch")
+class NewspaperListView(
+    page_cache.CachedPageMixin,
+    AsyncListMixin,
+    CursorPaginationMixin,
+    NewspaperFilterMixin,
+    generic.ListView,
+):
+    model = Newspaper
+    reads_from_replica = True
+    # Rows render the stored excerpt, so the full content stays behind.
+    queryset = Newspaper.objects.select_related("topic").defer("content")
+    paginate_by = 5
+    # Served by newspaper_published_idx; ranked search overrides it.
+    ordering = ("-published_date", "-id")
+    cursor_ordering = ordering
+
+    def uses_cursor_pagination(self) -> bool:
+        # Ranked search results are ordered by relevance, not by the key.
+        return super().uses_cursor_pagination() and not self.search_query
+
+    def get_cache_dependencies(self) -> list:
+        return [page_cache.NEWSPAPER_LIST, page_cache.TOPICS]
+
+    def get_queryset(self) -> QuerySet:
+        return self.filter_newspapers(super().get_queryset())
+
     def get_context_data(self, *, object_list=None, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
         context["filter_form"] = NewspaperFilterForm(self.request.GET)
@@ -92,14 +247,70 @@ class NewspaperListView(generic.ListView):
         return context
 
 
-class NewspaperDetailView(generic.DetailView):
+class NewspaperExportView(
+    LoginRequiredMixin, NewspaperFilterMixin, generic.View
+):
+    chunk_size = 2000
+    content_types = {
+        "csv": "text/csv",
+        "jsonl": "application/x-ndjson",
+    }
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get("format", "csv")
+
+        if export_format not in FORMATS:
+            return HttpResponseBadRequest("Unsupported export format.")
+
+        queryset = self.filter_newspapers(Newspaper.objects.all())
+
+        if not self.search_query:
+            queryset = queryset.order_by("-published_date", "-id")
+
+        records = newspaper_records(queryset, chunk_size=self.chunk_size)
+        lines = (
+            csv_lines(records, "newspaper")
+            if export_format == "csv"
+            else jsonl_lines(records)
+        )
+
+        if isinstance(request, ASGIRequest):
+            # Keeps the export streaming instead of buffered whole.
+            lines = async_lines(lines)
+
+        response = StreamingHttpResponse(
+            lines, content_type=self.content_types[export_format]
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="newspapers.{export_format}"'
+        )
+
+        return response
+
+
+@method_decorator(conditional_page(newspaper_detail_state), name="dispatch")
+class NewspaperDetailView(
+    page_cache.CachedPageMixin, AsyncDetailMixin, generic.DetailView
+):
     model = Newspaper
+    reads_from_replica = True
+    queryset = Newspaper.objects.filter(topic__pending_deletion=False)
+
+    def get_cache_dependencies(self) -> list:
+        return [page_cache.newspaper_key(self.kwargs["pk"]), page_cache.TOPICS]
 
-    def get_context_data(self, **kwargs):
+    def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
-        context["user_in_mod_group"] = self.request.user.groups.filter(
-            name="Mod"
-        ).exists()
+        is_publisher = self.object.has_publisher(self.request.user)
+
+        # Lazy, so a cached publishers fragment skips the query.
+        context["publishers"] = self.object.publishers.filter(
+            pending_deletion=False
+        ).only("username")
+        context["can_edit"] = is_publisher
+        context["can_delete"] = (
+            is_publisher or get_membership(self.request.user).is_mod
+        )
 
         return context
 
@@ -112,28 +323,90 @@ class NewspaperCreateView(LoginRequiredMixin, generic.CreateView):
 
 class NewspaperUpdateView(LoginRequiredMixin, generic.UpdateView):
     model = Newspaper
-    fields = "__all__"
+    form_class = NewspaperCreationForm
     success_url = reverse_lazy("agency:newspaper-list")
 
     def get_queryset(self) -> QuerySet:
         return Newspaper.objects.filter(publishers=self.request.user)
 
 
-class RedactorDetailView(generic.DetailView):
+@method_decorator(conditional_page(redactor_detail_state), name="dispatch")
+class RedactorDetailView(
+    page_cache.CachedPageMixin, AsyncDetailMixin, generic.DetailView
+):
     model = Redactor
-    queryset = Redactor.objects.prefetch_related("newspapers")
+    reads_from_replica = True
+    queryset = Redactor.objects.filter(pending_deletion=False)
+
+    def get_cache_dependencies(self) -> list:
+        return [page_cache.redactor_key(self.kwargs["pk"]), page_cache.TOPICS]
 
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+
+        # Lazy, so a cached publications fragment skips the query.
+        context["publications"] = self.object.newspapers.select_related(
+            "topic"
+        ).only("id", "title", "topic__name")
+
+        return context
 
-class RedactorListView(generic.ListView):
+
+class PopularitySortMixin:
+    """
+    ``?sort=popular`` orders by the denormalized article counter, which
+    has an index of its own, instead of the default ordering.
+    """
+
+    popularity_ordering = None
+
+    def sorts_by_popularity(self) -> bool:
+        return self.request.GET.get("sort") == "popular"
+
+    def get_ordering(self):
+        if self.sorts_by_popularity():
+            return self.popularity_ordering
+
+        return super().get_ordering()
+
+    def get_cursor_ordering(self):
+        if self.sorts_by_popularity():
+            return self.popularity_ordering
+
+        return super().get_cursor_ordering()
+
+
+@method_decorator(conditional_page(redactor_list_state), name="dispatch")
+class RedactorListView(
+    page_cache.CachedPageMixin,
+    PopularitySortMixin,
+    AsyncListMixin,
+    CursorPaginationMixin,
+    generic.ListView,
+):
     model = Redactor
+    reads_from_replica = True
+    queryset = Redactor.objects.filter(pending_deletion=False)
     paginate_by = 5
+    ordering = ("username", "id")
+    cursor_ordering = ordering
+    popularity_ordering = ("-publication_count", "id")
+
+    def get_cache_dependencies(self) -> list:
+        return [page_cache.REDACTOR_LIST]
 
     def get_queryset(self) -> QuerySet:
         form = RedactorSearchForm(self.request.GET)
-        queryset = Redactor.objects.all()
+        queryset = super().get_queryset()
 
         if form.is_valid():
             search_value = form.cleaned_data.get("search_query")
+            min_publications = form.cleaned_data.get("min_publications")
+
+            if min_publications:
+                queryset = queryset.filter(
+                    publication_count__gte=min_publications
+                )
 
             return queryset.filter(
                 (
@@ -147,13 +420,35 @@ class RedactorListView(generic.ListView):
     def get_context_data(self, *, object_list=None, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
         context["form"] = RedactorSearchForm(self.request.GET)
-        context["user_in_admin_group"] = self.request.user.groups.filter(
-            name="Admin"
-        ).exists()
 
         return context
 
 
+class RedactorAutocompleteView(LoginRequiredMixin, generic.View):
+    """
+    Usernames starting with ``q``, for the publishers widget. A
+    case-sensitive prefix match can use the username index.
+    """
+
+    limit = 20
+
+    def get(self, request, *args, **kwargs):
+        prefix = request.GET.get("q", "").strip()
+        results = []
+
+        if prefix:
+            results = [
+                {"id": pk, "text": username}
+                for pk, username in Redactor.objects.filter(
+                    username__startswith=prefix, pending_deletion=False
+                )
+                .order_by("username")
+                .values_list("pk", "username")[: self.limit]
+            ]
+
+        return JsonResponse({"results": results})
+
+
 class RedactorRegisterView(generic.CreateView):
     form_class = RedactorRegisterForm
     template_name = "registration/sign_up.html"
@@ -171,24 +466,60 @@ class RedactorUpdateView(LoginRequiredMixin, generic.UpdateView):
         return Redactor.objects.filter(id=self.request.user.id)
 
 
-class RedactorDeleteView(PermissionRequiredMixin, generic.DeleteView):
+class ScheduledDeletionMixin:
+    """
+    Hides the object at once and leaves removing it and its dependents to
+    ``run_deletion_jobs``, instead of cascading inside the request.
+    """
+
+    def form_valid(self, form):
+        schedule_deletion(self.object)
+
+        return HttpResponseRedirect(self.get_success_url())
+
+
+class RedactorDeleteView(
+    PermissionRequiredMixin, ScheduledDeletionMixin, generic.DeleteView
+):
     model = get_user_model()
-    queryset = get_user_model().objects.all()
+    queryset = get_user_model().objects.filter(pending_deletion=False)
     success_url = reverse_lazy("agency:redactor-list")
 
     permission_required = "agency.delete_redactor"
 
 
-class TopicListView(generic.ListView):
+@method_decorator(conditional_page(topic_list_state), name="dispatch")
+class TopicListView(
+    page_cache.CachedPageMixin,
+    PopularitySortMixin,
+    AsyncListMixin,
+    CursorPaginationMixin,
+    generic.ListView,
+):
     model = Topic
+    reads_from_replica = True
+    queryset = Topic.objects.filter(pending_deletion=False)
     paginate_by = 5
+    ordering = ("name", "id")
+    cursor_ordering = ordering
+    popularity_ordering = ("-newspaper_count", "id")
+
+    def get_cache_dependencies(self) -> list:
+        return [page_cache.TOPICS, page_cache.TOPIC_COUNTS]
 
     def get_queryset(self) -> QuerySet:
         form = TopicSearchForm(self.request.GET)
-        queryset = Topic.objects.all()
+        queryset = super().get_queryset()
 
         if form.is_valid():
             topic_name = form.cleaned_data.get("topic_name")
+            min_newspapers = form.cleaned_data.get("min_newspapers")
+
+            if min_newspapers:
+                queryset = queryset.filter(
+                    newspaper_count__gte=min_newspapers
+                )
+
             return queryset.filter(name__icontains=topic_name)
 
         return queryset
@@ -197,9 +528,6 @@ class TopicListView(generic.ListView):
         context = super().get_context_data(**kwargs)
 
         context["form"] = TopicSearchForm(self.request.GET)
-        context["user_in_mod_group"] = self.request.user.groups.filter(
-            name="Mod"
-        ).exists()
 
         return context
 
@@ -220,9 +548,63 @@ class TopicUpdateView(PermissionRequiredMixin, generic.UpdateView):
     permission_required = "agency.change_topic"
 
 
-class TopicDeleteView(PermissionRequiredMixin, generic.DeleteView):
+class TopicDeleteView(
+    PermissionRequiredMixin, ScheduledDeletionMixin, generic.DeleteView
+):
     model = Topic
+    queryset = Topic.objects.filter(pending_deletion=False)
     fields = "__all__"
     success_url = reverse_lazy("agency:topic-list")
 
     permission_required = "agency.delete_topic"
+
+
+@staff_member_required
+def profiling_stats_view(request):
+    if not settings.AGENCY_PROFILING:
+        raise Http404("Profiling is disabled.")
+
+    views = []
+
+    for view, profile in store.snapshot().items():
+        wall = profile.quantiles("wall")
+        views.append(
+            {
+                "name": view,
+                "count": profile.count,
+                "wall_ms": [value * 1000 for value in wall.values()],
+                "sql_ms": profile.quantiles("sql")[0.5] * 1000,
+                "render_ms": profile.quantiles("render")[0.5] * 1000,
+                "python_ms": profile.quantiles("python")[0.5] * 1000,
+                "queries": profile.quantiles("queries"),
+                "duplicates": profile.totals["duplicates"],
+                "similar": profile.totals["similar"],
+            }
+        )
+
+    return render(
+        request=request,
+        template_name="agency/profiling_stats.html",
+        context={"views": views},
+    )
+
+
+def profiling_metrics_view(request):
+    if not settings.AGENCY_PROFILING:
+        raise Http404("Profiling is disabled.")
+
+    token = settings.AGENCY_PROFILING_METRICS_TOKEN
+    authorized = request.user.is_staff or (
+        token
+        and constant_time_compare(
+            request.headers.get("Authorization", ""), f"Bearer {token}"
+        )
+    )
+
+    if not authorized:
+        return HttpResponseForbidden()
+
+    return HttpResponse(
+        prometheus_metrics(store.snapshot()),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+
+
+def warm_templates() -> list:
+    """
+    Compile every template in the ``DIRS`` of the Django template engines,
+    so that with the cached loader the first request to each page does not
+    pay for parsing. Returns the names of the compiled templates.
+    """
+    names = []
+
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+
+        for directory in map(Path, engine.engine.dirs):
+            for path in sorted(directory.rglob("*")):
+                if path.is_file():
+                    name = path.relative_to(directory).as_posix()
+                    engine.get_template(name)
+                    names.append(name)
+
+    return names
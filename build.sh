@@ -4,5 +4,6 @@ set -o errexit
 
 pip install -r requirements.txt
 
-python manage.py collectstatic --no-input
+# The production storage writes the manifest the app looks files up in.
+DJANGO_DEBUG=False python manage.py collectstatic --no-input
 python manage.py migrate
\ No newline at end of file
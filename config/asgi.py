@@ -1,5 +1,5 @@
 """
-ASGI config for NewspaperAgency project.
+ASGI config for the newspaper agency project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
@@ -9,8 +9,17 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "NewspaperAgency.settings")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+# Serve the read views from the async ORM; see agency.views.
+os.environ.setdefault("DJANGO_ASYNC_VIEWS", "True")
 
 application = get_asgi_application()
+
+if not settings.DEBUG:
+    # Compile templates before the first request; see agency.warmup.
+    from agency.warmup import warm_templates
+
+    warm_templates()
@@ -0,0 +1,56 @@
+POSTGRESQL_ENGINE = "django.db.backends.postgresql"
+POOLED_POSTGRESQL_ENGINE = "config.db.pooled_postgresql"
+
+
+def tune_database(
+    database: dict,
+    *,
+    conn_max_age: int = 500,
+    health_checks: bool = True,
+    statement_timeout: int = 0,
+    pool: bool = False,
+    pool_size: int = 10,
+    pool_timeout: float = 10.0,
+) -> dict:
+    """
+    A copy of the ``DATABASES`` entry ``database`` with its connection
+    handling configured. Statement timeouts (in milliseconds) and pooling
+    apply to PostgreSQL only. A pooled connection goes back to the pool at
+    the end of every request, so ``conn_max_age`` is ignored then.
+    """
+    database = {
+        **database,
+        "CONN_MAX_AGE": conn_max_age,
+        "CONN_HEALTH_CHECKS": health_checks,
+    }
+
+    if database["ENGINE"] not in (
+        POSTGRESQL_ENGINE,
+        POOLED_POSTGRESQL_ENGINE,
+    ):
+        return database
+
+    options = dict(database.get("OPTIONS", {}))
+
+    if statement_timeout:
+        options["options"] = " ".join(
+            filter(
+                None,
+                [
+                    options.get("options"),
+                    f"-c statement_timeout={statement_timeout}",
+                ],
+            )
+        )
+
+    database["OPTIONS"] = options
+
+    if pool:
+        database["ENGINE"] = POOLED_POSTGRESQL_ENGINE
+        database["CONN_MAX_AGE"] = 0
+        database["POOL"] = {"MAX_SIZE": pool_size, "TIMEOUT": pool_timeout}
+    else:
+        database["ENGINE"] = POSTGRESQL_ENGINE
+        database.pop("POOL", None)
+
+    return database
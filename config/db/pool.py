@@ -0,0 +1,87 @@
+import queue
+import threading
+
+from django.db import DatabaseError
+
+
+class PoolTimeout(DatabaseError):
+    pass
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of at most ``max_size`` open DB-API connections.
+    ``acquire`` waits up to ``timeout`` seconds for a free slot and hands
+    out the most recently released idle connection, or opens a new one.
+    """
+
+    def __init__(self, max_size: int, timeout: float) -> None:
+        self.max_size = max_size
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self.stats = {"opened": 0, "reused": 0, "discarded": 0}
+
+    def _count(self, event: str) -> None:
+        with self._lock:
+            self.stats[event] += 1
+
+    def _discard(self, connection) -> None:
+        self._count("discarded")
+
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def acquire(self, connect, check=None):
+        """
+        An idle connection that passes ``check``, if given, or a new one
+        from ``connect()``.
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeout(
+                f"No database connection was released within "
+                f"{self.timeout} seconds (pool size {self.max_size})."
+            )
+
+        try:
+            while True:
+                try:
+                    connection = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+
+                if check is None or check(connection):
+                    self._count("reused")
+                    return connection
+
+                self._discard(connection)
+
+            connection = connect()
+            self._count("opened")
+
+            return connection
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection, reusable: bool = True) -> None:
+        try:
+            if reusable:
+                self._idle.put(connection)
+            else:
+                self._discard(connection)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close the idle connections; checked out ones are unaffected."""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return
+
+            self._discard(connection)
@@ -0,0 +1,110 @@
+import threading
+from functools import partial
+
+from django.db.backends.postgresql import base, creation
+
+from config.db.pool import ConnectionPool
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def pool_stats() -> dict:
+    """Connection events summed over every pool of this process."""
+    totals = {"opened": 0, "reused": 0, "discarded": 0}
+
+    with _pools_lock:
+        for pool in _pools.values():
+            for event, count in pool.stats.items():
+                totals[event] += count
+
+    return totals
+
+
+def close_pools() -> None:
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+
+        _pools.clear()
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # Idle pooled connections to the test database, which closing the
+        # connection only hands back, would make DROP DATABASE fail.
+        close_pools()
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL backend whose connections come from a per-process pool
+    shared by all threads, sized by ``POOL["MAX_SIZE"]``, instead of one
+    connection per thread. Closing a connection hands it back to the pool.
+    """
+
+    creation_class = DatabaseCreation
+
+    def get_pool(self, conn_params: dict) -> ConnectionPool:
+        # One pool per server, database and role, so e.g. the connections
+        # to the maintenance database used for test setup stay apart.
+        key = repr(sorted(conn_params.items()))
+        options = self.settings_dict.get("POOL", {})
+
+        with _pools_lock:
+            if key not in _pools:
+                _pools[key] = ConnectionPool(
+                    max_size=options.get("MAX_SIZE", 10),
+                    timeout=options.get("TIMEOUT", 10.0),
+                )
+
+            return _pools[key]
+
+    def get_new_connection(self, conn_params):
+        self.pool = self.get_pool(conn_params)
+
+        return self.pool.acquire(
+            partial(super().get_new_connection, conn_params),
+            check=(
+                self._is_reusable
+                if self.settings_dict["CONN_HEALTH_CHECKS"]
+                else None
+            ),
+        )
+
+    @staticmethod
+    def _is_reusable(connection) -> bool:
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+
+            if not connection.autocommit:
+                connection.rollback()
+        except base.Database.Error:
+            return False
+
+        return True
+
+    def _close(self):
+        if self.connection is None:
+            return
+
+        connection = self.connection
+
+        # close() keeps the connection attached inside atomic blocks, so
+        # it must not be handed to another thread.
+        if self.in_atomic_block:
+            self.pool.release(connection, reusable=False)
+            return
+
+        try:
+            if (
+                connection.get_transaction_status()
+                != base.Database.extensions.TRANSACTION_STATUS_IDLE
+            ):
+                connection.rollback()
+        except base.Database.Error:
+            self.pool.release(connection, reusable=False)
+        else:
+            self.pool.release(connection, reusable=not connection.closed)
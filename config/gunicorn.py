@@ -0,0 +1,85 @@
+"""
+Gunicorn configuration for production:
+
+    gunicorn -c config/gunicorn.py
+
+The application is imported once in the master and then forked, so
+settings, the URLconf and the compiled templates are shared copy-on-write
+by all workers. Every variable below can be overridden with the
+``GUNICORN_*`` environment variable of the same name.
+"""
+
+import gc
+import os
+
+
+def _cpu_count() -> int:
+    # The CPUs this process may run on, which containers often limit.
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+wsgi_app = os.environ.get("GUNICORN_WSGI_APP", "config.wsgi:application")
+bind = os.environ.get(
+    "GUNICORN_BIND", f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+)
+preload_app = os.environ.get("GUNICORN_PRELOAD_APP", "True") == "True"
+
+# Threaded workers: requests mostly wait on the database, so a few threads
+# per process serve more of them than extra processes would, for less
+# memory. Each thread may hold its own database connection. For ASGI, set
+# GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker and
+# GUNICORN_WSGI_APP=config.asgi:application.
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+workers = int(os.environ.get("GUNICORN_WORKERS", max(_cpu_count(), 2)))
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+
+# Restart each worker after roughly this many requests to bound memory
+# growth; the jitter keeps workers from restarting all at once.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(
+    os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", max_requests // 10)
+)
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+
+# Worker heartbeats go to a file; keep it off disks that can stall.
+worker_tmp_dir = os.environ.get(
+    "GUNICORN_WORKER_TMP_DIR",
+    "/dev/shm" if os.path.isdir("/dev/shm") else None,
+)
+
+accesslog = os.environ.get("GUNICORN_ACCESSLOG", "-")
+
+
+def pre_fork(server, worker) -> None:
+    from django.conf import settings
+
+    # Without preload_app the master never sets up Django.
+    if not server.cfg.preload_app or not settings.configured:
+        return
+
+    # Workers must open their own database and cache connections.
+    from django.core.cache import caches
+    from django.db import connections
+
+    from config.db import POOLED_POSTGRESQL_ENGINE
+
+    connections.close_all()
+    caches.close_all()
+
+    if any(
+        database["ENGINE"] == POOLED_POSTGRESQL_ENGINE
+        for database in connections.settings.values()
+    ):
+        from config.db.pooled_postgresql.base import close_pools
+
+        close_pools()
+
+    # Objects loaded by the master are never collected in the workers, so
+    # the collector does not write to, and copy, the pages they live on.
+    gc.freeze()
@@ -0,0 +1,23 @@
+from django.http import HttpResponse
+
+HEALTH_PATH = "/healthz/"
+
+
+class HealthCheckMiddleware:
+    """
+    Answers ``HEALTH_PATH`` before any other middleware runs, so load
+    balancer probes get a 200 from every live worker without a host check,
+    a session, a database query or a cache lookup.
+    """
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path == HEALTH_PATH:
+            response = HttpResponse("ok", content_type="text/plain")
+            response["Cache-Control"] = "no-store"
+
+            return response
+
+        return self.get_response(request)
@@ -0,0 +1,208 @@
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, OperationalError
+from django.db import connections
+
+# Set on responses to requests that wrote, so the writer's next reads
+# see their own changes instead of a lagging replica.
+PIN_COOKIE = "agency_primary"
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+class RoutingState:
+    """What the router knows about the request being served."""
+
+    def __init__(self, pinned: bool = False) -> None:
+        self.pinned = pinned
+        self.replica_reads = False
+        self.wrote = False
+        self.replica = None
+
+
+_state = ContextVar("agency_routing_state", default=None)
+
+
+class ReplicaHealth:
+    """
+    Per-process record of which replicas answer, refreshed at most every
+    ``AGENCY_REPLICA_HEALTH_INTERVAL`` seconds per replica, so a failed
+    replica is skipped until it answers again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._checks = {}
+
+    def is_healthy(self, alias: str) -> bool:
+        now = time.monotonic()
+
+        with self._lock:
+            check = self._checks.get(alias)
+
+        if check is not None and (
+            now - check[1] < settings.AGENCY_REPLICA_HEALTH_INTERVAL
+        ):
+            return check[0]
+
+        healthy = self._ping(alias)
+
+        with self._lock:
+            self._checks[alias] = (healthy, now)
+
+        return healthy
+
+    def mark_unhealthy(self, alias: str) -> None:
+        with self._lock:
+            self._checks[alias] = (False, time.monotonic())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._checks.clear()
+
+    @staticmethod
+    def _ping(alias: str) -> bool:
+        connection = connections[alias]
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except DatabaseError:
+            connection.close()
+            return False
+
+        return True
+
+
+health = ReplicaHealth()
+
+
+def _healthy_replica() -> Optional[str]:
+    replicas = list(settings.AGENCY_DATABASE_REPLICAS)
+    random.shuffle(replicas)
+
+    for alias in replicas:
+        if health.is_healthy(alias):
+            return alias
+
+    return None
+
+
+class ReplicaRouter:
+    """
+    Sends the reads of views marked ``reads_from_replica`` to one healthy
+    replica per request and everything else to the primary. Requests that
+    write, and the writer's requests for ``AGENCY_PRIMARY_PIN_SECONDS``
+    afterwards, read from the primary too.
+    """
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        state = _state.get()
+
+        if (
+            state is None
+            or not state.replica_reads
+            or state.pinned
+            or state.wrote
+        ):
+            return None
+
+        if state.replica is None:
+            state.replica = _healthy_replica() or DEFAULT_DB_ALIAS
+
+        return state.replica
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        state = _state.get()
+
+        if state is not None:
+            state.wrote = True
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        aliases = {DEFAULT_DB_ALIAS, *settings.AGENCY_DATABASE_REPLICAS}
+
+        if {obj1._state.db, obj2._state.db} <= aliases:
+            return True
+
+        return None
+
+    def allow_migrate(self, db, app_label, **hints) -> Optional[bool]:
+        # Replicas get their schema from the primary.
+        if db in settings.AGENCY_DATABASE_REPLICAS:
+            return False
+
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Tracks the routing state of each request: marks safe requests to views
+    with ``reads_from_replica`` for replica reads, pins readers who wrote
+    recently to the primary and fails over when a replica errors.
+    """
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = RoutingState(pinned=PIN_COOKIE in request.COOKIES)
+        token = _state.set(state)
+
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+
+        if state.wrote:
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=settings.AGENCY_PRIMARY_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "view_class", None)
+
+        if request.method in SAFE_METHODS and getattr(
+            view_class, "reads_from_replica", False
+        ):
+            _state.get().replica_reads = True
+
+    def process_exception(self, request, exception):
+        state = _state.get()
+
+        if not isinstance(exception, OperationalError) or state.replica in (
+            None,
+            DEFAULT_DB_ALIAS,
+        ):
+            return None
+
+        health.mark_unhealthy(state.replica)
+
+        # Answer the read from the primary instead of failing the request;
+        # an error there as well is left to propagate.
+        state.replica = DEFAULT_DB_ALIAS
+        match = request.resolver_match
+        view = match.func
+
+        if iscoroutinefunction(view):
+            view = async_to_sync(view)
+
+        response = view(request, *match.args, **match.kwargs)
+
+        if callable(getattr(response, "render", None)):
+            response = response.render()
+
+        return response
@@ -13,6 +13,10 @@ import os
 import dj_database_url
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
+from config.db import tune_database
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = os.environ["DJANGO_SECRET_KEY"]
@@ -35,6 +39,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "config.health.HealthCheckMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -43,6 +48,8 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "config.routers.ReplicaRoutingMiddleware",
+    "agency.profiling.ProfilingMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -58,6 +65,7 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "agency.context_processors.membership",
             ],
         },
     },
@@ -72,9 +80,106 @@ DATABASES = {
     }
 }
 
-db_from_env = dj_database_url.config(conn_max_age=500)
+db_from_env = dj_database_url.config()
 DATABASES["default"].update(db_from_env)
 
+# Comma-separated URLs of read replicas of the default database.
+AGENCY_DATABASE_REPLICAS = []
+
+for number, url in enumerate(
+    filter(None, os.environ.get("DJANGO_REPLICA_URLS", "").split(",")),
+    start=1,
+):
+    alias = f"replica{number}"
+    DATABASES[alias] = dj_database_url.parse(url.strip())
+    # Tests read the replicas through the test database.
+    DATABASES[alias]["TEST"] = {"MIRROR": "default"}
+    AGENCY_DATABASE_REPLICAS.append(alias)
+
+# Connection handling of every database, see config.db.tune_database.
+AGENCY_DATABASE_CONNECTIONS = {
+    "conn_max_age": int(os.environ.get("DJANGO_DB_CONN_MAX_AGE", 500)),
+    "health_checks": (
+        os.environ.get("DJANGO_DB_HEALTH_CHECKS", "True") == "True"
+    ),
+    "statement_timeout": int(
+        os.environ.get("DJANGO_DB_STATEMENT_TIMEOUT", 0)
+    ),
+    "pool": os.environ.get("DJANGO_DB_POOL", "") == "True",
+    "pool_size": int(os.environ.get("DJANGO_DB_POOL_SIZE", 10)),
+    "pool_timeout": float(os.environ.get("DJANGO_DB_POOL_TIMEOUT", 10)),
+}
+
+for alias, database in DATABASES.items():
+    DATABASES[alias] = tune_database(
+        database, **AGENCY_DATABASE_CONNECTIONS
+    )
+
+DATABASE_ROUTERS = ["config.routers.ReplicaRouter"]
+
+# Only the file cache is shared by the workers of a host.
+SHARED_CACHE = os.environ.get("DJANGO_CACHE_BACKEND") == "file"
+
+if SHARED_CACHE:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": os.environ.get(
+                "DJANGO_CACHE_LOCATION", BASE_DIR / ".cache"
+            ),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "newspaper-agency",
+        }
+    }
+
+AUTHENTICATION_BACKENDS = [
+    "agency.membership.MembershipBackend",
+]
+
+
+def shared_cache_timeout(env_name: str, default: int) -> int:
+    """
+    Seconds from the environment variable ``env_name`` to cache entries
+    that writes invalidate. Only a shared cache carries the invalidation to
+    every worker, so without one the default is 0 and any other value is
+    refused.
+    """
+    timeout = int(os.environ.get(env_name, default if SHARED_CACHE else 0))
+
+    if timeout and not SHARED_CACHE:
+        raise ImproperlyConfigured(
+            f"{env_name}={timeout} needs a cache shared by all workers, "
+            "DJANGO_CACHE_BACKEND=file."
+        )
+
+    return timeout
+
+
+# "cached_db" reads sessions from the cache and writes them through to the
+# database; "cache" keeps them in the cache only, which then also has to be
+# persistent. Both need a cache shared by all workers: with a cache per
+# process, a session ended in one worker still authenticates in the others.
+SESSION_STORE = os.environ.get(
+    "DJANGO_SESSION_STORE", "cached_db" if SHARED_CACHE else "db"
+)
+
+if SESSION_STORE != "db" and not SHARED_CACHE:
+    raise ImproperlyConfigured(
+        f"DJANGO_SESSION_STORE={SESSION_STORE} needs a cache shared by all "
+        "workers, DJANGO_CACHE_BACKEND=file."
+    )
+
+SESSION_ENGINE = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "cache": "django.contrib.sessions.backends.cache",
+}[SESSION_STORE]
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth."
@@ -109,6 +214,22 @@ STATICFILES_DIRS = [
     BASE_DIR / "static",
 ]
 
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+
+if not DEBUG:
+    # collectstatic writes content-hashed copies, which WhiteNoise serves
+    # with far-future cache headers, plus gzip and brotli variants.
+    STORAGES["staticfiles"]["BACKEND"] = (
+        "whitenoise.storage.CompressedManifestStaticFilesStorage"
+    )
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 AUTH_USER_MODEL = "agency.Redactor"
@@ -116,3 +237,44 @@ AUTH_USER_MODEL = "agency.Redactor"
 LOGIN_REDIRECT_URL = "/"
 
 CRISPY_TEMPLATE_PACK = "bootstrap4"
+
+AGENCY_MEMBERSHIP_CACHE_TIMEOUT = shared_cache_timeout(
+    "DJANGO_MEMBERSHIP_CACHE_TIMEOUT", 0
+)
+
+AGENCY_USER_CACHE_TIMEOUT = shared_cache_timeout(
+    "DJANGO_USER_CACHE_TIMEOUT", 0
+)
+
+AGENCY_PAGE_CACHE_TIMEOUT = shared_cache_timeout(
+    "DJANGO_PAGE_CACHE_TIMEOUT", 300
+)
+
+AGENCY_TOPIC_TABLE_TIMEOUT = int(
+    os.environ.get("DJANGO_TOPIC_TABLE_TIMEOUT", 30)
+)
+
+# Set by config.asgi: serve the read views as async views.
+AGENCY_ASYNC_VIEWS = os.environ.get("DJANGO_ASYNC_VIEWS", "") == "True"
+
+AGENCY_CURSOR_PAGINATION = (
+    os.environ.get("DJANGO_CURSOR_PAGINATION", "") == "True"
+)
+
+AGENCY_PRIMARY_PIN_SECONDS = int(
+    os.environ.get("DJANGO_PRIMARY_PIN_SECONDS", 10)
+)
+
+AGENCY_REPLICA_HEALTH_INTERVAL = int(
+    os.environ.get("DJANGO_REPLICA_HEALTH_INTERVAL", 30)
+)
+
+AGENCY_PROFILING = os.environ.get("DJANGO_PROFILING", "") == "True"
+
+AGENCY_PROFILING_WINDOW = int(
+    os.environ.get("DJANGO_PROFILING_WINDOW", 1000)
+)
+
+AGENCY_PROFILING_METRICS_TOKEN = os.environ.get(
+    "DJANGO_PROFILING_METRICS_TOKEN", ""
+)
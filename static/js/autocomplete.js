@@ -0,0 +1,70 @@
+// Publisher picker for <select multiple data-autocomplete>: the select only
+// holds the chosen options, matches are fetched as the user types.
+document.addEventListener("DOMContentLoaded", function () {
+  document.querySelectorAll("select[data-autocomplete]").forEach(function (select) {
+    var input = document.createElement("input");
+    var list = document.createElement("ul");
+    var pending = null;
+
+    input.type = "text";
+    input.className = "form-control mb-1";
+    input.placeholder = "Type a username...";
+    input.setAttribute("autocomplete", "off");
+    list.className = "list-group mb-2";
+    select.parentNode.insertBefore(input, select);
+    select.parentNode.insertBefore(list, select);
+
+    function add(result) {
+      var option = Array.prototype.find.call(select.options, function (item) {
+        return item.value === String(result.id);
+      });
+
+      if (!option) {
+        option = new Option(result.text, result.id);
+        select.add(option);
+      }
+      option.selected = true;
+      list.innerHTML = "";
+      input.value = "";
+    }
+
+    function show(results) {
+      list.innerHTML = "";
+      results.forEach(function (result) {
+        var item = document.createElement("li");
+
+        item.className = "list-group-item list-group-item-action";
+        item.textContent = result.text;
+        item.addEventListener("click", function () {
+          add(result);
+        });
+        list.appendChild(item);
+      });
+    }
+
+    input.addEventListener("input", function () {
+      var query = input.value.trim();
+
+      if (pending) {
+        pending.abort();
+      }
+      if (!query) {
+        show([]);
+        return;
+      }
+
+      pending = new AbortController();
+      fetch(select.dataset.autocompleteUrl + "?q=" + encodeURIComponent(query), {
+        signal: pending.signal,
+        headers: {"Accept": "application/json"},
+      })
+        .then(function (response) {
+          return response.json();
+        })
+        .then(function (data) {
+          show(data.results);
+        })
+        .catch(function () {});
+    });
+  });
+});